@@ -0,0 +1,119 @@
+"""
+Compare how the WSGI and ASGI entry points cope with slow clients.
+
+Both servers are started with the same number of gunicorn worker processes,
+which fixes the memory budget (the resident memory of each server is measured
+and reported). While a number of slow clients trickle their request headers
+one byte at a time, fast clients hammer a read-only endpoint and their
+throughput and latency percentiles are recorded.
+
+Example::
+
+    $ DJANGO_SETTINGS_MODULE=config.settings.production \\
+        python benchmarks/asgi_concurrency.py --token <api token> \\
+        --path /api/v1/profiles/ --workers 2 --slow-clients 50
+
+"""
+import argparse
+import socket
+import threading
+import time
+from typing import Dict, List
+
+from common import (
+    http_get,
+    process_tree_rss,
+    run_load,
+    start_server,
+    stop_server,
+    write_results,
+)
+
+SERVERS = {
+    "wsgi": ["gunicorn", "config.wsgi"],
+    "asgi": [
+        "gunicorn",
+        "config.asgi:application",
+        "--worker-class",
+        "uvicorn.workers.UvicornWorker",
+    ],
+}
+
+
+def slow_client(port: int, path: str, interval: float, stop: threading.Event):
+    """Send a request's headers one byte every interval seconds."""
+    try:
+        connection = socket.create_connection(("127.0.0.1", port))
+    except socket.error:
+        return
+    request = "GET {} HTTP/1.1\r\nHost: localhost\r\n".format(path).encode()
+    try:
+        for byte in request:
+            if stop.is_set():
+                break
+            connection.send(bytes([byte]))
+            time.sleep(interval)
+        while not stop.wait(interval):
+            connection.send(b"X-Slow: 1\r\n")
+    except socket.error:
+        pass
+    finally:
+        connection.close()
+
+
+def measure(server: str, args: argparse.Namespace) -> Dict:
+    command = SERVERS[server] + [
+        "--bind",
+        "127.0.0.1:{}".format(args.port),
+        "--workers",
+        str(args.workers),
+    ]
+    process = start_server(command, args.port)
+    url = "http://127.0.0.1:{}{}".format(args.port, args.path)
+    headers = {"Authorization": "Token {}".format(args.token)}
+    stop = threading.Event()
+    slow_clients = []  # type: List[threading.Thread]
+    try:
+        # Warm up every worker before measuring.
+        run_load(lambda: http_get(url, headers), args.workers, 2)
+        for _ in range(args.slow_clients):
+            thread = threading.Thread(
+                target=slow_client,
+                args=(args.port, args.path, args.slow_interval, stop),
+            )
+            thread.start()
+            slow_clients.append(thread)
+        time.sleep(args.slow_interval * 2)
+        result = run_load(
+            lambda: http_get(url, headers), args.concurrency, args.duration
+        )
+        result["rss_bytes"] = process_tree_rss(process.pid)
+    finally:
+        stop.set()
+        for thread in slow_clients:
+            thread.join()
+        stop_server(process)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--path", default="/api/v1/profiles/")
+    parser.add_argument("--token", required=True)
+    parser.add_argument("--port", type=int, default=5050)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--slow-clients", type=int, default=50)
+    parser.add_argument("--slow-interval", type=float, default=1.0)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--duration", type=float, default=20)
+    parser.add_argument("--output", help="File to write JSON results to.")
+    args = parser.parse_args()
+
+    write_results(
+        args.output,
+        {server: measure(server, args) for server in ("wsgi", "asgi")},
+    )
+
+
+if __name__ == "__main__":
+    main()
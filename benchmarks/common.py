@@ -0,0 +1,131 @@
+"""
+Helpers shared by the benchmark scripts.
+
+The scripts only use the standard library so that they can be run from any
+machine that can reach the server being measured.
+"""
+import json
+import os
+import socket
+import subprocess
+import threading
+import time
+import urllib.error
+import urllib.request
+from typing import Callable, Dict, List, Optional, Sequence
+
+ROOT_DIR_PATH = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+
+
+def percentile(values: Sequence[float], pct: float) -> float:
+    """Return the pct percentile of values using nearest-rank."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(int(round(pct / 100.0 * len(ordered) + 0.5)) - 1, 0)
+    return ordered[min(rank, len(ordered) - 1)]
+
+
+def summarize(latencies: Sequence[float], errors: int, elapsed: float) -> Dict:
+    """Summarize request latencies (in seconds) as milliseconds."""
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "throughput": round(len(latencies) / elapsed, 2) if elapsed else 0,
+        "p50_ms": round(percentile(latencies, 50) * 1000, 2),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 2),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 2),
+        "max_ms": round(max(latencies) * 1000, 2) if latencies else 0,
+    }
+
+
+def http_get(url: str, headers: Optional[Dict[str, str]] = None) -> bytes:
+    request = urllib.request.Request(url, headers=headers or {})
+    with urllib.request.urlopen(request, timeout=30) as response:
+        return response.read()
+
+
+def run_load(
+    request: Callable[[], object], concurrency: int, duration: float
+) -> Dict:
+    """Call request from concurrency threads for duration seconds."""
+    latencies = []  # type: List[float]
+    errors = [0]
+    lock = threading.Lock()
+    deadline = time.monotonic() + duration
+
+    def worker():
+        while time.monotonic() < deadline:
+            start = time.monotonic()
+            try:
+                request()
+            except (urllib.error.URLError, socket.error):
+                with lock:
+                    errors[0] += 1
+                continue
+            with lock:
+                latencies.append(time.monotonic() - start)
+
+    threads = [threading.Thread(target=worker) for _ in range(concurrency)]
+    started = time.monotonic()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return summarize(latencies, errors[0], time.monotonic() - started)
+
+
+def wait_for_port(host: str, port: int, timeout: float = 60) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection((host, port), timeout=1).close()
+            return
+        except socket.error:
+            time.sleep(0.2)
+    raise RuntimeError("Server did not start listening on port %s" % port)
+
+
+def start_server(command: Sequence[str], port: int) -> subprocess.Popen:
+    process = subprocess.Popen(command, cwd=ROOT_DIR_PATH)
+    try:
+        wait_for_port("127.0.0.1", port)
+    except RuntimeError:
+        process.kill()
+        raise
+    return process
+
+
+def stop_server(process: subprocess.Popen) -> None:
+    process.terminate()
+    try:
+        process.wait(timeout=30)
+    except subprocess.TimeoutExpired:
+        process.kill()
+
+
+def process_tree_rss(pid: int) -> int:
+    """Return the resident memory, in bytes, of pid and its children."""
+    pids = [pid]
+    try:
+        with open("/proc/%s/task/%s/children" % (pid, pid)) as children:
+            pids += [int(child) for child in children.read().split()]
+    except IOError:
+        pass
+    total = 0
+    for process_id in pids:
+        try:
+            with open("/proc/%s/status" % process_id) as status:
+                for line in status:
+                    if line.startswith("VmRSS:"):
+                        total += int(line.split()[1]) * 1024
+        except IOError:
+            continue
+    return total
+
+
+def write_results(path: Optional[str], results: Dict) -> None:
+    print(json.dumps(results, indent=2))
+    if path:
+        with open(path, "w") as results_file:
+            json.dump(results, results_file, indent=2)
@@ -0,0 +1,81 @@
+"""
+Compare gunicorn's default worker setup with the tuned profile.
+
+The default setup is a single sync worker, which is what a bare
+``gunicorn config.wsgi`` runs. The tuned setup uses config/gunicorn.py,
+whose worker class and worker and thread counts follow the container's CPU
+and memory limits. Both are loaded with the same concurrent clients and their
+throughput and latency percentiles are recorded.
+
+Example::
+
+    $ DJANGO_SETTINGS_MODULE=config.settings.production \\
+        python benchmarks/gunicorn_workers.py --token <api token> \\
+        --path /api/v2/organization-users/?organization_id=1
+
+"""
+import argparse
+import json
+import subprocess
+import sys
+from typing import Dict
+
+from common import (
+    ROOT_DIR_PATH,
+    http_get,
+    process_tree_rss,
+    run_load,
+    start_server,
+    stop_server,
+    write_results,
+)
+
+PROFILES = {
+    "default": ["gunicorn", "config.wsgi"],
+    "tuned": ["gunicorn", "config.wsgi", "--config", "config/gunicorn.py"],
+}
+
+
+def measure(profile: str, args: argparse.Namespace) -> Dict:
+    command = PROFILES[profile] + ["--bind", "127.0.0.1:{}".format(args.port)]
+    process = start_server(command, args.port)
+    url = "http://127.0.0.1:{}{}".format(args.port, args.path)
+    headers = {"Authorization": "Token {}".format(args.token)}
+    try:
+        # Warm up every worker before measuring.
+        run_load(lambda: http_get(url, headers), args.concurrency, 2)
+        result = run_load(
+            lambda: http_get(url, headers), args.concurrency, args.duration
+        )
+        result["rss_bytes"] = process_tree_rss(process.pid)
+    finally:
+        stop_server(process)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--path", default="/api/v1/profiles/")
+    parser.add_argument("--token", required=True)
+    parser.add_argument("--port", type=int, default=5050)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--duration", type=float, default=20)
+    parser.add_argument("--output", help="File to write JSON results to.")
+    args = parser.parse_args()
+
+    profile = subprocess.check_output(
+        [sys.executable, "config/gunicorn.py"], cwd=ROOT_DIR_PATH
+    )
+    results = {"tuned_profile": json.loads(profile.decode("utf-8"))}
+    for name in PROFILES:
+        results[name] = measure(name, args)
+    if results["default"]["throughput"]:
+        results["throughput_gain"] = round(
+            results["tuned"]["throughput"] / results["default"]["throughput"],
+            2,
+        )
+    write_results(args.output, results)
+
+
+if __name__ == "__main__":
+    main()
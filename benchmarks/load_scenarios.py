@@ -0,0 +1,136 @@
+"""
+Scripted load test of the API, for comparing builds.
+
+Each scenario hits one endpoint from a number of concurrent clients for a
+fixed duration, as a member of the organization under test, and its latency
+percentiles are recorded. Results are written as JSON and, given the results
+of a previous run, compared with it.
+
+Generate data first, then run the scenarios as the administrator of the
+largest organization printed by the command::
+
+    $ python manage.py generate_tenant_data --organizations 200 \\
+        --max-members 5000 --seed 1 --prefix load
+    $ python benchmarks/load_scenarios.py --username load-user-0 \\
+        --password password --label $(git rev-parse --short HEAD) \\
+        --output results-new.json --compare results-old.json
+
+"""
+import argparse
+import json
+import time
+import urllib.parse
+import urllib.request
+from typing import Dict, Optional
+
+from common import http_get, run_load, write_results
+
+# Scenario name: (path, whether the organization_id is passed).
+SCENARIOS = {
+    "organizations-list-v1": ("/api/v1/organizations/", False),
+    "organizations-list-v2": ("/api/v2/organizations/", False),
+    "organization-users-list-v1": ("/api/v1/organization-users/", True),
+    "organization-users-list-v2": ("/api/v2/organization-users/", True),
+    "teams-list-v2": ("/api/v2/teams/", True),
+    "teams-list-all-v2": ("/api/v2/teams/?organization_id=all", False),
+    "organization-owner-v2": ("/api/v2/organization-owner/", True),
+    "organization-sync-v1": ("/api/v1/organization-sync/", True),
+    "profiles-list-v1": ("/api/v1/profiles/", False),
+}
+
+
+def get_token(base_url: str, username: str, password: str) -> str:
+    data = urllib.parse.urlencode(
+        {"username": username, "password": password}
+    ).encode()
+    with urllib.request.urlopen(
+        base_url + "/api/token/", data=data, timeout=30
+    ) as response:
+        return json.loads(response.read().decode())["token"]
+
+
+def get_organization_id(base_url: str, headers: Dict[str, str]) -> int:
+    organizations = json.loads(
+        http_get(base_url + "/api/v1/organizations/", headers).decode()
+    )["results"]
+    if not organizations:
+        raise SystemExit("The user is not a member of any organization.")
+    return organizations[0]["id"]
+
+
+def compare(results: Dict, previous: Dict) -> Dict:
+    """Return the relative change of each scenario's latency percentiles."""
+    changes = {}
+    for name, summary in results["scenarios"].items():
+        before = previous.get("scenarios", {}).get(name)
+        if not before:
+            continue
+        changes[name] = {
+            key: round(summary[key] / before[key] - 1, 3)
+            for key in ("p50_ms", "p95_ms", "p99_ms", "throughput")
+            if before.get(key)
+        }
+    return changes
+
+
+def main(argv: Optional[list] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    parser.add_argument("--username", required=True)
+    parser.add_argument("--password", required=True)
+    parser.add_argument(
+        "--organization-id",
+        type=int,
+        help="Defaults to the first organization of the user.",
+    )
+    parser.add_argument(
+        "--scenario",
+        action="append",
+        choices=sorted(SCENARIOS),
+        help="Scenario to run, may be repeated. Defaults to all of them.",
+    )
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--duration", type=float, default=20)
+    parser.add_argument("--label", help="Name of the build being measured.")
+    parser.add_argument("--output", help="File the results are written to.")
+    parser.add_argument(
+        "--compare", help="Results of a previous run to compare with."
+    )
+    args = parser.parse_args(argv)
+
+    base_url = args.base_url.rstrip("/")
+    headers = {
+        "Authorization": "Token "
+        + get_token(base_url, args.username, args.password)
+    }
+    organization_id = args.organization_id or get_organization_id(
+        base_url, headers
+    )
+
+    results = {
+        "label": args.label,
+        "started": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "base_url": base_url,
+        "organization_id": organization_id,
+        "concurrency": args.concurrency,
+        "duration": args.duration,
+        "scenarios": {},
+    }
+    for name in args.scenario or SCENARIOS:
+        path, by_organization = SCENARIOS[name]
+        url = base_url + path
+        if by_organization:
+            url += "?organization_id={}".format(organization_id)
+        results["scenarios"][name] = run_load(
+            lambda: http_get(url, headers), args.concurrency, args.duration
+        )
+
+    if args.compare:
+        with open(args.compare) as previous_file:
+            results["compared_with"] = args.compare
+            results["changes"] = compare(results, json.load(previous_file))
+    write_results(args.output, results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+ASGI config for Employee Management Backend project.
+
+This module exposes the project as an ASGI application for servers such as
+uvicorn. Django 2.0 has no native ASGI support, so the WSGI application is
+wrapped with asgiref's WsgiToAsgi adapter: the server's event loop reads
+request bodies and writes responses, so slow clients only hold a cheap
+coroutine, while Django itself runs in a pool of threads.
+
+asgiref 3.2's adapter does not close the WSGI response once it is sent, so
+Django would never send request_finished, which closes or health checks the
+database connections of the thread, and releases their connection slots. The
+application closes its responses itself.
+
+Run it with gunicorn's uvicorn worker class::
+
+    gunicorn config.asgi:application -k uvicorn.workers.UvicornWorker
+
+"""
+import os
+import sys
+
+from asgiref.wsgi import WsgiToAsgi
+from django.core.wsgi import get_wsgi_application
+
+# This allows easy placement of apps within the interior
+# employee_management_backend directory.
+app_path = os.path.abspath(
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir)
+)
+sys.path.append(os.path.join(app_path, "employee_management_backend"))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings.production")
+
+
+def close_responses(wsgi_application):
+    """Close the responses of a WSGI application after they are sent."""
+
+    def application(environ, start_response):
+        response = wsgi_application(environ, start_response)
+        try:
+            yield from response
+        finally:
+            if hasattr(response, "close"):
+                response.close()
+
+    return application
+
+
+application = WsgiToAsgi(close_responses(get_wsgi_application()))
@@ -0,0 +1,187 @@
+"""
+Gunicorn configuration for Employee Management Backend project.
+
+The worker class, the number of workers and the number of threads are picked
+from the CPU and memory limits of the container (read from cgroups, falling
+back to the host's resources), and can be overridden through environment
+variables:
+
+* GUNICORN_WORKER_CLASS: defaults to gthread, or to uvicorn's worker when
+  DJANGO_SERVER_INTERFACE is asgi.
+* GUNICORN_WORKERS: defaults to 2 * CPUs + 1, capped so that the workers fit
+  in the memory limit.
+* GUNICORN_THREADS: threads per worker, defaults to 4. They are a gthread
+  worker's threads, or the size of the thread pool running Django in an ASGI
+  worker, set through asgiref's ASGI_THREADS.
+* GUNICORN_WORKER_MEMORY: memory, in megabytes, budgeted per worker and used
+  to cap the number of workers, defaults to 160.
+* GUNICORN_TIMEOUT, GUNICORN_KEEPALIVE, GUNICORN_MAX_REQUESTS.
+
+The application is preloaded in the master process so that workers share its
+memory; database and cache connections opened while loading it are closed
+around forking so that workers never share sockets.
+
+Every thread may hold a database connection, so workers * threads is also
+the default cap on the database connections of the container,
+DATABASE_MAX_CONNECTIONS, see employee_management_backend/db/pool.py.
+
+Run ``python config/gunicorn.py`` to print the values picked on this machine.
+"""
+import json
+import multiprocessing
+import os
+
+MEGABYTE = 1024 * 1024
+# cgroup v1 reports "unlimited" memory as a huge number close to 2 ** 63.
+UNLIMITED_MEMORY = 2 ** 60
+UVICORN_WORKER = "uvicorn.workers.UvicornWorker"
+
+
+def read_cgroup_file(*paths):
+    for path in paths:
+        try:
+            with open(path) as cgroup_file:
+                return cgroup_file.read().strip()
+        except (IOError, OSError):
+            continue
+    return None
+
+
+def get_cpu_limit():
+    """Return the number of CPUs this container may use."""
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:
+        cpus = multiprocessing.cpu_count()
+
+    quota = period = None
+    cpu_max = read_cgroup_file("/sys/fs/cgroup/cpu.max")
+    if cpu_max:
+        # cgroup v2: "<quota> <period>" where quota may be "max".
+        value, _, interval = cpu_max.partition(" ")
+        if value != "max":
+            quota, period = int(value), int(interval)
+    else:
+        # cgroup v1: a quota of -1 means no limit.
+        value = read_cgroup_file("/sys/fs/cgroup/cpu/cpu.cfs_quota_us")
+        interval = read_cgroup_file("/sys/fs/cgroup/cpu/cpu.cfs_period_us")
+        if value and interval and int(value) > 0:
+            quota, period = int(value), int(interval)
+
+    if quota and period:
+        cpus = min(cpus, max(quota / period, 1))
+    return cpus
+
+
+def get_memory_limit():
+    """Return the memory, in bytes, this container may use."""
+    value = read_cgroup_file(
+        "/sys/fs/cgroup/memory.max",
+        "/sys/fs/cgroup/memory/memory.limit_in_bytes",
+    )
+    if value and value != "max" and int(value) < UNLIMITED_MEMORY:
+        return int(value)
+    try:
+        return os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+    except (ValueError, OSError):
+        return None
+
+
+def get_worker_class():
+    if os.environ.get("GUNICORN_WORKER_CLASS"):
+        return os.environ["GUNICORN_WORKER_CLASS"]
+    if os.environ.get("DJANGO_SERVER_INTERFACE") == "asgi":
+        return UVICORN_WORKER
+    # Threads let a worker keep serving while requests wait on the database,
+    # Redis or a streaming client.
+    return "gthread"
+
+
+def get_workers(cpus, memory_limit):
+    if os.environ.get("GUNICORN_WORKERS"):
+        return int(os.environ["GUNICORN_WORKERS"])
+    count = int(2 * cpus + 1)
+    worker_memory = (
+        int(os.environ.get("GUNICORN_WORKER_MEMORY", 160)) * MEGABYTE
+    )
+    if memory_limit:
+        count = min(count, memory_limit // worker_memory)
+    return max(count, 1)
+
+
+def get_threads(worker_class):
+    if worker_class not in ("gthread", UVICORN_WORKER):
+        return 1
+    return int(os.environ.get("GUNICORN_THREADS", 4))
+
+
+cpu_limit = get_cpu_limit()
+memory_limit = get_memory_limit()
+
+worker_class = get_worker_class()
+workers = get_workers(cpu_limit, memory_limit)
+threads = get_threads(worker_class)
+if worker_class == UVICORN_WORKER:
+    # Read by asgiref when imported, in the workers.
+    os.environ.setdefault("ASGI_THREADS", str(threads))
+timeout = int(os.environ.get("GUNICORN_TIMEOUT", 30))
+graceful_timeout = timeout
+# Traefik keeps connections to the backend open between requests.
+keepalive = int(os.environ.get("GUNICORN_KEEPALIVE", 5))
+# Recycle workers now and then so that leaks cannot grow unbounded, with
+# jitter so that workers do not all restart at once.
+max_requests = int(os.environ.get("GUNICORN_MAX_REQUESTS", 5000))
+max_requests_jitter = max_requests // 10
+preload_app = True
+
+
+def describe():
+    return {
+        "cpu_limit": cpu_limit,
+        "memory_limit": memory_limit,
+        "worker_class": worker_class,
+        "workers": workers,
+        "threads": threads,
+        "timeout": timeout,
+        "keepalive": keepalive,
+        "max_requests": max_requests,
+        "preload_app": preload_app,
+    }
+
+
+def when_ready(server):
+    server.log.info("Gunicorn profile: %s", json.dumps(describe()))
+
+
+def close_connections():
+    from django.core.cache import caches
+    from django.db import connections
+
+    for connection in connections.all():
+        connection.close()
+    for cache in caches.all():
+        cache.close()
+
+
+def pre_fork(server, worker):
+    # Connections opened while preloading the application belong to the
+    # master process; close them before forking so workers never share them.
+    close_connections()
+
+
+def post_fork(server, worker):
+    # Make sure each worker starts without any inherited connection and opens
+    # its own on first use.
+    close_connections()
+
+
+def child_exit(server, worker):
+    from employee_management_backend.monitoring.metrics import (
+        archive_process_file,
+    )
+
+    archive_process_file(worker.pid)
+
+
+if __name__ == "__main__":
+    print(json.dumps(describe(), indent=2))
@@ -3,6 +3,7 @@ Base settings to build other settings files upon.
 """
 
 import environ
+from celery.schedules import crontab
 
 ROOT_DIR = (
     environ.Path(__file__) - 3
@@ -71,12 +72,14 @@ THIRD_PARTY_APPS = [
     "rest_framework",
     "rest_framework.authtoken",
     "rest_framework_swagger",
+    "graphene_django",
 ]
 LOCAL_APPS = [
     "employee_management_backend.users.apps.UsersAppConfig",
     # Your stuff: custom apps go here
     "employee_management_backend.companies.apps.CompaniesConfig",
     "employee_management_backend.companies2.apps.Companies2Config",
+    "employee_management_backend.monitoring.apps.MonitoringConfig",
 ]
 # https://docs.djangoproject.com/en/dev/ref/settings/#installed-apps
 INSTALLED_APPS = DJANGO_APPS + THIRD_PARTY_APPS + LOCAL_APPS
@@ -131,6 +134,8 @@ AUTH_PASSWORD_VALIDATORS = [
 # ------------------------------------------------------------------------------
 # https://docs.djangoproject.com/en/dev/ref/settings/#middleware
 MIDDLEWARE = [
+    "employee_management_backend.monitoring.middleware.RequestInstrumentationMiddleware",  # noqa E501
+    "employee_management_backend.formats.middleware.CompressionMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -201,6 +206,16 @@ CRISPY_TEMPLATE_PACK = "bootstrap4"
 # https://docs.djangoproject.com/en/dev/ref/settings/#fixture-dirs
 FIXTURE_DIRS = (str(APPS_DIR.path("fixtures")),)
 
+# SESSIONS
+# ------------------------------------------------------------------------------
+# https://docs.djangoproject.com/en/dev/ref/settings/#session-engine
+SESSION_ENGINE = "employee_management_backend.users.sessions"
+# Seconds a process keeps the sessions it read, see
+# employee_management_backend.users.sessions.
+SESSION_LOCAL_CACHE_TIMEOUT = 5
+# Sessions kept by a process at most.
+SESSION_LOCAL_CACHE_SIZE = 10000
+
 # SECURITY
 # ------------------------------------------------------------------------------
 # https://docs.djangoproject.com/en/dev/ref/settings/#session-cookie-httponly
@@ -257,6 +272,13 @@ CELERYD_TASK_TIME_LIMIT = 5 * 60
 # http://docs.celeryproject.org/en/latest/userguide/configuration.html#task-soft-time-limit
 # TODO: set to whatever value is adequate in your circumstances
 CELERYD_TASK_SOFT_TIME_LIMIT = 60
+# http://docs.celeryproject.org/en/latest/userguide/configuration.html#beat-schedule
+CELERY_BEAT_SCHEDULE = {
+    "archive-team-members": {
+        "task": "employee_management_backend.companies.tasks.archive_team_members",
+        "schedule": crontab(hour=3, minute=0),
+    }
+}
 
 # django-allauth
 # ------------------------------------------------------------------------------
@@ -295,11 +317,177 @@ REST_FRAMEWORK = {
     ],
     "DEFAULT_VERSIONING_CLASS": "rest_framework.versioning.URLPathVersioning",
     "EXCEPTION_HANDLER": "rest_framework.views.exception_handler",
+    "DEFAULT_RENDERER_CLASSES": [
+        "employee_management_backend.formats.renderers.JSONRenderer",
+        "employee_management_backend.formats.renderers.MessagePackRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
+    "DEFAULT_PARSER_CLASSES": [
+        "employee_management_backend.formats.parsers.JSONParser",
+        "employee_management_backend.formats.parsers.MessagePackParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ],
 }
+# JSON libraries used by the API's renderers and parsers, the first installed
+# one is used, see employee_management_backend.formats.backends. Without
+# any, REST framework's are used.
+JSON_BACKENDS = ["employee_management_backend.formats.backends.OrjsonBackend"]
 
 # Django Organizations
 # ------------------------------------------------------------------------------
 ORGS_SLUGFIELD = "django_extensions.db.fields.AutoSlugField"
 
+# Organization events
+# ------------------------------------------------------------------------------
+# Broker used to publish organization membership change events.
+ORGANIZATION_EVENTS_BROKER = (
+    "employee_management_backend.companies.events.LocalEventBroker"
+)
+# Seconds between keep-alive comments sent on idle event streams.
+ORGANIZATION_EVENTS_HEARTBEAT = 15
+# Seconds after which an event stream is closed and the client reconnects.
+ORGANIZATION_EVENTS_STREAM_TIMEOUT = 5 * 60
+
+# Organization members
+# ------------------------------------------------------------------------------
+# Members included in nested organization details, see
+# employee_management_backend.companies.members.
+ORGANIZATION_MEMBER_PREVIEW_SIZE = 10
+
+# Organization deletion
+# ------------------------------------------------------------------------------
+# Rows deleted per query when purging an organization, see
+# employee_management_backend.companies.deletion.
+ORGANIZATION_DELETION_CHUNK_SIZE = 1000
+
+# Membership history
+# ------------------------------------------------------------------------------
+# See employee_management_backend.companies.archival. Days removed team
+# members are kept before being moved to the membership history.
+MEMBERSHIP_ARCHIVE_AFTER_DAYS = 30
+# Team members moved to the membership history per transaction.
+MEMBERSHIP_ARCHIVE_CHUNK_SIZE = 1000
+
+# Teams
+# ------------------------------------------------------------------------------
+# Operations accepted by a single request to the bulk teams endpoint.
+TEAM_BULK_MAX_OPERATIONS = 500
+
+# Idempotency keys
+# ------------------------------------------------------------------------------
+# See employee_management_backend.caching.idempotency. Responses are kept for
+# TIMEOUT seconds; retries of a request still running wait up to WAIT_TIMEOUT
+# seconds for it, which holds the key for at most LOCK_TIMEOUT seconds.
+IDEMPOTENCY = {
+    "CACHE": "default",
+    "TIMEOUT": 24 * 60 * 60,
+    "LOCK_TIMEOUT": 60,
+    "WAIT_TIMEOUT": 10,
+}
+
+# Batch requests
+# ------------------------------------------------------------------------------
+# See employee_management_backend.batch. Requests accepted in a batch.
+BATCH_MAX_REQUESTS = 20
+# Threads running the requests of a parallel batch.
+BATCH_MAX_WORKERS = 4
+
+# GraphQL
+# ------------------------------------------------------------------------------
+# See employee_management_backend.graph. Queries deeper than MAX_DEPTH fields,
+# or that may return more than MAX_COMPLEXITY objects, are rejected. Lists
+# return PAGE_SIZE objects unless given first, at most MAX_PAGE_SIZE.
+GRAPHQL = {
+    "MAX_DEPTH": 8,
+    "MAX_COMPLEXITY": 10000,
+    "PAGE_SIZE": 10,
+    "MAX_PAGE_SIZE": 100,
+}
+
+# Response compression
+# ------------------------------------------------------------------------------
+# See employee_management_backend.formats.middleware. br is only used when the
+# brotli library is installed. LEVELS are (size in bytes, levels by encoding),
+# the first pair whose size a response does not exceed applies.
+COMPRESSION = {
+    "ENCODINGS": ["br", "gzip"],
+    "MIN_SIZE": 1024,
+    "LEVELS": [
+        (64 * 1024, {"br": 5, "gzip": 6}),
+        (1024 * 1024, {"br": 4, "gzip": 5}),
+        (None, {"br": 2, "gzip": 3}),
+    ],
+    "STREAMING_LEVELS": {"br": 4, "gzip": 5},
+}
+
+# Request instrumentation
+# ------------------------------------------------------------------------------
+# See employee_management_backend.monitoring.middleware.
+REQUEST_INSTRUMENTATION = {
+    "SAMPLE_RATE": 1.0,
+    "VIEW_SAMPLE_RATES": {},
+    "SERVER_TIMING": True,
+}
+
+# Metrics
+# ------------------------------------------------------------------------------
+# See employee_management_backend.monitoring.metrics. Directory shared by the
+# application processes to aggregate their metrics, or None to only report
+# the process answering the scrape.
+METRICS_DIR = None
+# Seconds between two writes of a process' metrics to METRICS_DIR.
+METRICS_FLUSH_INTERVAL = 5
+# Bearer token required by the scrape endpoint, if set. It is required in
+# production.
+METRICS_AUTH_TOKEN = None
+
+# Slow queries
+# ------------------------------------------------------------------------------
+# See employee_management_backend.monitoring.slow_queries.
+SLOW_QUERIES = {
+    # Seconds after which a query is captured, None to disable the capture.
+    "THRESHOLD": 0.5,
+    # Fraction of the captured SELECT queries explained on PostgreSQL.
+    "EXPLAIN_SAMPLE_RATE": 0.1,
+    "BUFFER_SIZE": 100,
+    "CACHE": "default",
+    # Whether the parameters, which may hold personal data, and the query
+    # plans, which show them, are stored.
+    "CAPTURE_PARAMS": False,
+}
+
+# Tiered cache
+# ------------------------------------------------------------------------------
+# See employee_management_backend.caching.tiered.
+TIERED_CACHE = {
+    "CACHE": "default",
+    # Values kept by every process, and for how many seconds.
+    "LOCAL_SIZE": 1000,
+    "LOCAL_TIMEOUT": 5,
+    # Seconds expired values are kept, to be returned while they are
+    # recomputed.
+    "STALE_TIMEOUT": 60,
+    # Seconds a process may take to recompute a value before another may.
+    "LOCK_TIMEOUT": 30,
+    # Seconds waited for a value another process is computing.
+    "WAIT_TIMEOUT": 5,
+    # How early values are recomputed, 0 to only recompute expired values.
+    "BETA": 1.0,
+}
+
+# Error digests
+# ------------------------------------------------------------------------------
+# See employee_management_backend.monitoring.logs.
+ERROR_DIGEST = {
+    # Seconds errors are collected before being sent to the admins.
+    "INTERVAL": 60,
+    # Seconds an error is not reported again once the admins have been told.
+    "DEDUPLICATE_FOR": 60 * 60,
+    # Digests mailed per hour at most, the others are dropped.
+    "MAX_PER_HOUR": 12,
+    "CACHE": "default",
+}
+
 # Your stuff...
 # ------------------------------------------------------------------------------
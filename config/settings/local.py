@@ -18,7 +18,7 @@ ALLOWED_HOSTS = ["localhost", "0.0.0.0", "127.0.0.1"]
 # https://docs.djangoproject.com/en/dev/ref/settings/#caches
 CACHES = {
     "default": {
-        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "BACKEND": "employee_management_backend.monitoring.cache.InstrumentedLocMemCache",
         "LOCATION": "",
     }
 }
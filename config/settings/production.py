@@ -2,6 +2,8 @@ import logging
 
 from google.oauth2 import service_account
 
+from config import gunicorn
+
 from .base import *  # noqa
 from .base import env
 
@@ -39,17 +41,48 @@ if env.bool("GET_ALLOWED_HOSTS_FROM_KUBERNETES_API", default=True):
 
 # DATABASES
 # ------------------------------------------------------------------------------
-DATABASES["default"] = env.db("DATABASE_URL")  # noqa F405
+# Connect through a pooler such as pgbouncer when DATABASE_POOLER_URL is set.
+DATABASE_POOLER_URL = env("DATABASE_POOLER_URL", default=None)
+DATABASES["default"] = env.db(  # noqa F405
+    "DATABASE_POOLER_URL" if DATABASE_POOLER_URL else "DATABASE_URL"
+)
 DATABASES["default"]["ATOMIC_REQUESTS"] = True  # noqa F405
 DATABASES["default"]["CONN_MAX_AGE"] = env.int(
     "CONN_MAX_AGE", default=60
 )  # noqa F405
+# Ping persistent connections before reusing them and cap the connections
+# opened by all workers of a container. A persistent connection holds its
+# slot between requests, so the cap defaults to the number of threads of the
+# container's workers, see config/gunicorn.py: every request thread then gets
+# a slot without waiting.
+# See employee_management_backend/db/pool.py
+DATABASES["default"].update(  # noqa F405
+    {
+        "ENGINE": "employee_management_backend.db.backends.postgresql",
+        "CONN_HEALTH_CHECKS": True,
+        "CONNECTION_POOL": {
+            "MAX_CONNECTIONS": env.int(
+                "DATABASE_MAX_CONNECTIONS",
+                default=gunicorn.workers * gunicorn.threads,
+            ),
+            "ACQUIRE_TIMEOUT": env.float(
+                "DATABASE_ACQUIRE_TIMEOUT", default=5
+            ),
+            "SLOTS_DIR": env(
+                "DATABASE_CONNECTION_SLOTS_DIR",
+                default="/tmp/db-connection-slots",
+            ),
+        },
+        # https://docs.djangoproject.com/en/dev/ref/databases/#transaction-pooling-server-side-cursors
+        "DISABLE_SERVER_SIDE_CURSORS": bool(DATABASE_POOLER_URL),
+    }
+)
 
 # CACHES
 # ------------------------------------------------------------------------------
 CACHES = {
     "default": {
-        "BACKEND": "django_redis.cache.RedisCache",
+        "BACKEND": "employee_management_backend.monitoring.cache.InstrumentedRedisCache",  # noqa E501
         "LOCATION": env("REDIS_URL"),
         "OPTIONS": {
             "CLIENT_CLASS": "django_redis.client.DefaultClient",
@@ -211,9 +244,12 @@ AWS_PRELOAD_METADATA = True
 # https://docs.djangoproject.com/en/dev/ref/settings/#logging
 # See https://docs.djangoproject.com/en/dev/topics/logging for
 # more details on how to customize your logging configuration.
-# A sample logging configuration. The only tangible logging
-# performed by this configuration is to send an email to
-# the site admins on every HTTP 500 error when DEBUG=False.
+# Handlers that write or send records are slow, so loggers only use the
+# queue_* handlers, which hand records to a background thread running them,
+# see employee_management_backend.monitoring.logs. Errors reach the admins
+# in rate-limited digests mailed by Celery rather than one email per error.
+# dictConfig configures handlers in the order of their names, the queue_*
+# handlers must sort after the handlers they reference.
 LOGGING = {
     "version": 1,
     "disable_existing_loggers": False,
@@ -224,53 +260,114 @@ LOGGING = {
         "verbose": {
             "format": "%(levelname)s %(asctime)s %(module)s "
             "%(process)d %(thread)d %(message)s"
-        }
+        },
+        "json": {
+            "()": "employee_management_backend.monitoring.logs.JSONFormatter"
+        },
     },
     "handlers": {
-        "mail_admins": {
-            "level": "ERROR",
-            "filters": ["require_debug_false"],
-            "class": "django.utils.log.AdminEmailHandler",
-        },
         "console": {
             "level": "DEBUG",
             "class": "logging.StreamHandler",
-            "formatter": "verbose",
+            "formatter": "json",
+        },
+        "error_digest": {
+            "()": "employee_management_backend.monitoring.logs.ErrorDigestHandler",
+            "level": "ERROR",
+            "filters": ["require_debug_false"],
         },
         "file": {
             "level": "ERROR",
             "class": "logging.FileHandler",
             "filename": "/var/log/app/billbored-django",
+            "formatter": "json",
         },
         "file_spam": {
             "level": "ERROR",
             "class": "logging.FileHandler",
             "filename": "/var/log/app/disallowed_host",
+            "formatter": "json",
+        },
+        "queue_console": {
+            "()": "employee_management_backend.monitoring.logs.BackgroundHandler",
+            "handlers": ["cfg://handlers.console"],
+        },
+        "queue_errors": {
+            "()": "employee_management_backend.monitoring.logs.BackgroundHandler",
+            "handlers": ["cfg://handlers.error_digest", "cfg://handlers.file"],
+        },
+        "queue_spam": {
+            "()": "employee_management_backend.monitoring.logs.BackgroundHandler",
+            "handlers": ["cfg://handlers.file_spam"],
         },
     },
     "loggers": {
         "django.request": {
-            "handlers": ["mail_admins", "file"],
+            "handlers": ["queue_errors"],
             "level": "ERROR",
             "propagate": True,
         },
         "django": {
-            "handlers": ["console"],
+            "handlers": ["queue_console"],
             "level": "WARNING",
             "propagate": True,
         },
         "django.db.backends": {
             "level": "ERROR",
-            "handlers": ["mail_admins", "file"],
+            "handlers": ["queue_errors"],
             "propagate": True,
         },
+        "employee_management_backend.monitoring": {
+            "handlers": ["queue_console"],
+            "level": "INFO",
+            "propagate": False,
+        },
         "django.security.DisallowedHost": {
             "level": "ERROR",
-            "handlers": ["file_spam"],
+            "handlers": ["queue_spam"],
             "propagate": True,
         },
     },
 }
 
+# Organization events
+# ------------------------------------------------------------------------------
+ORGANIZATION_EVENTS_BROKER = (
+    "employee_management_backend.companies.events.RedisEventBroker"
+)
+ORGANIZATION_EVENTS_REDIS_URL = env("REDIS_URL")
+
+# Request instrumentation
+# ------------------------------------------------------------------------------
+REQUEST_INSTRUMENTATION = {
+    # Fraction of requests logged with their query, cache and timing metrics.
+    "SAMPLE_RATE": env.float("REQUEST_INSTRUMENTATION_SAMPLE_RATE", 0.05),
+    # Per-view overrides, keyed by view name.
+    "VIEW_SAMPLE_RATES": {
+        # Long-lived streams would only report their connection setup.
+        "companies:organization-events": 0,
+        "companies:organization-sync": 0.2,
+        "api_users:user-list": 0.2,
+    },
+    "SERVER_TIMING": env.bool("REQUEST_INSTRUMENTATION_SERVER_TIMING", True),
+}
+
+# Metrics
+# ------------------------------------------------------------------------------
+# Shared by the django and Celery containers, see production.yml.
+METRICS_DIR = env("METRICS_DIR", default="/var/lib/app-metrics")
+# Required: the metrics would otherwise be public.
+METRICS_AUTH_TOKEN = env("METRICS_AUTH_TOKEN")
+
+# Slow queries
+# ------------------------------------------------------------------------------
+SLOW_QUERIES = {
+    "THRESHOLD": env.float("SLOW_QUERY_THRESHOLD", 0.5),
+    "EXPLAIN_SAMPLE_RATE": env.float("SLOW_QUERY_EXPLAIN_SAMPLE_RATE", 0.1),
+    "BUFFER_SIZE": 200,
+    "CACHE": "default",
+    "CAPTURE_PARAMS": env.bool("SLOW_QUERY_CAPTURE_PARAMS", False),
+}
+
 # Your stuff...
 # ------------------------------------------------------------------------------
@@ -22,7 +22,7 @@ TEST_RUNNER = "django.test.runner.DiscoverRunner"
 # https://docs.djangoproject.com/en/dev/ref/settings/#caches
 CACHES = {
     "default": {
-        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "BACKEND": "employee_management_backend.monitoring.cache.InstrumentedLocMemCache",
         "LOCATION": "",
     }
 }
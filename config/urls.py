@@ -37,6 +37,14 @@ urlpatterns = [
     # Django organizations
     path("invitations/", include(invitation_backend().get_urls())),
     path("organization/", include("organizations.urls")),
+    # Metrics scrape endpoint and slow queries
+    path(
+        "",
+        include(
+            "employee_management_backend.monitoring.urls",
+            namespace="monitoring",
+        ),
+    ),
     # Your stuff: custom urls includes go here
     re_path(
         f"^api/{API_PREFIX}/",
@@ -48,6 +56,14 @@ urlpatterns = [
             ("employee_management_backend.companies.api.urls", "companies")
         ),
     ),
+    re_path(
+        f"^api/{API_PREFIX}/",
+        include(("employee_management_backend.batch.urls", "batch")),
+    ),
+    re_path(
+        f"^api/{API_PREFIX}/",
+        include(("employee_management_backend.graph.urls", "graph")),
+    ),
 ] + static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
 
 # Django Rest Swagger Views
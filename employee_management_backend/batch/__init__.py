@@ -0,0 +1,7 @@
+"""
+Batches of API requests.
+
+A client posts a list of API requests to api/<version>/batch/ and gets their
+responses back together, in one round trip. The batch is authenticated once
+and its requests are run in the process, as its user.
+"""
@@ -0,0 +1,40 @@
+from django.conf import settings
+from rest_framework import serializers
+
+API_PATH_PREFIX = "/api/"
+
+
+class SubRequestSerializer(serializers.Serializer):
+    """An API request of a batch."""
+
+    method = serializers.ChoiceField(
+        choices=["GET", "HEAD", "OPTIONS", "POST", "PUT", "PATCH", "DELETE"],
+        default="GET",
+    )
+    path = serializers.CharField()
+    body = serializers.JSONField(required=False)
+
+    def validate_path(self, path):
+        if not path.startswith(API_PATH_PREFIX):
+            raise serializers.ValidationError(
+                "Only API paths, starting with {}, can be requested.".format(
+                    API_PATH_PREFIX
+                )
+            )
+        return path
+
+
+class BatchSerializer(serializers.Serializer):
+    requests = SubRequestSerializer(many=True)
+    parallel = serializers.BooleanField(default=False)
+
+    def validate_requests(self, requests):
+        if not requests:
+            raise serializers.ValidationError("No requests were given.")
+        if len(requests) > settings.BATCH_MAX_REQUESTS:
+            raise serializers.ValidationError(
+                "At most {} requests can be batched.".format(
+                    settings.BATCH_MAX_REQUESTS
+                )
+            )
+        return requests
@@ -0,0 +1,159 @@
+import pytest
+from django.http import StreamingHttpResponse
+from django.urls import reverse
+from organizations.models import Organization
+from rest_framework.test import APIClient
+
+from employee_management_backend.companies.api.views import (
+    OrganizationEventStreamAPIView,
+)
+from employee_management_backend.companies.models import Team
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def client(user):
+    client = APIClient()
+    client.force_authenticate(user=user)
+    return client
+
+
+@pytest.fixture
+def organization(user):
+    organization = Organization.objects.create(name="Test Organization")
+    organization.get_or_add_user(user)
+    return organization
+
+
+def batch(client, requests, **data):
+    return client.post(
+        reverse("batch:batch", args=["v2"]),
+        dict(data, requests=requests),
+        format="json",
+    )
+
+
+class TestBatch:
+    def test_reads(self, client, user, organization):
+        response = batch(
+            client,
+            [
+                {"path": "/api/v2/user/{}/".format(user.id)},
+                {"path": "/api/v2/organizations/?search=Test"},
+                {"path": "/api/v2/missing/"},
+            ],
+        )
+
+        assert response.status_code == 200, response.content
+        profile, organizations, missing = response.json()["responses"]
+        assert profile["status"] == 200
+        assert profile["body"]["username"] == user.username
+        assert organizations["status"] == 200
+        assert [
+            result["name"] for result in organizations["body"]["results"]
+        ] == [organization.name]
+        assert missing["status"] == 404
+
+    def test_writes(self, client, organization):
+        response = batch(
+            client,
+            [
+                {
+                    "method": "POST",
+                    "path": "/api/v2/teams/",
+                    "body": {
+                        "organization": organization.id,
+                        "name": "Test Team",
+                    },
+                },
+                {"method": "POST", "path": "/api/v2/teams/", "body": {}},
+            ],
+        )
+
+        assert response.status_code == 200, response.content
+        created, invalid = response.json()["responses"]
+        assert created["status"] == 201
+        assert invalid["status"] == 400
+        assert "name" in invalid["body"]
+        assert Team.objects.get().name == "Test Team"
+
+    def test_nested_batch(self, client):
+        response = batch(
+            client,
+            [
+                {
+                    "method": "POST",
+                    "path": "/api/v2/batch/",
+                    "body": {"requests": []},
+                }
+            ],
+        )
+
+        assert response.json()["responses"][0]["status"] == 404
+
+    @pytest.mark.parametrize("streaming", [True, False])
+    def test_streaming(self, client, organization, monkeypatch, streaming):
+        # Streams are also closed when the view is not marked as streaming.
+        monkeypatch.setattr(
+            OrganizationEventStreamAPIView, "streaming", streaming
+        )
+        closed = []
+        monkeypatch.setattr(
+            StreamingHttpResponse, "close", lambda self: closed.append(self)
+        )
+        path = "/api/v2/organization-events/?organization_id={}".format(
+            organization.id
+        )
+
+        response = batch(client, [{"path": path}, {"path": "/api/v2/teams/"}])
+
+        assert response.status_code == 200, response.content
+        events, teams = response.json()["responses"]
+        assert events == {
+            "status": 400,
+            "body": {"detail": "Streaming endpoints cannot be batched."},
+        }
+        assert teams["status"] == 200
+        assert len(closed) == (0 if streaming else 1)
+
+    @pytest.mark.parametrize(
+        "requests",
+        [
+            [],
+            [{"path": "/admin/"}],
+            [{"method": "TRACE", "path": "/api/v2/profiles/"}],
+            [{"path": "/api/v2/profiles/"}] * 3,
+        ],
+    )
+    def test_invalid(self, client, settings, requests):
+        settings.BATCH_MAX_REQUESTS = 2
+
+        response = batch(client, requests)
+
+        assert response.status_code == 400
+
+    def test_anonymous(self):
+        response = batch(APIClient(), [{"path": "/api/v2/profiles/"}])
+
+        assert response.status_code == 401
+
+
+@pytest.mark.django_db(transaction=True)
+class TestParallelBatch:
+    def test_reads(self, client, user, organization):
+        response = batch(
+            client,
+            [
+                {"path": "/api/v2/user/{}/".format(user.id)},
+                {"path": "/api/v2/organizations/"},
+                {"path": "/api/v2/teams/"},
+            ],
+            parallel=True,
+        )
+
+        assert response.status_code == 200, response.content
+        assert [
+            sub_response["status"]
+            for sub_response in response.json()["responses"]
+        ] == [200, 200, 200]
@@ -0,0 +1,5 @@
+from django.urls import path
+
+from employee_management_backend.batch import views
+
+urlpatterns = [path("batch/", views.BatchAPIView.as_view(), name="batch")]
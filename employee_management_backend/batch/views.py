@@ -0,0 +1,176 @@
+import io
+import json
+import logging
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.db import connections, transaction
+from django.http import HttpRequest, QueryDict
+from django.urls import Resolver404, resolve
+from rest_framework import exceptions, status, views
+from rest_framework.response import Response
+
+from employee_management_backend.batch import serializers
+
+logger = logging.getLogger(__name__)
+
+SAFE_METHODS = {"GET", "HEAD", "OPTIONS"}
+# Headers of the batch request that do not apply to its requests.
+BATCH_HEADERS = {
+    "CONTENT_LENGTH",
+    "CONTENT_TYPE",
+    "HTTP_IDEMPOTENCY_KEY",
+    "PATH_INFO",
+    "QUERY_STRING",
+    "REQUEST_METHOD",
+    "wsgi.input",
+}
+
+STREAMING_ERROR = {
+    "status": status.HTTP_400_BAD_REQUEST,
+    "body": {"detail": "Streaming endpoints cannot be batched."},
+}
+
+
+class BatchAPIView(views.APIView):
+    """Batch Endpoint.
+
+    post:
+    # POST a list of API requests and get their responses together.
+    * requests is the list of requests, each with a method, GET by default,
+      a path starting with /api/, including its query string, and an
+      optional JSON body.
+    * Requests are run in order, as the authenticated user, each in its own
+      transaction. When parallel is true and every request is a read, they
+      are run concurrently instead.
+    * At most BATCH_MAX_REQUESTS requests can be batched. Batches cannot be
+      nested and streaming endpoints, such as organization-events, cannot be
+      batched: their responses are a 400.
+    # Returns
+    * responses, the status and body of the response to every request, in
+      the order of the requests.
+    # Raises
+    * status.HTTP_400_BAD_REQUEST
+        * If the requests are not valid.
+    * status.HTTP_401_UNAUTHORIZED
+        * If request is from anonymous user.
+    """
+
+    def post(self, request, *args, **kwargs):
+        if request.user.is_authenticated:
+            serializer = serializers.BatchSerializer(data=request.data)
+            serializer.is_valid(raise_exception=True)
+            sub_requests = serializer.validated_data["requests"]
+
+            parallel = serializer.validated_data["parallel"] and all(
+                sub_request["method"] in SAFE_METHODS
+                for sub_request in sub_requests
+            )
+            if parallel and len(sub_requests) > 1:
+                with ThreadPoolExecutor(
+                    min(settings.BATCH_MAX_WORKERS, len(sub_requests))
+                ) as executor:
+                    responses = list(
+                        executor.map(
+                            lambda sub_request: self.run_in_thread(
+                                request, sub_request
+                            ),
+                            sub_requests,
+                        )
+                    )
+            else:
+                responses = [
+                    self.run(request, sub_request)
+                    for sub_request in sub_requests
+                ]
+            return Response({"responses": responses})
+        else:
+            raise exceptions.AuthenticationFailed()
+
+    def make_request(self, request, sub_request):
+        path, _, query_string = sub_request["path"].partition("?")
+        body = b""
+        if "body" in sub_request:
+            body = json.dumps(sub_request["body"]).encode()
+
+        http_request = HttpRequest()
+        http_request.method = sub_request["method"]
+        http_request.path = http_request.path_info = path
+        http_request.META = {
+            key: value
+            for key, value in request.META.items()
+            if key not in BATCH_HEADERS
+        }
+        http_request.META.update(
+            {
+                "REQUEST_METHOD": http_request.method,
+                "PATH_INFO": path,
+                "QUERY_STRING": query_string,
+                # Responses are rendered with the batch.
+                "HTTP_ACCEPT": request.accepted_media_type,
+                "CONTENT_TYPE": "application/json",
+                "CONTENT_LENGTH": str(len(body)),
+            }
+        )
+        http_request.GET = QueryDict(query_string)
+        http_request.COOKIES = request.COOKIES
+        http_request._stream = io.BytesIO(body)
+        http_request._read_started = False
+        http_request.user = request.user
+        if hasattr(request._request, "session"):
+            http_request.session = request._request.session
+        # Authenticated once, with the batch.
+        http_request._force_auth_user = request.user
+        http_request._force_auth_token = request.auth
+        return http_request
+
+    def run(self, request, sub_request):
+        """Return the status and body of the response to a request."""
+        path = sub_request["path"].partition("?")[0]
+        try:
+            match = resolve(urllib.parse.unquote(path))
+        except Resolver404:
+            match = None
+        if match is None or getattr(match.func, "cls", None) is type(self):
+            return {
+                "status": status.HTTP_404_NOT_FOUND,
+                "body": {"detail": "Not found."},
+            }
+        if getattr(getattr(match.func, "cls", None), "streaming", False):
+            return STREAMING_ERROR
+
+        http_request = self.make_request(request, sub_request)
+        http_request.resolver_match = match
+        try:
+            # A savepoint per request: REST framework rolls back the
+            # innermost atomic block of a request whose error it handled.
+            with transaction.atomic():
+                response = match.func(
+                    http_request, *match.args, **match.kwargs
+                )
+        except Exception:
+            logger.exception(
+                "Batched request to %s failed", sub_request["path"]
+            )
+            return {
+                "status": status.HTTP_500_INTERNAL_SERVER_ERROR,
+                "body": {"detail": "Server error."},
+            }
+
+        if response.streaming:
+            # Releases what the stream holds, such as its subscription.
+            response.close()
+            return STREAMING_ERROR
+        if hasattr(response, "data"):
+            body = response.data
+        else:
+            body = response.content.decode(response.charset)
+        return {"status": response.status_code, "body": body}
+
+    def run_in_thread(self, request, sub_request):
+        try:
+            return self.run(request, sub_request)
+        finally:
+            # The thread's connections are not reused by another request.
+            connections.close_all()
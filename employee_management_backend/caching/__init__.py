@@ -0,0 +1,11 @@
+"""
+Caching utilities shared by the project's apps.
+
+employee_management_backend.caching.tiered keeps computed values in two
+tiers: a small LRU in every process, in front of the cache shared by the
+deployment, Redis in production.
+
+employee_management_backend.caching.idempotency keeps the responses of API
+requests sent with an Idempotency-Key header, so that retries of a request
+do not run it again.
+"""
@@ -0,0 +1,167 @@
+"""
+Idempotency keys for the API's POST endpoints.
+
+A client retrying a request that may have succeeded sends the same
+Idempotency-Key header as the first attempt, and the views decorated with
+idempotent() then run it only once per user and path:
+
+* The first successful (2xx) response to a key is kept in the CACHE alias of
+  the IDEMPOTENCY setting for TIMEOUT seconds, once the request's transaction
+  has committed, and returned to the requests repeating the key, with an
+  Idempotent-Replayed header. It is kept rendered: requests repeating the
+  key get the same content and Content-Type, whichever media type they
+  accept.
+* A request repeating the key of a request still running waits up to
+  WAIT_TIMEOUT seconds for its response, then gets a 409. The key is locked
+  for at most LOCK_TIMEOUT seconds by the request running it, longer than
+  the request itself should take.
+* Requests failing, or returning another status, do not keep their response:
+  the key can be retried, a waiting request then running it.
+* A key repeated with different data gets a 422.
+
+Requests without the header, or from anonymous users, are not affected, nor
+are requests made while the cache is unavailable, its backend ignoring the
+error: they are run as if they had no key.
+"""
+import functools
+import hashlib
+import json
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from django.http import HttpResponse
+from rest_framework import exceptions, status
+
+HEADER = "HTTP_IDEMPOTENCY_KEY"
+MAX_KEY_LENGTH = 255
+
+
+def get_config():
+    config = {
+        "CACHE": "default",
+        "TIMEOUT": 24 * 60 * 60,
+        "LOCK_TIMEOUT": 60,
+        "WAIT_TIMEOUT": 10,
+    }
+    config.update(getattr(settings, "IDEMPOTENCY", {}))
+    return config
+
+
+class IdempotencyConflict(exceptions.APIException):
+    status_code = status.HTTP_409_CONFLICT
+    default_detail = "A request with this Idempotency-Key is being processed."
+    default_code = "idempotency_conflict"
+
+
+class IdempotencyKeyReused(exceptions.APIException):
+    status_code = status.HTTP_422_UNPROCESSABLE_ENTITY
+    default_detail = "This Idempotency-Key was used with different data."
+    default_code = "idempotency_key_reused"
+
+
+class IdempotentRequest:
+    """The response of a request, kept under its Idempotency-Key."""
+
+    poll_interval = 0.05
+
+    def __init__(self, request, idempotency_key):
+        self.config = get_config()
+        self.cache = caches[self.config["CACHE"]]
+        scope = "{}:{}:{}:{}".format(
+            request.user.pk, request.method, request.path, idempotency_key
+        )
+        self.key = "idempotency:{}".format(
+            hashlib.sha256(scope.encode()).hexdigest()
+        )
+        self.lock_key = self.key + ":lock"
+        self.fingerprint = hashlib.sha256(
+            json.dumps(request.data, sort_keys=True, default=str).encode()
+        ).hexdigest()
+
+    def run(self, handle):
+        """Return the kept response, or the response of handle()."""
+        deadline = time.monotonic() + self.config["WAIT_TIMEOUT"]
+        while True:
+            entry = self.cache.get(self.key)
+            if entry is not None:
+                return self.replay(entry)
+            acquired = self.cache.add(
+                self.lock_key, 1, timeout=self.config["LOCK_TIMEOUT"]
+            )
+            if acquired is None:
+                # The backend ignored an error: the cache is unavailable and
+                # the request is run as if it had no key.
+                return handle()
+            if acquired:
+                return self.handle(handle)
+            # The key is being run by another request.
+            if time.monotonic() >= deadline:
+                raise IdempotencyConflict()
+            time.sleep(self.poll_interval)
+
+    def handle(self, handle):
+        try:
+            response = handle()
+        except Exception:
+            self.cache.delete(self.lock_key)
+            raise
+        if status.is_success(response.status_code):
+            entry = {
+                "fingerprint": self.fingerprint,
+                "status": response.status_code,
+                "content": response.content,
+                "headers": {
+                    name: response[name]
+                    for name in ("Content-Type", "Location")
+                    if response.has_header(name)
+                },
+            }
+            # Runs right away outside of a transaction.
+            transaction.on_commit(lambda: self.keep(entry))
+        else:
+            self.cache.delete(self.lock_key)
+        return response
+
+    def keep(self, entry):
+        self.cache.set(self.key, entry, timeout=self.config["TIMEOUT"])
+        self.cache.delete(self.lock_key)
+
+    def replay(self, entry):
+        if entry["fingerprint"] != self.fingerprint:
+            raise IdempotencyKeyReused()
+        response = HttpResponse(entry["content"], status=entry["status"])
+        for name, value in entry["headers"].items():
+            response[name] = value
+        response["Idempotent-Replayed"] = "true"
+        return response
+
+
+def idempotent(handler):
+    """Run the decorated view method once per Idempotency-Key."""
+
+    @functools.wraps(handler)
+    def wrapper(view, request, *args, **kwargs):
+        idempotency_key = request.META.get(HEADER)
+        if not idempotency_key or not request.user.is_authenticated:
+            return handler(view, request, *args, **kwargs)
+        if len(idempotency_key) > MAX_KEY_LENGTH:
+            raise exceptions.ValidationError(
+                "Idempotency-Key cannot be longer than {} characters.".format(
+                    MAX_KEY_LENGTH
+                )
+            )
+
+        def handle():
+            response = handler(view, request, *args, **kwargs)
+            # Rendered with the renderer negotiated by this request, as it is
+            # kept.
+            response = view.finalize_response(
+                request, response, *args, **kwargs
+            )
+            return response.render()
+
+        return IdempotentRequest(request, idempotency_key).run(handle)
+
+    return wrapper
@@ -0,0 +1,185 @@
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+from django.core import mail
+from django.core.cache import cache, caches
+from django.urls import reverse
+from organizations.models import Organization, OrganizationUser
+from rest_framework.test import APIClient
+
+from employee_management_backend.caching.idempotency import IdempotentRequest
+from employee_management_backend.companies.models import Team
+from employee_management_backend.users.tests.factories import UserFactory
+
+# The first response is kept once the request's transaction has committed.
+pytestmark = pytest.mark.django_db(transaction=True)
+
+
+@pytest.fixture(autouse=True)
+def idempotency(settings):
+    settings.IDEMPOTENCY = {
+        "CACHE": "default",
+        "TIMEOUT": 60,
+        "LOCK_TIMEOUT": 30,
+        "WAIT_TIMEOUT": 0.2,
+    }
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def client(user):
+    client = APIClient()
+    client.force_authenticate(user=user)
+    return client
+
+
+@pytest.fixture
+def organization(user):
+    organization = Organization.objects.create(name="Test Organization")
+    organization.get_or_add_user(user)
+    return organization
+
+
+@pytest.fixture
+def teams_url():
+    return reverse("companies:teams-list", args=["v2"])
+
+
+def create_team(client, url, organization, key=None, name="Test Team"):
+    headers = {"HTTP_IDEMPOTENCY_KEY": key} if key else {}
+    return client.post(
+        url,
+        {"organization": organization.id, "name": name},
+        format="json",
+        **headers
+    )
+
+
+class TestIdempotency:
+    def test_replayed(self, client, organization, teams_url):
+        response = create_team(client, teams_url, organization, "key-1")
+        replayed = create_team(client, teams_url, organization, "key-1")
+
+        assert response.status_code == replayed.status_code == 201
+        assert replayed.json() == response.json()
+        assert replayed["Idempotent-Replayed"] == "true"
+        assert not response.has_header("Idempotent-Replayed")
+        assert Team.objects.count() == 1
+
+        create_team(client, teams_url, organization, "key-2")
+        create_team(client, teams_url, organization)
+        create_team(client, teams_url, organization)
+        assert Team.objects.count() == 4
+
+    def test_replayed_rendered(self, client, organization, teams_url):
+        response = client.post(
+            teams_url,
+            {"organization": organization.id, "name": "Test Team"},
+            format="json",
+            HTTP_ACCEPT="application/msgpack",
+            HTTP_IDEMPOTENCY_KEY="key-1",
+        )
+        replayed = create_team(client, teams_url, organization, "key-1")
+
+        assert replayed["Idempotent-Replayed"] == "true"
+        assert replayed["Content-Type"] == response["Content-Type"]
+        assert replayed["Content-Type"] == "application/msgpack"
+        assert replayed.content == response.content
+
+    def test_scoped_by_user(self, client, user, organization, teams_url):
+        other = UserFactory()
+        organization.add_user(other, is_admin=True)
+        other_client = APIClient()
+        other_client.force_authenticate(user=other)
+
+        create_team(client, teams_url, organization, "key-1")
+        response = create_team(other_client, teams_url, organization, "key-1")
+
+        assert not response.has_header("Idempotent-Replayed")
+        assert Team.objects.count() == 2
+
+    def test_different_data(self, client, organization, teams_url):
+        create_team(client, teams_url, organization, "key-1")
+        response = create_team(
+            client, teams_url, organization, "key-1", name="Other Team"
+        )
+
+        assert response.status_code == 422
+        assert Team.objects.count() == 1
+
+    def test_failure_not_kept(self, client, organization, teams_url):
+        response = create_team(client, teams_url, organization, "key-1", "")
+        retried = create_team(client, teams_url, organization, "key-1")
+
+        assert response.status_code == 400
+        assert retried.status_code == 201
+        assert Team.objects.count() == 1
+
+    def test_in_flight(self, client, user, organization, teams_url):
+        data = {"organization": organization.id, "name": "Test Team"}
+        running = IdempotentRequest(
+            SimpleNamespace(
+                user=user, method="POST", path=teams_url, data=data
+            ),
+            "key-1",
+        )
+        cache.add(running.lock_key, 1)
+
+        response = create_team(client, teams_url, organization, "key-1")
+
+        assert response.status_code == 409
+        assert Team.objects.count() == 0
+
+        def finish():
+            time.sleep(0.05)
+            running.keep(
+                {
+                    "fingerprint": running.fingerprint,
+                    "status": 201,
+                    "content": b'{"name": "Kept Team"}',
+                    "headers": {"Content-Type": "application/json"},
+                }
+            )
+
+        thread = threading.Thread(target=finish)
+        thread.start()
+        response = create_team(client, teams_url, organization, "key-1")
+        thread.join()
+
+        assert response.json() == {"name": "Kept Team"}
+        assert Team.objects.count() == 0
+
+    def test_cache_unavailable(
+        self, client, organization, teams_url, monkeypatch
+    ):
+        # Backends ignoring errors, such as django_redis with
+        # IGNORE_EXCEPTIONS, return None.
+        backend = type(caches["default"])
+        monkeypatch.setattr(backend, "add", lambda *args, **kwargs: None)
+        monkeypatch.setattr(backend, "get", lambda *args, **kwargs: None)
+
+        responses = [
+            create_team(client, teams_url, organization, "key-1")
+            for _ in range(2)
+        ]
+
+        assert [response.status_code for response in responses] == [201, 201]
+        assert Team.objects.count() == 2
+
+    def test_organization_user_notified_once(self, client, organization):
+        other = UserFactory()
+        url = reverse("companies:organization-users-list", args=["v2"])
+        data = {"organization": organization.id, "user_email": other.email}
+
+        responses = [
+            client.post(url, data, format="json", HTTP_IDEMPOTENCY_KEY="key-1")
+            for _ in range(2)
+        ]
+
+        assert [response.status_code for response in responses] == [201, 201]
+        assert len(mail.outbox) == 1
+        assert OrganizationUser.objects.filter(user=other).count() == 1
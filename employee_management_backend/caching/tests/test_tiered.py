@@ -0,0 +1,203 @@
+import threading
+import time
+
+import pytest
+from django.core.cache import cache, caches
+
+from employee_management_backend.caching import tiered
+from employee_management_backend.caching.tiered import (
+    Entry,
+    LocalCache,
+    TieredCache,
+)
+
+
+@pytest.fixture(autouse=True)
+def tiered_cache(settings):
+    settings.TIERED_CACHE = {
+        "CACHE": "default",
+        "LOCAL_TIMEOUT": 5,
+        "STALE_TIMEOUT": 60,
+        "LOCK_TIMEOUT": 30,
+        "WAIT_TIMEOUT": 0.2,
+        "BETA": 0,
+    }
+    cache.clear()
+    tiered.local.clear()
+    yield
+    cache.clear()
+    tiered.local.clear()
+
+
+@pytest.fixture
+def counter():
+    calls = []
+
+    def compute():
+        calls.append(None)
+        return len(calls)
+
+    compute.calls = calls
+    return compute
+
+
+class TestLocalCache:
+    def test_least_recently_used_dropped(self):
+        local = LocalCache(2)
+        local.set("a", 1, 10)
+        local.set("b", 2, 10)
+        local.get("a")
+        local.set("c", 3, 10)
+
+        assert local.get("a") == 1
+        assert local.get("b") is None
+        assert local.get("c") == 3
+
+    def test_expiry(self):
+        local = LocalCache(2)
+        local.set("a", 1, 0.01)
+        local.set("b", 2, 0)
+        time.sleep(0.02)
+
+        assert local.get("a") is None
+        assert local.get("b") is None
+
+
+class TestTieredCache:
+    def test_get_or_set(self, counter):
+        organizations = TieredCache("organizations")
+
+        assert organizations.get_or_set(1, counter, 60) == 1
+        assert organizations.get_or_set(1, counter, 60) == 1
+        tiered.local.clear()
+        assert organizations.get_or_set(1, counter, 60) == 1
+        assert organizations.get_or_set(2, counter, 60) == 2
+        assert TieredCache("profiles").get_or_set(1, counter, 60) == 3
+
+        organizations.delete(1)
+        assert organizations.get_or_set(1, counter, 60) == 4
+
+    def test_invalidate_tags(self, counter):
+        organizations = TieredCache("organizations")
+        organizations.get_or_set(1, counter, 60, tags=["organization:1"])
+        organizations.get_or_set(2, counter, 60, tags=["organization:2"])
+
+        organizations.invalidate_tags("organization:1")
+
+        assert (
+            organizations.get_or_set(1, counter, 60, tags=["organization:1"])
+            == 3
+        )
+        assert (
+            organizations.get_or_set(2, counter, 60, tags=["organization:2"])
+            == 2
+        )
+
+    def test_tag_eviction(self, counter):
+        organizations = TieredCache("organizations")
+        organizations.get_or_set(1, counter, 60, tags=["organization:1"])
+        tiered.local.clear()
+
+        cache.delete(organizations.make_tag_key("organization:1"))
+
+        assert (
+            organizations.get_or_set(1, counter, 60, tags=["organization:1"])
+            == 2
+        )
+
+    def test_tag_versions_unavailable(self, counter, monkeypatch):
+        organizations = TieredCache("organizations")
+        key = organizations.make_key(1)
+        tags = ["organization:1"]
+        # Kept while the tag versions could not be read.
+        cache.set(key, Entry("unversioned", time.time() + 60, 0, {}), 60)
+
+        assert organizations.get_or_set(1, counter, 60, tags=tags) == 1
+
+        tiered.local.clear()
+        backend = type(caches["default"])
+        get_many = backend.get_many
+        # The tag versions are dropped, as by a failing get_many.
+        monkeypatch.setattr(
+            backend,
+            "get_many",
+            lambda self, keys, **kwargs: {
+                name: value
+                for name, value in get_many(self, keys, **kwargs).items()
+                if not name.startswith("tiered:tag:")
+            },
+        )
+        organizations.invalidate_tags(*tags)
+
+        assert organizations.get_or_set(1, counter, 60, tags=tags) == 2
+        assert organizations.get_or_set(1, counter, 60, tags=tags) == 2
+        assert cache.get(key).value == 1
+
+    def test_early_expiry(self, settings):
+        settings.TIERED_CACHE = dict(settings.TIERED_CACHE, BETA=1)
+        organizations = TieredCache("organizations")
+
+        assert not organizations.should_recompute(
+            Entry(1, time.time() + 60, 0, {})
+        )
+        assert organizations.should_recompute(
+            Entry(1, time.time() + 60, 10 ** 6, {})
+        )
+        assert organizations.should_recompute(Entry(1, time.time(), 0, {}))
+
+    def test_stale_value_returned_while_recomputed(self, counter):
+        organizations = TieredCache("organizations")
+        key = organizations.make_key(1)
+        cache.set(key, Entry("stale", time.time() - 1, 0, {}), 60)
+        cache.add(key + ":lock", 1, 30)
+
+        assert organizations.get_or_set(1, counter, 60) == "stale"
+        assert counter.calls == []
+
+        cache.delete(key + ":lock")
+        assert organizations.get_or_set(1, counter, 60) == 1
+
+    def test_waits_for_value(self, counter):
+        organizations = TieredCache("organizations")
+        key = organizations.make_key(1)
+        cache.add(key + ":lock", 1, 30)
+
+        def set_value():
+            time.sleep(0.05)
+            cache.set(key, Entry("computed", time.time() + 60, 0, {}), 60)
+
+        thread = threading.Thread(target=set_value)
+        thread.start()
+        assert organizations.get_or_set(1, counter, 60) == "computed"
+        thread.join()
+        assert counter.calls == []
+
+        # The value is computed when the wait times out.
+        cache.add(organizations.make_key(2) + ":lock", 1, 30)
+        assert organizations.get_or_set(2, counter, 60) == 1
+
+    def test_single_flight(self):
+        organizations = TieredCache("organizations")
+        calls = []
+
+        def compute():
+            calls.append(None)
+            time.sleep(0.05)
+            return "computed"
+
+        results = []
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(
+                    organizations.get_or_set(1, compute, 60)
+                )
+            )
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results == ["computed"] * 5
+        assert len(calls) == 1
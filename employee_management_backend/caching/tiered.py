@@ -0,0 +1,247 @@
+"""
+Two-tier cache with stampede protection.
+
+TieredCache.get_or_set() returns the value cached under a key, computing and
+caching it when missing. Values are looked up in the process first, in an LRU
+of LOCAL_SIZE entries kept for LOCAL_TIMEOUT seconds, then in the CACHE alias
+shared by every process. Both tiers are configured with the TIERED_CACHE
+setting.
+
+Hot keys do not make every process recompute them at once:
+
+* A value is recomputed a little before it expires, with a probability that
+  grows as the expiry approaches and with the time the value took to compute
+  (probabilistic early expiration, BETA scales it).
+* Only one thread in the deployment recomputes a key at a time, holding a
+  lock in the shared cache for up to LOCK_TIMEOUT seconds. The others return
+  the previous value, kept STALE_TIMEOUT seconds past its expiry for that
+  purpose, or, if there is none, wait up to WAIT_TIMEOUT seconds for the new
+  one before computing it themselves.
+
+Values can be given tags when they are cached. invalidate_tags() makes every
+value cached with one of the tags a miss. Other processes may still return
+the values they hold locally for up to LOCAL_TIMEOUT seconds. Values whose
+tag versions could not be read from the shared cache are only cached
+locally.
+
+Values are shared between the callers of a process: they must not be
+mutated. When the shared cache fails, its backend ignoring the error, values
+are computed on every call.
+"""
+import collections
+import math
+import random
+import threading
+import time
+import uuid
+
+from django.conf import settings
+from django.core.cache import caches
+
+Entry = collections.namedtuple("Entry", ["value", "expires", "delta", "tags"])
+
+
+def get_config():
+    config = {
+        "CACHE": "default",
+        "LOCAL_SIZE": 1000,
+        "LOCAL_TIMEOUT": 5,
+        "STALE_TIMEOUT": 60,
+        "LOCK_TIMEOUT": 30,
+        "WAIT_TIMEOUT": 5,
+        "BETA": 1.0,
+    }
+    config.update(getattr(settings, "TIERED_CACHE", {}))
+    return config
+
+
+class LocalCache:
+    """Values kept by the process, least recently used dropped first."""
+
+    def __init__(self, size):
+        self.size = size
+        self.lock = threading.Lock()
+        self.entries = collections.OrderedDict()
+
+    def get(self, key, default=None):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return default
+            expires, value = entry
+            if expires <= time.monotonic():
+                del self.entries[key]
+                return default
+            self.entries.move_to_end(key)
+            return value
+
+    def set(self, key, value, timeout):
+        if timeout <= 0:
+            self.delete(key)
+            return
+        with self.lock:
+            self.entries[key] = time.monotonic() + timeout, value
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.size:
+                self.entries.popitem(last=False)
+
+    def delete(self, key):
+        with self.lock:
+            self.entries.pop(key, None)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+
+local = LocalCache(get_config()["LOCAL_SIZE"])
+
+
+class TieredCache:
+    """Values computed once for the deployment, under keys of a prefix."""
+
+    poll_interval = 0.05
+
+    def __init__(self, prefix):
+        self.prefix = prefix
+        self.lock = threading.Lock()
+        self.flights = {}
+
+    @property
+    def cache(self):
+        return caches[get_config()["CACHE"]]
+
+    def make_key(self, key):
+        return "tiered:{}:{}".format(self.prefix, key)
+
+    def make_tag_key(self, tag):
+        return "tiered:tag:{}".format(tag)
+
+    def get_tag_versions(self, tags):
+        if not tags:
+            return {}
+        keys = {self.make_tag_key(tag): tag for tag in tags}
+        versions = self.cache.get_many(list(keys))
+        missing = [key for key in keys if key not in versions]
+        if missing:
+            # A tag starts at a new version rather than at none, so that
+            # values cached before it was evicted are not valid again.
+            for key in missing:
+                self.cache.add(key, uuid.uuid4().hex, timeout=None)
+            versions.update(self.cache.get_many(missing))
+        return {keys[key]: version for key, version in versions.items()}
+
+    def get_entry(self, key, tags):
+        entry = self.cache.get(key)
+        if entry is None:
+            return None
+        if self.get_tag_versions(tags) != entry.tags:
+            return None
+        return entry
+
+    def set_local(self, key, entry):
+        timeout = min(
+            get_config()["LOCAL_TIMEOUT"], entry.expires - time.time()
+        )
+        local.set(key, entry, timeout)
+
+    def should_recompute(self, entry):
+        # XFetch: the expiry is moved forward by a random multiple of the
+        # time the value took to compute.
+        early = (
+            -entry.delta * get_config()["BETA"] * math.log(1 - random.random())
+        )
+        return time.time() + early >= entry.expires
+
+    def get_or_set(self, key, compute, timeout, tags=()):
+        """
+        Return the value cached under key, or cache and return compute().
+
+        timeout is the number of seconds the value is cached for. tags are
+        names the value can be invalidated with.
+        """
+        key = self.make_key(key)
+        entry = seen = local.get(key)
+        if entry is None or self.should_recompute(entry):
+            entry = self.get_entry(key, tags)
+            if entry is None or self.should_recompute(entry):
+                return self.recompute(key, compute, timeout, tags, seen, entry)
+            self.set_local(key, entry)
+        return entry.value
+
+    def recompute(self, key, compute, timeout, tags, seen, stale):
+        with self.lock:
+            flight = self.flights.setdefault(key, threading.Lock())
+        # Threads of this process wait for the one recomputing the key, and
+        # return what it cached.
+        with flight:
+            try:
+                entry = local.get(key)
+                if entry is not None and entry not in (seen, stale):
+                    return entry.value
+                return self.recompute_shared(
+                    key, compute, timeout, tags, stale
+                )
+            finally:
+                with self.lock:
+                    self.flights.pop(key, None)
+
+    def recompute_shared(self, key, compute, timeout, tags, stale):
+        config = get_config()
+        lock_key = key + ":lock"
+        # The backend returns None rather than False when it ignored an
+        # error, there is then no lock to wait for.
+        acquired = self.cache.add(lock_key, 1, timeout=config["LOCK_TIMEOUT"])
+        if acquired is False:
+            if stale is not None:
+                return stale.value
+            entry = self.wait(key, tags, lock_key, config["WAIT_TIMEOUT"])
+            if entry is not None:
+                self.set_local(key, entry)
+                return entry.value
+        try:
+            versions = self.get_tag_versions(tags)
+            start = time.monotonic()
+            value = compute()
+            entry = Entry(
+                value,
+                time.time() + timeout,
+                time.monotonic() - start,
+                versions,
+            )
+            # Without the versions of every tag, the value could not be
+            # invalidated with them.
+            if len(versions) == len(set(tags)):
+                self.cache.set(
+                    key, entry, timeout=timeout + config["STALE_TIMEOUT"]
+                )
+            self.set_local(key, entry)
+            return value
+        finally:
+            if acquired:
+                self.cache.delete(lock_key)
+
+    def wait(self, key, tags, lock_key, timeout):
+        """Return the entry computed by another process, or None."""
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            time.sleep(self.poll_interval)
+            entry = self.get_entry(key, tags)
+            if entry is not None and entry.expires > time.time():
+                return entry
+            if lock_key not in self.cache:
+                return None
+        return None
+
+    def delete(self, key):
+        key = self.make_key(key)
+        local.delete(key)
+        self.cache.delete(key)
+
+    def invalidate_tags(self, *tags):
+        """Make the values cached with any of the tags misses."""
+        self.cache.set_many(
+            {self.make_tag_key(tag): uuid.uuid4().hex for tag in tags},
+            timeout=None,
+        )
+        local.clear()
@@ -1,6 +1,47 @@
 from django.contrib import admin
 
-from employee_management_backend.companies.models import Team, TeamMember
+from employee_management_backend.companies.archival import remove_team_members
+from employee_management_backend.companies.models import (
+    MembershipHistory,
+    Team,
+    TeamMember,
+)
 
 admin.site.register(Team)
-admin.site.register(TeamMember)
+
+
+@admin.register(TeamMember)
+class TeamMemberAdmin(admin.ModelAdmin):
+    """Team members are removed rather than deleted, see archival."""
+
+    actions = ["remove_selected"]
+
+    def get_actions(self, request):
+        actions = super().get_actions(request)
+        actions.pop("delete_selected", None)
+        return actions
+
+    def delete_model(self, request, obj):
+        remove_team_members(TeamMember.objects.filter(pk=obj.pk))
+
+    def remove_selected(self, request, queryset):
+        removed = remove_team_members(queryset)
+        self.message_user(
+            request, "Removed {} team members.".format(len(removed))
+        )
+
+    remove_selected.short_description = "Remove selected team members"
+
+
+@admin.register(MembershipHistory)
+class MembershipHistoryAdmin(admin.ModelAdmin):
+    list_display = [
+        "organization_id",
+        "object_type",
+        "object_id",
+        "user_id",
+        "team_id",
+        "joined",
+        "departed",
+    ]
+    list_filter = ["object_type"]
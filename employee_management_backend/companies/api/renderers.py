@@ -0,0 +1,12 @@
+from employee_management_backend.formats.renderers import JSONRenderer
+
+
+class EventStreamRenderer(JSONRenderer):
+    """Accept text/event-stream requests.
+
+    Streams are returned as StreamingHttpResponse objects that bypass
+    rendering, so this renderer only renders error responses, as JSON.
+    """
+
+    media_type = "text/event-stream"
+    format = "event-stream"
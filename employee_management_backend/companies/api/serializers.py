@@ -1,3 +1,5 @@
+from django.conf import settings
+from django.db.models import Manager
 from rest_framework import serializers
 
 from organizations.models import (
@@ -7,11 +9,42 @@ from organizations.models import (
 )
 
 from employee_management_backend.companies import models
+from employee_management_backend.companies.members import (
+    attach_member_previews,
+)
+from employee_management_backend.monitoring.serializers import (
+    InstrumentedModelSerializer,
+)
 from employee_management_backend.users.api.serializers import ProfileSerializer
 
 
-class OrganizationSerializer(serializers.ModelSerializer):
-    users_nested = ProfileSerializer(source="users", many=True, read_only=True)
+class MemberPreviewListSerializer(serializers.ListSerializer):
+    """
+    Fetch the member previews of all the organizations of a list at once.
+
+    The organizations are the items themselves or, when the child serializer
+    sets member_preview_source, the item attribute it names.
+    """
+
+    def to_representation(self, data):
+        items = list(data.all() if isinstance(data, Manager) else data)
+        source = getattr(self.child, "member_preview_source", None)
+        attach_member_previews(
+            getattr(item, source) if source else item for item in items
+        )
+        return super().to_representation(items)
+
+
+class OrganizationSerializer(InstrumentedModelSerializer):
+    """
+    Organization details with its member count and, as users_nested, its
+    first ORGANIZATION_MEMBER_PREVIEW_SIZE members.
+    """
+
+    member_count = serializers.IntegerField(read_only=True)
+    users_nested = ProfileSerializer(
+        source="member_preview", many=True, read_only=True
+    )
 
     class Meta:
         model = Organization
@@ -22,6 +55,7 @@ class OrganizationSerializer(serializers.ModelSerializer):
             "is_active",
             "created",
             "modified",
+            "member_count",
             "users_nested",
         ]
         extra_kwargs = {
@@ -29,9 +63,15 @@ class OrganizationSerializer(serializers.ModelSerializer):
             "created": {"read_only": True},
             "modified": {"read_only": True},
         }
+        list_serializer_class = MemberPreviewListSerializer
+
+    def to_representation(self, instance):
+        if not hasattr(instance, "member_preview"):
+            attach_member_previews([instance])
+        return super().to_representation(instance)
 
 
-class SimpleOrganizationSerializer(serializers.ModelSerializer):
+class SimpleOrganizationSerializer(InstrumentedModelSerializer):
     class Meta:
         model = Organization
         fields = ["id", "name", "slug", "is_active", "created", "modified"]
@@ -42,12 +82,13 @@ class SimpleOrganizationSerializer(serializers.ModelSerializer):
         }
 
 
-class OrganizationUserSerializer(serializers.ModelSerializer):
+class OrganizationUserSerializer(InstrumentedModelSerializer):
     user_email = serializers.EmailField(write_only=True, required=False)
     user_nested = ProfileSerializer(source="user", read_only=True)
     organization_nested = OrganizationSerializer(
         source="organization", read_only=True
     )
+    member_preview_source = "organization"
 
     class Meta:
         model = OrganizationUser
@@ -66,9 +107,10 @@ class OrganizationUserSerializer(serializers.ModelSerializer):
             "modified": {"read_only": True},
             "organization": {"write_only": True},
         }
+        list_serializer_class = MemberPreviewListSerializer
 
 
-class SimpleOrganizationUserSerializer(serializers.ModelSerializer):
+class SimpleOrganizationUserSerializer(InstrumentedModelSerializer):
     class Meta:
         model = OrganizationUser
         fields = [
@@ -85,7 +127,7 @@ class SimpleOrganizationUserSerializer(serializers.ModelSerializer):
         }
 
 
-class SimpleOrganizationOwnerSerializer(serializers.ModelSerializer):
+class SimpleOrganizationOwnerSerializer(InstrumentedModelSerializer):
     class Meta:
         model = OrganizationOwner
         fields = [
@@ -101,10 +143,13 @@ class SimpleOrganizationOwnerSerializer(serializers.ModelSerializer):
         }
 
 
-class OrganizationOwnerSerializer(serializers.ModelSerializer):
+class OrganizationOwnerSerializer(InstrumentedModelSerializer):
     organization_user_nested = SimpleOrganizationUserSerializer(
         source="organization_user", read_only=True
     )
+    user_nested = ProfileSerializer(
+        source="organization_user.user", read_only=True
+    )
     organization_nested = OrganizationSerializer(
         source="organization", read_only=True
     )
@@ -115,6 +160,7 @@ class OrganizationOwnerSerializer(serializers.ModelSerializer):
             "id",
             "organization_user",
             "organization_user_nested",
+            "user_nested",
             "organization",
             "organization_nested",
             "created",
@@ -128,30 +174,104 @@ class OrganizationOwnerSerializer(serializers.ModelSerializer):
         }
 
 
-class SimpleTeamSerializer(serializers.ModelSerializer):
+class SimpleTeamSerializer(InstrumentedModelSerializer):
     class Meta:
         model = models.Team
-        fields = ["id", "organization", "name"]
+        fields = ["id", "organization", "name", "created", "modified"]
+        extra_kwargs = {
+            "created": {"read_only": True},
+            "modified": {"read_only": True},
+        }
 
 
-class TeamSerializer(serializers.ModelSerializer):
+class TeamSerializer(InstrumentedModelSerializer):
     organization_nested = OrganizationSerializer(
         source="organization", read_only=True
     )
+    member_preview_source = "organization"
 
     class Meta:
         model = models.Team
-        fields = ["id", "organization", "organization_nested", "name"]
-        extra_kwargs = {"organization": {"write_only": True}}
+        fields = [
+            "id",
+            "organization",
+            "organization_nested",
+            "name",
+            "created",
+            "modified",
+        ]
+        extra_kwargs = {
+            "organization": {"write_only": True},
+            "created": {"read_only": True},
+            "modified": {"read_only": True},
+        }
+        list_serializer_class = MemberPreviewListSerializer
+
+
+class TeamBulkOperationSerializer(serializers.Serializer):
+    """A team creation, rename or deletion of a bulk request."""
+
+    CREATE = "create"
+    RENAME = "rename"
+    DELETE = "delete"
+    REQUIRED_FIELDS = {
+        CREATE: ["organization", "name"],
+        RENAME: ["id", "name"],
+        DELETE: ["id"],
+    }
+
+    action = serializers.ChoiceField(choices=[CREATE, RENAME, DELETE])
+    id = serializers.IntegerField(required=False)
+    organization = serializers.IntegerField(required=False)
+    name = serializers.CharField(
+        max_length=models.Team._meta.get_field("name").max_length,
+        required=False,
+    )
+
+    def validate(self, data):
+        missing = {
+            field: ["This field is required."]
+            for field in self.REQUIRED_FIELDS[data["action"]]
+            if field not in data
+        }
+        if missing:
+            raise serializers.ValidationError(missing)
+        return data
+
+
+class TeamBulkSerializer(serializers.Serializer):
+    operations = TeamBulkOperationSerializer(many=True)
+
+    def validate_operations(self, operations):
+        if not operations:
+            raise serializers.ValidationError("No operations were given.")
+        if len(operations) > settings.TEAM_BULK_MAX_OPERATIONS:
+            raise serializers.ValidationError(
+                "At most {} operations can be applied at once.".format(
+                    settings.TEAM_BULK_MAX_OPERATIONS
+                )
+            )
+        return operations
 
 
-class SimpleTeamMemberSerializer(serializers.ModelSerializer):
+class SimpleTeamMemberSerializer(InstrumentedModelSerializer):
     class Meta:
         model = models.TeamMember
-        fields = ["id", "team", "organization_user", "is_admin"]
+        fields = [
+            "id",
+            "team",
+            "organization_user",
+            "is_admin",
+            "created",
+            "modified",
+        ]
+        extra_kwargs = {
+            "created": {"read_only": True},
+            "modified": {"read_only": True},
+        }
 
 
-class TeamMemberSerializer(serializers.ModelSerializer):
+class TeamMemberSerializer(InstrumentedModelSerializer):
     organization_user_nested = OrganizationUserSerializer(
         source="organization_user", read_only=True
     )
@@ -0,0 +1,69 @@
+from django.test import override_settings
+from rest_framework.reverse import reverse
+from rest_framework.test import APITestCase, APIClient
+from rest_framework import status
+
+from model_mommy import mommy
+from organizations.models import Organization
+
+from employee_management_backend.companies.events import publish_event
+
+
+class OrganizationEventStreamTestCase(APITestCase):
+    """
+    Test suite for the Organization event stream api view.
+    """
+
+    def setUp(self):
+        """
+        Define the test client and other test variables.
+        """
+
+        self.api_version = "v1"
+        self.new_user = mommy.make("users.User")
+        self.new_organization = Organization.objects.create(
+            name="Test Organization(Events)"
+        )
+        self.new_organization.get_or_add_user(self.new_user)
+
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.new_user)
+        self.url = reverse(
+            "companies:organization-events", args=[self.api_version]
+        )
+
+    @override_settings(ORGANIZATION_EVENTS_HEARTBEAT=0.01)
+    def test_event_stream(self):
+        """
+        Test that published events are sent on the stream.
+        """
+
+        response = self.client.get(
+            self.url,
+            {"organization_id": self.new_organization.id},
+            HTTP_ACCEPT="text/event-stream",
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "text/event-stream")
+
+        chunks = iter(response.streaming_content)
+        self.assertTrue(next(chunks).startswith(b"retry:"))
+        self.assertEqual(next(chunks), b": keep-alive\n\n")
+        publish_event(self.new_organization.id, {"event": "team.created"})
+        self.assertEqual(next(chunks), b'data: {"event": "team.created"}\n\n')
+        response.close()
+
+    def test_non_member_event_stream(self):
+        """
+        Test if the api can raise error if a user who is not part of the
+        organization requests its event stream.
+        """
+
+        new_client = APIClient()
+        new_client.force_authenticate(user=mommy.make("users.User"))
+        new_response = new_client.get(
+            self.url,
+            {"organization_id": self.new_organization.id},
+            HTTP_ACCEPT="text/event-stream",
+        )
+        self.assertEqual(new_response.status_code, status.HTTP_404_NOT_FOUND)
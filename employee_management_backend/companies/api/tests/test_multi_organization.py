@@ -0,0 +1,130 @@
+from unittest import mock
+
+from django.db import connection
+from rest_framework.reverse import reverse
+from rest_framework.test import APITestCase, APIClient
+from rest_framework import status
+
+from model_mommy import mommy
+from organizations.models import Organization
+
+from employee_management_backend.companies import models
+
+
+class MultiOrganizationListTestCase(APITestCase):
+    """
+    Test suite for listing objects of several organizations at once.
+    """
+
+    def setUp(self):
+        """
+        Define the test client and other test variables.
+        """
+
+        self.user = mommy.make("users.User")
+        self.organizations = []
+        for number in range(3):
+            organization = Organization.objects.create(
+                name="Test Organization(Multi) {}".format(number)
+            )
+            organization.get_or_add_user(self.user)
+            organization.get_or_add_user(mommy.make("users.User"))
+            models.Team.objects.create(
+                name="Test Team(Multi) {}".format(number),
+                organization=organization,
+            )
+            self.organizations.append(organization)
+        # An organization the user is not part of.
+        self.other = Organization.objects.create(
+            name="Test Organization(Multi Other)"
+        )
+        self.other.get_or_add_user(mommy.make("users.User"))
+        models.Team.objects.create(
+            name="Test Team(Multi Other)", organization=self.other
+        )
+
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    def get(self, name, organization_id, version="v2"):
+        return self.client.get(
+            reverse(name, args=[version]), {"organization_id": organization_id}
+        )
+
+    def get_organization_ids(self, response, version="v2"):
+        field = "organization_nested" if version == "v2" else "organization"
+        return {
+            item[field]["id"] if version == "v2" else item[field]
+            for item in response.json()["results"]
+        }
+
+    def test_list_organization_ids(self):
+        """
+        Test that objects of several organizations are listed together.
+        """
+
+        organization_id = "{},{},{}".format(
+            self.organizations[0].id, self.organizations[2].id, self.other.id
+        )
+        for version in ["v1", "v2"]:
+            response = self.get(
+                "companies:teams-list", organization_id, version
+            )
+
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual(response.json()["count"], 2)
+            self.assertEqual(
+                self.get_organization_ids(response, version),
+                {self.organizations[0].id, self.organizations[2].id},
+            )
+
+    def test_list_all_organizations(self):
+        """
+        Test that "all" lists objects of every organization of the user.
+        """
+
+        for name, count in [
+            ("companies:teams-list", 3),
+            ("companies:organization-users-list", 6),
+        ]:
+            response = self.get(name, "all")
+
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual(response.json()["count"], count)
+            self.assertEqual(
+                self.get_organization_ids(response),
+                {organization.id for organization in self.organizations},
+            )
+
+    def test_list_all_organizations_queries(self):
+        """
+        Test that listing all organizations does not query each of them.
+        """
+
+        # Previews are ranked with a window function, which SQLite supports
+        # since 3.25 unbeknownst to Django 2.0.
+        with mock.patch.object(
+            connection.features, "supports_over_clause", True
+        ):
+            self.get("companies:organization-users-list", "all")
+            # The count and page, the member counts and previews, inside the
+            # request's savepoint.
+            with self.assertNumQueries(6):
+                self.get("companies:organization-users-list", "all")
+
+    def test_list_invalid_organization_ids(self):
+        """
+        Test that a list of organization IDs with other values is rejected.
+        """
+
+        for view_name in [
+            "companies:teams-list",
+            "companies:organization-users-list",
+        ]:
+            response = self.get(
+                view_name, "{},abc".format(self.organizations[0].id)
+            )
+
+            self.assertEqual(
+                response.status_code, status.HTTP_400_BAD_REQUEST, view_name
+            )
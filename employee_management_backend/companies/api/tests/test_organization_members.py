@@ -0,0 +1,195 @@
+from unittest import mock
+
+from django.db import connection
+from django.test import override_settings
+from rest_framework.reverse import reverse
+from rest_framework.test import APITestCase, APIClient
+from rest_framework import status
+
+from model_mommy import mommy
+from organizations.models import Organization
+
+from employee_management_backend.companies import models
+from employee_management_backend.companies.members import get_member_previews
+
+
+@override_settings(ORGANIZATION_MEMBER_PREVIEW_SIZE=2)
+class OrganizationMembersTestCase(APITestCase):
+    """
+    Test suite for the bounded organization member listings.
+    """
+
+    def setUp(self):
+        """
+        Define the test client and other test variables.
+        """
+
+        self.user = mommy.make("users.User")
+        self.organization = Organization.objects.create(
+            name="Test Organization(Members)"
+        )
+        self.organization.get_or_add_user(self.user)
+        self.members = mommy.make("users.User", _quantity=4)
+        for member in self.members:
+            self.organization.get_or_add_user(member)
+        self.team = models.Team.objects.create(
+            name="Test Team(Members)", organization=self.organization
+        )
+
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    def add_organization(self, members):
+        organization = Organization.objects.create(
+            name="Test Organization(Members) {}".format(
+                Organization.objects.count()
+            )
+        )
+        organization.get_or_add_user(self.user)
+        for member in mommy.make("users.User", _quantity=members):
+            organization.get_or_add_user(member)
+        models.Team.objects.create(
+            name="Test Team(Members)", organization=organization
+        )
+        return organization
+
+    def assert_preview(self, organization):
+        self.assertEqual(organization["member_count"], 5)
+        self.assertEqual(
+            [user["id"] for user in organization["users_nested"]],
+            [self.user.id, self.members[0].id],
+        )
+
+    def test_organization_list(self):
+        """
+        Test that organizations carry their member count and first members.
+        """
+
+        response = self.client.get(
+            reverse("companies:organizations-list", args=["v2"])
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assert_preview(response.json()["results"][0])
+
+    def test_organization_detail(self):
+        """
+        Test that organization details carry a member preview.
+        """
+
+        response = self.client.get(
+            reverse(
+                "companies:organizations-detail",
+                args=["v2", self.organization.id],
+            )
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assert_preview(response.json())
+
+    def test_nested_organizations(self):
+        """
+        Test that teams and organization users embed the member preview.
+        """
+
+        for name in [
+            "companies:teams-list",
+            "companies:organization-users-list",
+        ]:
+            response = self.client.get(
+                "{}?organization_id={}".format(
+                    reverse(name, args=["v2"]), self.organization.id
+                )
+            )
+
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            for item in response.json()["results"]:
+                self.assert_preview(item["organization_nested"])
+
+    def test_organization_list_queries(self):
+        """
+        Test that listing organizations takes the same number of queries
+        whatever the number and size of the organizations.
+        """
+
+        url = reverse("companies:organizations-list", args=["v2"])
+        self.add_organization(1)
+        # SQLite supports window functions since 3.25, Django 2.0 does not
+        # know it.
+        with mock.patch.object(
+            connection.features, "supports_over_clause", True
+        ):
+            self.client.get(url)
+            # The count and page of organizations, their member counts and
+            # previews, inside the request's savepoint.
+            with self.assertNumQueries(6):
+                self.client.get(url)
+
+            self.add_organization(10)
+            self.add_organization(3)
+            with self.assertNumQueries(6):
+                response = self.client.get(url)
+        self.assertEqual(
+            sorted(
+                organization["member_count"]
+                for organization in response.json()["results"]
+            ),
+            [2, 4, 5, 11],
+        )
+
+    def test_members(self):
+        """
+        Test that the members endpoint pages through every member.
+        """
+
+        url = reverse(
+            "companies:organizations-members",
+            args=["v2", self.organization.id],
+        )
+
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["count"], 5)
+        self.assertEqual(
+            [user["id"] for user in response.json()["results"]],
+            [self.user.id] + [member.id for member in self.members],
+        )
+
+    def test_members_not_member(self):
+        """
+        Test that members of other organizations cannot be listed.
+        """
+
+        organization = Organization.objects.create(
+            name="Test Organization(Members Other)"
+        )
+
+        response = self.client.get(
+            reverse(
+                "companies:organizations-members", args=["v2", organization.id]
+            )
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_window_function_previews(self):
+        """
+        Test that previews ranked with a window function match the ones
+        fetched per organization.
+        """
+
+        other = self.add_organization(3)
+        ids = [self.organization.id, other.id]
+        expected = get_member_previews(ids, 2)
+
+        with mock.patch.object(
+            connection.features, "supports_over_clause", True
+        ):
+            with self.assertNumQueries(1):
+                previews = get_member_previews(ids, 2)
+
+        self.assertEqual(previews, expected)
+        self.assertEqual(
+            [len(previews[organization_id]) for organization_id in ids], [2, 2]
+        )
@@ -0,0 +1,73 @@
+from django.test import override_settings
+from rest_framework.reverse import reverse
+from rest_framework.test import APITestCase, APIClient
+from rest_framework import status
+
+from model_mommy import mommy
+from organizations.models import Organization
+
+
+@override_settings(ORGANIZATION_MEMBER_PREVIEW_SIZE=2)
+class OrganizationOwnerDetailTestCase(APITestCase):
+    """
+    Test suite for the v2 Organization Owner details.
+    """
+
+    def setUp(self):
+        """
+        Define the test client and other test variables.
+        """
+
+        self.owner = mommy.make("users.User")
+        self.organization = Organization.objects.create(
+            name="Test Organization(Owner Detail)"
+        )
+        self.organization.get_or_add_user(self.owner)
+        self.members = mommy.make("users.User", _quantity=4)
+        for member in self.members:
+            self.organization.get_or_add_user(member)
+
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.owner)
+        self.url = "{}?organization_id={}".format(
+            reverse("companies:organization-owner", args=["v2"]),
+            self.organization.id,
+        )
+
+    def test_owner_detail(self):
+        """
+        Test that the owner details carry a bounded member preview.
+        """
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["user_nested"]["id"], self.owner.id)
+        organization = response.json()["organization_nested"]
+        self.assertEqual(organization["id"], self.organization.id)
+        self.assertEqual(organization["member_count"], 5)
+        self.assertEqual(
+            [user["id"] for user in organization["users_nested"]],
+            [self.owner.id, self.members[0].id],
+        )
+
+    def test_owner_detail_queries(self):
+        """
+        Test that the owner details take the same number of queries whatever
+        the size of the organization.
+        """
+
+        self.client.get(self.url)
+        # The owner with its user, organization and member count, then the
+        # member preview, inside the request's savepoint.
+        with self.assertNumQueries(4):
+            self.client.get(self.url)
+
+        for member in mommy.make("users.User", _quantity=10):
+            self.organization.get_or_add_user(member)
+
+        with self.assertNumQueries(4):
+            response = self.client.get(self.url)
+        self.assertEqual(
+            response.json()["organization_nested"]["member_count"], 15
+        )
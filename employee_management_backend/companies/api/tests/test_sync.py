@@ -0,0 +1,135 @@
+from rest_framework.reverse import reverse
+from rest_framework.test import APITestCase, APIClient
+from rest_framework import status
+
+from model_mommy import mommy
+from organizations.models import Organization
+
+from employee_management_backend.companies.models import Team, TeamMember
+
+
+class OrganizationSyncTestCase(APITestCase):
+    """
+    Test suite for the Organization delta sync api view.
+    """
+
+    def setUp(self):
+        """
+        Define the test client and other test variables.
+        """
+
+        self.api_version = "v1"
+        self.new_user = mommy.make("users.User")
+        self.new_organization = Organization.objects.create(
+            name="Test Organization(Sync)"
+        )
+        self.new_organization.get_or_add_user(self.new_user)
+        self.new_team = mommy.make(
+            "companies.Team", organization=self.new_organization
+        )
+
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.new_user)
+        self.url = reverse(
+            "companies:organization-sync", args=[self.api_version]
+        )
+
+    def sync(self, since=None):
+        params = {"organization_id": self.new_organization.id}
+        if since is not None:
+            params["since"] = since
+        return self.client.get(self.url, params)
+
+    def test_full_sync(self):
+        """
+        Test that a sync without a cursor returns every object as changed.
+        """
+
+        response = self.sync()
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            len(response.json()["organization_users"]["changed"]), 1
+        )
+        self.assertEqual(
+            response.json()["teams"]["changed"][0]["id"], self.new_team.id
+        )
+        self.assertEqual(response.json()["teams"]["deleted"], [])
+
+    def test_delta_sync(self):
+        """
+        Test that a sync with a cursor returns changes and deletions made
+        since the cursor only.
+        """
+
+        cursor = self.sync().json()["cursor"]
+        Team.objects.filter(id=self.new_team.id).update(
+            modified=self.new_team.modified.replace(year=2000)
+        )
+        new_team_member = mommy.make(
+            "companies.TeamMember",
+            team=self.new_team,
+            organization_user=self.new_organization.organization_users.get(),
+        )
+        removed_team = mommy.make(
+            "companies.Team", organization=self.new_organization
+        )
+        removed_team_id = removed_team.id
+        removed_team.delete()
+
+        response = self.sync(since=cursor)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["teams"]["changed"], [])
+        self.assertEqual(
+            response.json()["teams"]["deleted"], [removed_team_id]
+        )
+        self.assertEqual(
+            [
+                team_member["id"]
+                for team_member in response.json()["team_members"]["changed"]
+            ],
+            [new_team_member.id],
+        )
+
+    def test_team_member_deletion_sync(self):
+        """
+        Test that team members removed through a team cascade are reported as
+        deleted.
+        """
+
+        new_team_member = mommy.make(
+            "companies.TeamMember",
+            team=self.new_team,
+            organization_user=self.new_organization.organization_users.get(),
+        )
+        cursor = self.sync().json()["cursor"]
+        self.new_team.delete()
+
+        response = self.sync(since=cursor)
+
+        self.assertFalse(TeamMember.objects.exists())
+        self.assertEqual(
+            response.json()["team_members"]["deleted"], [new_team_member.id]
+        )
+
+    def test_invalid_cursor_sync(self):
+        """
+        Test if the api can raise error if the cursor is not valid.
+        """
+
+        response = self.sync(since="yesterday")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_non_member_sync(self):
+        """
+        Test if the api can raise error if a user who is not part of the
+        organization tries to sync it.
+        """
+
+        new_client = APIClient()
+        new_client.force_authenticate(user=mommy.make("users.User"))
+        new_response = new_client.get(
+            self.url, {"organization_id": self.new_organization.id}
+        )
+        self.assertEqual(new_response.status_code, status.HTTP_404_NOT_FOUND)
@@ -0,0 +1,181 @@
+from django.test import override_settings
+from rest_framework.reverse import reverse
+from rest_framework.test import APITestCase, APIClient
+from rest_framework import status
+
+from model_mommy import mommy
+from organizations.models import Organization
+
+from employee_management_backend.companies import models
+
+
+class TeamBulkTestCase(APITestCase):
+    """
+    Test suite for bulk team changes.
+    """
+
+    def setUp(self):
+        """
+        Define the test client and other test variables.
+        """
+
+        self.user = mommy.make("users.User")
+        self.organization = Organization.objects.create(
+            name="Test Organization(Bulk)"
+        )
+        # The first user is the organization owner.
+        self.organization.get_or_add_user(self.user)
+        self.other = Organization.objects.create(
+            name="Test Organization(Bulk Other)"
+        )
+        self.other.get_or_add_user(mommy.make("users.User"))
+        self.other.get_or_add_user(self.user)
+        self.team = models.Team.objects.create(
+            name="Test Team(Bulk)", organization=self.organization
+        )
+        self.deleted_team = models.Team.objects.create(
+            name="Test Team(Bulk Deleted)", organization=self.organization
+        )
+
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+        self.url = reverse("companies:teams-bulk", args=["v2"])
+
+    def test_bulk(self):
+        """
+        Test that teams are created, renamed and deleted together.
+        """
+
+        response = self.client.post(
+            self.url,
+            {
+                "operations": [
+                    {
+                        "action": "create",
+                        "organization": self.organization.id,
+                        "name": "Test Team(Bulk Created)",
+                    },
+                    {
+                        "action": "rename",
+                        "id": self.team.id,
+                        "name": "Test Team(Bulk Renamed)",
+                    },
+                    {"action": "delete", "id": self.deleted_team.id},
+                ]
+            },
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        results = response.json()["results"]
+        self.assertEqual(
+            [result["status"] for result in results], [201, 200, 204]
+        )
+        created = models.Team.objects.get(id=results[0]["data"]["id"])
+        self.assertEqual(created.name, "Test Team(Bulk Created)")
+        self.assertEqual(created.organization, self.organization)
+        self.team.refresh_from_db()
+        self.assertEqual(self.team.name, "Test Team(Bulk Renamed)")
+        self.assertEqual(results[1]["data"]["name"], "Test Team(Bulk Renamed)")
+        self.assertFalse(
+            models.Team.objects.filter(id=self.deleted_team.id).exists()
+        )
+        self.assertTrue(
+            models.Tombstone.objects.filter(
+                object_type=models.Tombstone.TEAM,
+                object_id=self.deleted_team.id,
+            ).exists()
+        )
+
+    def test_bulk_not_allowed(self):
+        """
+        Test that no operation is applied when one of them is not allowed.
+        """
+
+        other_team = models.Team.objects.create(
+            name="Test Team(Bulk Other)", organization=self.other
+        )
+
+        response = self.client.post(
+            self.url,
+            {
+                "operations": [
+                    {
+                        "action": "rename",
+                        "id": self.team.id,
+                        "name": "Test Team(Bulk Renamed)",
+                    },
+                    {"action": "delete", "id": other_team.id},
+                    {"action": "delete", "id": 0},
+                ]
+            },
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            [result["status"] for result in response.json()["results"]],
+            [200, 403, 404],
+        )
+        self.team.refresh_from_db()
+        self.assertEqual(self.team.name, "Test Team(Bulk)")
+        self.assertTrue(models.Team.objects.filter(id=other_team.id).exists())
+
+    def test_bulk_invalid(self):
+        """
+        Test that operations missing their fields are rejected.
+        """
+
+        response = self.client.post(
+            self.url,
+            {"operations": [{"action": "rename", "id": self.team.id}]},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("name", response.json()["operations"][0])
+
+    @override_settings(TEAM_BULK_MAX_OPERATIONS=1)
+    def test_bulk_too_many_operations(self):
+        """
+        Test that requests with too many operations are rejected.
+        """
+
+        response = self.client.post(
+            self.url,
+            {
+                "operations": [
+                    {"action": "delete", "id": self.team.id},
+                    {"action": "delete", "id": self.deleted_team.id},
+                ]
+            },
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(models.Team.objects.count(), 2)
+
+    def test_bulk_queries(self):
+        """
+        Test that renaming more teams does not take more queries.
+        """
+
+        def rename(teams):
+            return self.client.post(
+                self.url,
+                {
+                    "operations": [
+                        {"action": "rename", "id": team.id, "name": "Renamed"}
+                        for team in teams
+                    ]
+                },
+                format="json",
+            )
+
+        # The teams, the permissions and the update, inside the request's
+        # savepoint and the bulk transaction's.
+        with self.assertNumQueries(7):
+            rename([self.team])
+        with self.assertNumQueries(7):
+            response = rename([self.team, self.deleted_team])
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
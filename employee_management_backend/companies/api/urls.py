@@ -23,4 +23,19 @@ urlpatterns = [
         views.OrganizationOwnerAPIView.as_view(),
         name="organization-owner",
     ),
+    path(
+        "organization-deletions/<str:task_id>/",
+        views.OrganizationDeletionAPIView.as_view(),
+        name="organization-deletion",
+    ),
+    path(
+        "organization-sync/",
+        views.OrganizationSyncAPIView.as_view(),
+        name="organization-sync",
+    ),
+    path(
+        "organization-events/",
+        views.OrganizationEventStreamAPIView.as_view(),
+        name="organization-events",
+    ),
 ]
@@ -1,9 +1,28 @@
+import datetime
+import time
+
+from celery.result import AsyncResult
+from celery.utils import uuid
+from django.conf import settings
 from django.contrib.sites.shortcuts import get_current_site
+from django.db import connections, transaction
 from django.db.utils import IntegrityError
+from django.http import StreamingHttpResponse
 from django.shortcuts import get_object_or_404
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
 
+from employee_management_backend.caching.idempotency import idempotent
 from employee_management_backend.companies import models
-from employee_management_backend.companies.api import serializers
+from employee_management_backend.companies.api import renderers, serializers
+from employee_management_backend.companies.events import get_event_broker
+from employee_management_backend.companies import archival, tasks, teams
+from employee_management_backend.companies.members import (
+    get_members,
+    member_count_subquery,
+)
+from employee_management_backend.formats.renderers import JSONRenderer
+from employee_management_backend.users.api.serializers import ProfileSerializer
 from employee_management_backend.users.models import User
 
 from organizations.backends import invitation_backend
@@ -14,22 +33,34 @@ from organizations.models import (
 )
 
 from rest_framework import views, viewsets, status, exceptions
+from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.settings import api_settings
 
+# organization_id value listing the objects of all the user's organizations.
+ALL_ORGANIZATIONS = "all"
+
 
 class BaseListRetrieveWithOrganizationID:
     """Add organization_id get parameter to list and retrieve methods.
 
     # Methods
 
+    ## get_organization_lookup:
+    * Used by get_queryset to filter objects by the organization_id parameter.
+    * When listing, organization_id may also be a comma separated list of
+      organization IDs, or "all" for all the organizations of the user. Objects
+      of every requested organization are listed and paginated together.
+
     ## list:
     * GET list Endpoint.
-    * Displays objects of a single organization (The organization_id get
-      parameter is used to filter the organisation) that the user is part of.
+    * Displays objects of the organizations (The organization_id get
+      parameter is used to filter the organisations) that the user is part of.
     ## Returns
     * List of objects.
     ## Raises
+    * status.HTTP_400_BAD_REQUEST
+        * If organization_id is a list with values that are not IDs.
     * status.HTTP_401_UNAUTHORIZED
         * If request is from anonymous user.
 
@@ -48,6 +79,26 @@ class BaseListRetrieveWithOrganizationID:
           the organization.
     """
 
+    def get_organization_lookup(self, organization_id):
+        if self.action == "list" and isinstance(organization_id, str):
+            if organization_id == ALL_ORGANIZATIONS:
+                # Filtering on the user's memberships is left to get_queryset.
+                return {}
+            if "," in organization_id:
+                try:
+                    organization_ids = {
+                        int(value)
+                        for value in organization_id.split(",")
+                        if value.strip()
+                    }
+                except ValueError:
+                    raise exceptions.ValidationError(
+                        "organization_id must be a comma separated list of "
+                        "organization IDs or {}.".format(ALL_ORGANIZATIONS)
+                    )
+                return {"organization_id__in": organization_ids}
+        return {"organization_id": organization_id}
+
     def list(self, request, *args, **kwargs):
         if request.user.is_authenticated:
             organization_id = self.request.query_params.get(
@@ -92,6 +143,8 @@ class OrganizationViewSet(viewsets.ModelViewSet):
     * Creates an organization and adds the authenticated user that has created
       the organization as an organization user and organization owner if he/she
       is a staff member.
+    * A request sent with the Idempotency-Key header of an earlier one
+      returns the earlier one's response, see caching.idempotency.
     ### Returns
     * Created Organization with status rest_framework.status.HTTP_201_CREATED.
     ### Raises
@@ -101,6 +154,10 @@ class OrganizationViewSet(viewsets.ModelViewSet):
         * If post data for POST request is not valid.
     * status.HTTP_403_FORBIDDEN
         * If user trying to create the organization is not a staff member.
+    * status.HTTP_409_CONFLICT
+        * If a request with the same Idempotency-Key is still being processed.
+    * status.HTTP_422_UNPROCESSABLE_ENTITY
+        * If the Idempotency-Key was used with different data.
 
     ## update:
     * PUT/PATCH Organization details Endpoint.
@@ -124,8 +181,12 @@ class OrganizationViewSet(viewsets.ModelViewSet):
     * DELETE Organization details Endpoint.
     * Used to delete an Organization Object if the authenticated user trying to
       delete the organization is a staff member.
+    * The organization is marked inactive at once and purged with everything
+      cascading from it by a background task, whose progress is reported by
+      the organization deletion endpoint.
     ### Returns
-    * Empty with status rest_framework.status.HTTP_204_NO_CONTENT.
+    * The id of the deletion task with status
+      rest_framework.status.HTTP_202_ACCEPTED.
     ### Raises
     * status.HTTP_401_UNAUTHORIZED
         * If request is from anonymous user.
@@ -134,6 +195,19 @@ class OrganizationViewSet(viewsets.ModelViewSet):
           organization owner.
     * status.HTTP_404_NOT_FOUND
         * If user trying to delete object is not an organization user.
+
+    ## members:
+    * GET Organization members Endpoint.
+    * Paginated list of all the members of an organization that the
+      authenticated user is part of, in the order they joined. Organization
+      details only include a preview of the first members.
+    ### Returns
+    * List of users.
+    ### Raises
+    * status.HTTP_401_UNAUTHORIZED
+        * If request is from anonymous user.
+    * status.HTTP_404_NOT_FOUND
+        * If user is not an organization user of the organization.
     """
 
     queryset = Organization.objects.all().order_by("-created")
@@ -145,13 +219,9 @@ class OrganizationViewSet(viewsets.ModelViewSet):
 
     def get_queryset(self):
         if self.request.user.is_authenticated:
-            if self.request.version == "v1":
-                return self.queryset.filter(users=self.request.user)
-            else:
-                return self.queryset.filter(
-                    users=self.request.user
-                ).prefetch_related("users")
+            return self.queryset.filter(users=self.request.user)
 
+    @idempotent
     def create(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
@@ -198,13 +268,34 @@ class OrganizationViewSet(viewsets.ModelViewSet):
         if request.user.is_authenticated:
             organization = get_object_or_404(self.get_queryset(), id=pk)
             if request.user.is_staff:
-                organization.delete()
+                organization.is_active = False
+                organization.save(update_fields=["is_active", "modified"])
+                task_id = uuid()
+                transaction.on_commit(
+                    lambda: tasks.delete_organization.apply_async(
+                        args=[organization.id], task_id=task_id
+                    )
+                )
             else:
                 raise exceptions.PermissionDenied(
                     "Only Staff Members can delete an organization!"
                 )
 
-            return Response(status=status.HTTP_204_NO_CONTENT)
+            return Response(
+                {"task_id": task_id}, status=status.HTTP_202_ACCEPTED
+            )
+        else:
+            raise exceptions.AuthenticationFailed()
+
+    @action(detail=True, methods=["get"])
+    def members(self, request, pk=None, *args, **kwargs):
+        if request.user.is_authenticated:
+            organization = get_object_or_404(self.get_queryset(), id=pk)
+            page = self.paginate_queryset(get_members(organization))
+            serializer = ProfileSerializer(
+                page, many=True, context=self.get_serializer_context()
+            )
+            return self.get_paginated_response(serializer.data)
         else:
             raise exceptions.AuthenticationFailed()
 
@@ -229,12 +320,14 @@ class OrganizationUserViewSet(
 
     ## list:
     * GET OrganizationUser list Endpoint.
-    * Displays OrganizationUser objects of a single organization (The
-      organization_id get parameter is used to filter the organisation) that
-      the user is part of.
+    * Displays OrganizationUser objects of one or more organizations (The
+      organization_id get parameter is used to filter the organisations, see
+      get_organization_lookup) that the user is part of.
     ### Returns
     * List of OrganizationUser objects.
     ### Raises
+    * status.HTTP_400_BAD_REQUEST
+        * If organization_id is a list with values that are not IDs.
     * status.HTTP_401_UNAUTHORIZED
         * If request is from anonymous user.
 
@@ -259,6 +352,8 @@ class OrganizationUserViewSet(
     * If user with email provided does not exist, it creates the user.
     * Send a notification email to this user to inform them that they have
       been added to a new organization.
+    * A request sent with the Idempotency-Key header of an earlier one
+      returns the earlier one's response, see caching.idempotency.
     ### Returns
     * Created OrganizationUser with status.HTTP_201_CREATED.
     ### Raises
@@ -269,6 +364,10 @@ class OrganizationUserViewSet(
     * status.HTTP_403_FORBIDDEN
         * If user trying to create object is not an organization user.
         * If user trying to create object is not an organization admin.
+    * status.HTTP_409_CONFLICT
+        * If a request with the same Idempotency-Key is still being processed.
+    * status.HTTP_422_UNPROCESSABLE_ENTITY
+        * If the Idempotency-Key was used with different data.
 
     ## update:
     * PUT/PATCH Organization details Endpoint.
@@ -299,6 +398,8 @@ class OrganizationUserViewSet(
         * An organization owner.
         * An organization user who is an administrator.
         * The one leaving the organization.
+    * The organization user and its team memberships are moved to the
+      membership history.
     ### Returns
     * Empty response with status rest_framework.status.HTTP_204_NO_CONTENT.
     ### Raises
@@ -311,7 +412,7 @@ class OrganizationUserViewSet(
         * If user trying to do a delete is not part of the organization.
     """
 
-    queryset = OrganizationUser.objects.all().order_by("-created")
+    queryset = OrganizationUser.objects.all().order_by("-created", "-id")
 
     def get_serializer_class(self):
         if self.request.version == "v1":
@@ -320,24 +421,23 @@ class OrganizationUserViewSet(
 
     def get_queryset(self, organization_id=None):
         if self.request.user.is_authenticated:
+            # Raises ValidationError for an invalid list of organization IDs.
+            organization_lookup = self.get_organization_lookup(organization_id)
             try:
                 if self.request.version == "v1":
                     return self.queryset.filter(
-                        organization_id=organization_id,
                         organization__users=self.request.user,
+                        **organization_lookup
                     )
                 else:
-                    return (
-                        self.queryset.filter(
-                            organization_id=organization_id,
-                            organization__users=self.request.user,
-                        )
-                        .select_related("user", "organization")
-                        .prefetch_related("organization__users")
-                    )
+                    return self.queryset.filter(
+                        organization__users=self.request.user,
+                        **organization_lookup
+                    ).select_related("user", "organization")
             except Exception:
                 return OrganizationUser.objects.none()
 
+    @idempotent
     def create(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
@@ -477,16 +577,16 @@ class OrganizationUserViewSet(
             organization = Organization.objects.get(id=organization_id)
             # Check if request.user is the organization owner
             if organization.owner.organization_user.user == request.user:
-                organization_user.delete()
+                archival.remove_organization_user(organization_user)
             # Check if the organization user being deleted is the request.user.
             elif organization_user.user == request.user:
-                organization_user.delete()
+                archival.remove_organization_user(organization_user)
             # Check if request.user is one of the organization's administrators
             elif request.user.organizations_organizationuser.get(
                 organization=organization
             ).is_admin:
                 # If that is true, the delete can proceed
-                organization_user.delete()
+                archival.remove_organization_user(organization_user)
             else:
                 raise exceptions.PermissionDenied(
                     "User is not allowed to delete this organization user!"
@@ -509,6 +609,9 @@ class OrganizationOwnerAPIView(views.APIView):
 
     get:
     # GET OrganizationOwner details Endpoint.
+    * v2 details nest the owning user and the organization with its
+      member_count and only its first ORGANIZATION_MEMBER_PREVIEW_SIZE members
+      as users_nested.
     # Returns
     * Details of a particular OrganizationOwner.
     # Raises
@@ -533,16 +636,19 @@ class OrganizationOwnerAPIView(views.APIView):
                     organization_user__user=self.request.user,
                 )
             else:
+                # The owner, the owning user and the organization with its
+                # member count are fetched in one query; the organization's
+                # first members are fetched by the serializer.
                 return (
                     self.queryset.filter(
                         organization_id=organization_id,
                         organization_user__user=self.request.user,
                     )
-                    .select_related("organization", "organization_user")
-                    .prefetch_related(
-                        "organization_user__user",
-                        "organization_user__organization",
-                        "organization__users",
+                    .select_related("organization", "organization_user__user")
+                    .annotate(
+                        organization_member_count=member_count_subquery(
+                            "organization_id"
+                        )
                     )
                 )
 
@@ -554,11 +660,232 @@ class OrganizationOwnerAPIView(views.APIView):
                 "organization_id", None
             )
             instance = get_object_or_404(self.get_queryset(organization_id))
+            if hasattr(instance, "organization_member_count"):
+                instance.organization.member_count = (
+                    instance.organization_member_count
+                )
             return Response(self.serializer_class(instance).data)
         else:
             raise exceptions.AuthenticationFailed()
 
 
+class OrganizationDeletionAPIView(views.APIView):
+    """Organization deletion progress Endpoint.
+
+    get:
+    # GET Organization deletion progress Endpoint.
+    * Reports the progress of the task purging a deleted organization, as
+      returned by the organization destroy endpoint.
+    * state is PENDING until the task starts, then PROGRESS with the number
+      of rows deleted so far per model, then SUCCESS with the totals or
+      FAILURE.
+    # Returns
+    * The state of the task and its progress.
+    # Raises
+    * status.HTTP_401_UNAUTHORIZED
+        * If request is from anonymous user.
+    * status.HTTP_403_FORBIDDEN
+        * If user is not a staff member.
+    """
+
+    def get(self, request, task_id, *args, **kwargs):
+        if request.user.is_authenticated:
+            if not request.user.is_staff:
+                raise exceptions.PermissionDenied(
+                    "Only Staff Members can delete an organization!"
+                )
+            result = AsyncResult(task_id, app=tasks.delete_organization.app)
+            progress = result.info if isinstance(result.info, dict) else {}
+            return Response(
+                {
+                    "task_id": task_id,
+                    "state": result.state,
+                    "organization_id": progress.get("organization_id"),
+                    "deleted": progress.get("deleted", {}),
+                }
+            )
+        else:
+            raise exceptions.AuthenticationFailed()
+
+
+class OrganizationSyncAPIView(views.APIView):
+    """Organization Delta Sync Endpoint.
+
+    get:
+    # GET changes made in an organization since a cursor.
+    * The organization_id get parameter is used to select the organization,
+      which the authenticated user must be part of.
+    * The since get parameter is the cursor returned by the previous sync. If
+      it is not provided every object is returned as changed.
+    * Cursors are UTC timestamps and are set slightly in the past so that
+      changes committed while a sync is running are sent again on the next
+      sync rather than missed. Clients should therefore upsert changes.
+    * Objects are always represented with their v1 (non nested) details.
+    # Returns
+    * The next cursor and, for organization users, teams and team members,
+      the objects created or updated and the ids of the objects deleted since
+      the cursor.
+    # Raises
+    * status.HTTP_400_BAD_REQUEST
+        * If the since get parameter is not a valid cursor.
+    * status.HTTP_401_UNAUTHORIZED
+        * If request is from anonymous user.
+    * status.HTTP_404_NOT_FOUND
+        * If user is not part of the organization.
+    """
+
+    cursor_format = "%Y-%m-%dT%H:%M:%S.%fZ"
+    cursor_margin = datetime.timedelta(seconds=5)
+
+    def get_since(self):
+        since = self.request.query_params.get("since", None)
+        if not since:
+            return None
+        try:
+            value = parse_datetime(since)
+        except ValueError:
+            value = None
+        if value is None:
+            raise exceptions.ValidationError(
+                "since must be a cursor returned by a previous sync!"
+            )
+        if timezone.is_naive(value):
+            value = timezone.make_aware(value, timezone.utc)
+        return value
+
+    def get_changes(self, organization, since):
+        sources = (
+            (
+                "organization_users",
+                OrganizationUser.objects.filter(organization=organization),
+                serializers.SimpleOrganizationUserSerializer,
+                models.Tombstone.ORGANIZATION_USER,
+            ),
+            (
+                "teams",
+                models.Team.objects.filter(organization=organization),
+                serializers.SimpleTeamSerializer,
+                models.Tombstone.TEAM,
+            ),
+            (
+                "team_members",
+                models.TeamMember.objects.filter(
+                    team__organization=organization
+                ),
+                serializers.SimpleTeamMemberSerializer,
+                models.Tombstone.TEAM_MEMBER,
+            ),
+        )
+        changes = {}
+        for key, queryset, serializer_class, object_type in sources:
+            deleted = models.Tombstone.objects.filter(
+                organization_id=organization.id, object_type=object_type
+            )
+            if since is None:
+                deleted = deleted.none()
+            else:
+                queryset = queryset.filter(modified__gte=since)
+                deleted = deleted.filter(deleted__gte=since)
+            changes[key] = {
+                "changed": serializer_class(
+                    queryset.order_by("modified", "id"), many=True
+                ).data,
+                "deleted": sorted(
+                    set(deleted.values_list("object_id", flat=True))
+                ),
+            }
+        return changes
+
+    def get(self, request, *args, **kwargs):
+        if request.user.is_authenticated:
+            organization = get_object_or_404(
+                Organization.objects.filter(users=request.user),
+                id=self.request.query_params.get("organization_id", None),
+            )
+            since = self.get_since()
+            cursor = timezone.now() - self.cursor_margin
+            data = {
+                "cursor": cursor.astimezone(timezone.utc).strftime(
+                    self.cursor_format
+                )
+            }
+            data.update(self.get_changes(organization, since))
+            return Response(data)
+        else:
+            raise exceptions.AuthenticationFailed()
+
+
+class OrganizationEventStreamAPIView(views.APIView):
+    """Organization Membership Event Stream Endpoint.
+
+    get:
+    # GET a server-sent events stream of changes made in an organization.
+    * The organization_id get parameter is used to select the organization,
+      which the authenticated user must be part of.
+    * Sends an event whenever an organization user, organization owner, team
+      or team member of the organization is created, updated or deleted.
+      Each event's data is a JSON object with the event name (for example
+      team_member.created), the organization_id and the v1 details of the
+      object (only the id for deleted objects).
+    * A comment is sent every ORGANIZATION_EVENTS_HEARTBEAT seconds to keep
+      the connection open and the stream ends after
+      ORGANIZATION_EVENTS_STREAM_TIMEOUT seconds, after which clients
+      reconnect. Changes made while a client is disconnected are not
+      replayed, clients should catch up through the sync endpoint.
+    # Returns
+    * A text/event-stream response.
+    # Raises
+    * status.HTTP_401_UNAUTHORIZED
+        * If request is from anonymous user.
+    * status.HTTP_404_NOT_FOUND
+        * If user is not part of the organization.
+    """
+
+    renderer_classes = [JSONRenderer, renderers.EventStreamRenderer]
+    # Responses are streamed, they cannot be batched.
+    streaming = True
+    # Milliseconds clients wait before reconnecting.
+    retry = 3000
+
+    def stream(self, organization_id):
+        timeout = settings.ORGANIZATION_EVENTS_STREAM_TIMEOUT
+        heartbeat = settings.ORGANIZATION_EVENTS_HEARTBEAT
+        deadline = time.monotonic() + timeout
+        # The stream does not use the database: the request's connections,
+        # and their connection slots, are released while it runs.
+        for connection in connections.all():
+            if not connection.in_atomic_block:
+                connection.close()
+        yield "retry: {}\n\n".format(self.retry)
+        messages = get_event_broker().subscribe(organization_id, heartbeat)
+        try:
+            for message in messages:
+                if message is None:
+                    yield ": keep-alive\n\n"
+                else:
+                    yield "data: {}\n\n".format(message)
+                if time.monotonic() >= deadline:
+                    break
+        finally:
+            messages.close()
+
+    def get(self, request, *args, **kwargs):
+        if request.user.is_authenticated:
+            organization = get_object_or_404(
+                Organization.objects.filter(users=request.user),
+                id=self.request.query_params.get("organization_id", None),
+            )
+            response = StreamingHttpResponse(
+                self.stream(organization.id), content_type="text/event-stream"
+            )
+            response["Cache-Control"] = "no-cache"
+            # Stop proxies from buffering the stream.
+            response["X-Accel-Buffering"] = "no"
+            return response
+        else:
+            raise exceptions.AuthenticationFailed()
+
+
 class TeamViewSet(BaseListRetrieveWithOrganizationID, viewsets.ModelViewSet):
     """Team Management Viewset.
 
@@ -577,11 +904,14 @@ class TeamViewSet(BaseListRetrieveWithOrganizationID, viewsets.ModelViewSet):
 
     ## list:
     * GET Team list Endpoint.
-    * Displays Team objects of a single organization (The organization_id get
-      parameter is used to filter the organisation) that the user is part of.
+    * Displays Team objects of one or more organizations (The organization_id
+      get parameter is used to filter the organisations, see
+      get_organization_lookup) that the user is part of.
     ### Returns
     * List of Team objects.
     ### Raises
+    * status.HTTP_400_BAD_REQUEST
+        * If organization_id is a list with values that are not IDs.
     * status.HTTP_401_UNAUTHORIZED
         * If request is from anonymous user.
 
@@ -604,6 +934,8 @@ class TeamViewSet(BaseListRetrieveWithOrganizationID, viewsets.ModelViewSet):
     * Adds Team.
     * Adds a Team if the authenticated user is an organization owner or
       administrator in the organization in which the Team is created in.
+    * A request sent with the Idempotency-Key header of an earlier one
+      returns the earlier one's response, see caching.idempotency.
     ### Returns
     * Created Team with status.HTTP_201_CREATED.
     ### Raises
@@ -616,6 +948,10 @@ class TeamViewSet(BaseListRetrieveWithOrganizationID, viewsets.ModelViewSet):
           user in the organization in which the event is being created.
         * If authenticated user creating the team is not an organization
           admin in the organization in which the event is being created.
+    * status.HTTP_409_CONFLICT
+        * If a request with the same Idempotency-Key is still being processed.
+    * status.HTTP_422_UNPROCESSABLE_ENTITY
+        * If the Idempotency-Key was used with different data.
 
     ## update:
     * PUT/PATCH Team details Endpoint.
@@ -652,6 +988,26 @@ class TeamViewSet(BaseListRetrieveWithOrganizationID, viewsets.ModelViewSet):
           administrator or owner.
     * status.HTTP_404_NOT_FOUND
         * If user trying to do a delete is not part of the organization.
+
+    ## bulk:
+    * POST Team bulk changes Endpoint.
+    * Applies a list of operations, each creating a team ("action": "create",
+      "organization" and "name"), renaming one ("action": "rename", "id" and
+      "name") or deleting one ("action": "delete" and "id"), in one
+      transaction. Permissions are checked once per organization: the
+      authenticated user must be an organization administrator or owner of the
+      organization of every team.
+    * Either all the operations are applied or none of them is.
+    ### Returns
+    * A result per operation, in order, with its status and for created or
+      renamed teams the team details.
+    ### Raises
+    * status.HTTP_401_UNAUTHORIZED
+        * If request is from anonymous user.
+    * status.HTTP_400_BAD_REQUEST
+        * If post data for POST request is not valid.
+        * If any operation cannot be applied. The result of each failing
+          operation then has its status and errors.
     """
 
     queryset = models.Team.objects.all().order_by("-id")
@@ -666,19 +1022,16 @@ class TeamViewSet(BaseListRetrieveWithOrganizationID, viewsets.ModelViewSet):
         if self.request.user.is_authenticated:
             if self.request.version == "v1":
                 return self.queryset.filter(
-                    organization_id=organization_id,
                     organization__users=self.request.user,
+                    **self.get_organization_lookup(organization_id)
                 )
             else:
-                return (
-                    self.queryset.filter(
-                        organization_id=organization_id,
-                        organization__users=self.request.user,
-                    )
-                    .select_related("organization")
-                    .prefetch_related("organization__users")
-                )
+                return self.queryset.filter(
+                    organization__users=self.request.user,
+                    **self.get_organization_lookup(organization_id)
+                ).select_related("organization")
 
+    @idempotent
     def create(self, request, *args, **kwargs):
         if request.user.is_authenticated:
             serializer = self.get_serializer(data=request.data)
@@ -782,3 +1135,111 @@ class TeamViewSet(BaseListRetrieveWithOrganizationID, viewsets.ModelViewSet):
             return Response(status=status.HTTP_204_NO_CONTENT)
         else:
             raise exceptions.AuthenticationFailed()
+
+    @action(detail=False, methods=["post"])
+    def bulk(self, request, *args, **kwargs):
+        if request.user.is_authenticated:
+            serializer = serializers.TeamBulkSerializer(data=request.data)
+            serializer.is_valid(raise_exception=True)
+            operations = serializer.validated_data["operations"]
+            Operation = serializers.TeamBulkOperationSerializer
+
+            existing = models.Team.objects.filter(
+                id__in=[
+                    operation["id"]
+                    for operation in operations
+                    if operation["action"] != Operation.CREATE
+                ],
+                organization__users=request.user,
+            ).in_bulk()
+            rights = teams.get_management_rights(
+                request.user,
+                {
+                    operation["organization"]
+                    for operation in operations
+                    if operation["action"] == Operation.CREATE
+                }
+                | {team.organization_id for team in existing.values()},
+            )
+
+            results = []
+            created, renamed, deleted = [], [], []
+            seen = set()
+            for operation in operations:
+                if operation["action"] == Operation.CREATE:
+                    team = models.Team(
+                        organization_id=operation["organization"],
+                        name=operation["name"],
+                    )
+                else:
+                    team = existing.get(operation["id"])
+                    if team is None:
+                        results.append(
+                            {
+                                "status": status.HTTP_404_NOT_FOUND,
+                                "errors": ["Team not found."],
+                            }
+                        )
+                        continue
+                    if team.id in seen:
+                        results.append(
+                            {
+                                "status": status.HTTP_400_BAD_REQUEST,
+                                "errors": [
+                                    "Team is changed by another operation."
+                                ],
+                            }
+                        )
+                        continue
+                    seen.add(team.id)
+
+                if team.organization_id not in rights:
+                    results.append(
+                        {
+                            "status": status.HTTP_404_NOT_FOUND,
+                            "errors": [
+                                "User is not a part of the organization "
+                                "specified!"
+                            ],
+                        }
+                    )
+                elif not rights[team.organization_id]:
+                    results.append(
+                        {
+                            "status": status.HTTP_403_FORBIDDEN,
+                            "errors": [
+                                "User is not allowed to change the teams of "
+                                "this organization!"
+                            ],
+                        }
+                    )
+                elif operation["action"] == Operation.CREATE:
+                    created.append(team)
+                    results.append({"status": status.HTTP_201_CREATED})
+                elif operation["action"] == Operation.RENAME:
+                    team.name = operation["name"]
+                    renamed.append(team)
+                    results.append({"status": status.HTTP_200_OK})
+                else:
+                    deleted.append(team)
+                    results.append({"status": status.HTTP_204_NO_CONTENT})
+
+            if any("errors" in result for result in results):
+                return Response(
+                    {"results": results}, status=status.HTTP_400_BAD_REQUEST
+                )
+
+            with transaction.atomic():
+                teams.create_teams(created)
+                teams.rename_teams(renamed)
+                teams.delete_teams(deleted)
+
+            changed = iter(created + renamed)
+            for result in results:
+                if result["status"] != status.HTTP_204_NO_CONTENT:
+                    result["data"] = serializers.SimpleTeamSerializer(
+                        next(changed)
+                    ).data
+            return Response({"results": results})
+        else:
+            raise exceptions.AuthenticationFailed()
@@ -3,3 +3,6 @@ from django.apps import AppConfig
 
 class CompaniesConfig(AppConfig):
     name = "employee_management_backend.companies"
+
+    def ready(self):
+        from employee_management_backend.companies import signals  # noqa F401
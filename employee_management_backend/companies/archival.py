@@ -0,0 +1,115 @@
+"""
+Removal and archival of organization users and team members.
+
+Team members are soft deleted: their deleted timestamp is set, which hides
+them from TeamMember.objects, and they are kept in the team member table for
+MEMBERSHIP_ARCHIVE_AFTER_DAYS before archive_team_members moves them to the
+membership history table, so that the team member table only holds current
+members.
+
+Organization users belong to django-organizations and cannot be given a
+deleted timestamp, so an organization user that leaves is moved to the
+history table at once, along with all of its team memberships.
+
+Removed members are reported as deleted to the sync and event endpoints when
+they are removed, not when they are archived, nor when they are deleted with
+their team, which moves them to the history first.
+"""
+import datetime
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from employee_management_backend.companies.deletion import delete_chunk
+from employee_management_backend.companies.models import (
+    MembershipHistory,
+    TeamMember,
+)
+from employee_management_backend.companies.signals import report_deletion
+
+
+def remove_team_members(queryset):
+    """Soft delete the team members of queryset."""
+    removed = timezone.now()
+    members = list(queryset.filter(deleted__isnull=True))
+    TeamMember.all_objects.filter(
+        pk__in=[member.pk for member in members]
+    ).update(deleted=removed, modified=removed)
+    for member in members:
+        member.deleted = member.modified = removed
+        report_deletion(TeamMember, member)
+    return members
+
+
+def get_team_member_history(member):
+    return MembershipHistory(
+        organization_id=member.team.organization_id,
+        object_type=MembershipHistory.TEAM_MEMBER,
+        object_id=member.id,
+        user_id=member.organization_user.user_id,
+        team_id=member.team_id,
+        is_admin=member.is_admin,
+        joined=member.created,
+        departed=member.deleted,
+    )
+
+
+def remove_organization_user(organization_user):
+    """Move an organization user and its team memberships to the history."""
+    with transaction.atomic():
+        remove_team_members(
+            TeamMember.objects.filter(organization_user=organization_user)
+        )
+        members = list(
+            TeamMember.all_objects.filter(
+                organization_user=organization_user
+            ).select_related("team", "organization_user")
+        )
+        MembershipHistory.objects.bulk_create(
+            [get_team_member_history(member) for member in members]
+            + [
+                MembershipHistory(
+                    organization_id=organization_user.organization_id,
+                    object_type=MembershipHistory.ORGANIZATION_USER,
+                    object_id=organization_user.id,
+                    user_id=organization_user.user_id,
+                    is_admin=organization_user.is_admin,
+                    joined=organization_user.created,
+                    departed=timezone.now(),
+                )
+            ]
+        )
+        if members:
+            # Already reported as deleted, so they are not deleted through
+            # the cascade, which would report them again.
+            delete_chunk(TeamMember, [member.id for member in members])
+        organization_user.delete()
+
+
+def archive_team_members(before=None, chunk_size=None):
+    """
+    Move the team members removed before the given time to the history.
+
+    Yield the number of team members archived after every chunk.
+    """
+    if before is None:
+        before = timezone.now() - datetime.timedelta(
+            days=settings.MEMBERSHIP_ARCHIVE_AFTER_DAYS
+        )
+    chunk_size = chunk_size or settings.MEMBERSHIP_ARCHIVE_CHUNK_SIZE
+    queryset = (
+        TeamMember.all_objects.filter(deleted__lt=before)
+        .select_related("team", "organization_user")
+        .order_by("deleted", "id")
+    )
+    while True:
+        members = list(queryset[:chunk_size])
+        if not members:
+            break
+        with transaction.atomic():
+            MembershipHistory.objects.bulk_create(
+                [get_team_member_history(member) for member in members]
+            )
+            delete_chunk(TeamMember, [member.id for member in members])
+        yield len(members)
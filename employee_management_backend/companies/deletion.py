@@ -0,0 +1,92 @@
+"""
+Chunked deletion of organizations.
+
+Deleting an organization with Organization.delete() makes Django's collector
+load every object cascading from it into memory, and send signals for each,
+before deleting anything. Instead the objects cascading from the organization
+are found from the model relations, ordered so that dependents come before
+the objects they depend on, and deleted in chunks of
+ORGANIZATION_DELETION_CHUNK_SIZE rows, each chunk in its own transaction so
+that locks are held briefly. The organization itself, along with anything
+created while it was being purged, is then deleted the usual way.
+
+Raw deletes send no signals, so no tombstones are recorded for the deleted
+objects and the organization's existing tombstones are purged too: the sync
+endpoint has nothing to report for an organization that no longer exists. So
+is the organization's membership history.
+"""
+from django.conf import settings
+from django.db import connections, models, router, transaction
+
+from organizations.models import Organization
+
+from employee_management_backend.companies.models import (
+    MembershipHistory,
+    Tombstone,
+)
+
+
+def get_cascade_paths(model, path=None, ancestors=()):
+    """
+    Return the (model, lookup) of every model whose rows are deleted with a
+    row of model, dependents first. The lookup filters the rows by the id of
+    the row of model.
+    """
+    paths = []
+    for relation in model._meta.related_objects:
+        related_model = relation.related_model
+        if (
+            relation.on_delete is not models.CASCADE
+            or related_model._meta.proxy
+            or related_model in ancestors
+        ):
+            continue
+        lookup = relation.field.name
+        if path:
+            lookup = "{}__{}".format(lookup, path)
+        paths += get_cascade_paths(related_model, lookup, ancestors + (model,))
+        paths.append((related_model, lookup))
+    return paths
+
+
+def delete_chunk(model, ids):
+    using = router.db_for_write(model)
+    quote_name = connections[using].ops.quote_name
+    with transaction.atomic(using=using):
+        with connections[using].cursor() as cursor:
+            cursor.execute(
+                "DELETE FROM {} WHERE {} IN ({})".format(
+                    quote_name(model._meta.db_table),
+                    quote_name(model._meta.pk.column),
+                    ", ".join(["%s"] * len(ids)),
+                ),
+                ids,
+            )
+
+
+def purge_organization(organization_id, chunk_size=None):
+    """
+    Delete an organization and everything cascading from it.
+
+    Yield (model label, rows deleted) after every chunk.
+    """
+    chunk_size = chunk_size or settings.ORGANIZATION_DELETION_CHUNK_SIZE
+    for model, lookup in get_cascade_paths(Organization):
+        queryset = (
+            model._base_manager.filter(**{lookup: organization_id})
+            .order_by()
+            .values_list("pk", flat=True)
+        )
+        while True:
+            ids = list(queryset[:chunk_size])
+            if not ids:
+                break
+            delete_chunk(model, ids)
+            yield model._meta.label, len(ids)
+
+    Tombstone.objects.filter(organization_id=organization_id).delete()
+    MembershipHistory.objects.filter(organization_id=organization_id).delete()
+    organization = Organization.objects.filter(id=organization_id).first()
+    if organization is not None:
+        organization.delete()
+    yield Organization._meta.label, int(organization is not None)
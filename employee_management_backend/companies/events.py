@@ -0,0 +1,117 @@
+"""
+Publishing and subscribing to organization membership change events.
+
+Events are published per organization to a broker configured with the
+ORGANIZATION_EVENTS_BROKER setting. RedisEventBroker fans events out to every
+process through Redis pub/sub while LocalEventBroker keeps them in the current
+process, which is enough for tests and the development server.
+
+Events are published once the change has been committed: a broker failing to
+publish one logs the error, the change itself having been saved.
+"""
+import json
+import logging
+import queue
+import threading
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+logger = logging.getLogger(__name__)
+
+CHANNEL_PREFIX = "organization-events"
+
+
+def get_channel(organization_id):
+    return "{}:{}".format(CHANNEL_PREFIX, organization_id)
+
+
+class LocalEventBroker:
+    """In-process broker used as a stand-in for Redis."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.subscribers = {}
+
+    def publish(self, organization_id, event):
+        message = json.dumps(event)
+        with self.lock:
+            subscribers = list(
+                self.subscribers.get(get_channel(organization_id), [])
+            )
+        for subscriber in subscribers:
+            subscriber.put(message)
+
+    def subscribe(self, organization_id, timeout):
+        """Yield published messages, or None every timeout seconds."""
+        channel = get_channel(organization_id)
+        subscriber = queue.Queue()
+        with self.lock:
+            self.subscribers.setdefault(channel, []).append(subscriber)
+        try:
+            while True:
+                try:
+                    yield subscriber.get(timeout=timeout)
+                except queue.Empty:
+                    yield None
+        finally:
+            with self.lock:
+                self.subscribers[channel].remove(subscriber)
+                if not self.subscribers[channel]:
+                    del self.subscribers[channel]
+
+
+class RedisEventBroker:
+    """Broker publishing events through Redis pub/sub."""
+
+    def __init__(self):
+        import redis
+
+        self.client = redis.StrictRedis.from_url(
+            settings.ORGANIZATION_EVENTS_REDIS_URL
+        )
+
+    def publish(self, organization_id, event):
+        import redis
+
+        try:
+            self.client.publish(
+                get_channel(organization_id), json.dumps(event)
+            )
+        except redis.RedisError:
+            logger.exception(
+                "Publishing the %s event of organization %s failed",
+                event["event"],
+                organization_id,
+            )
+
+    def subscribe(self, organization_id, timeout):
+        """Yield published messages, or None every timeout seconds."""
+        pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+        pubsub.subscribe(get_channel(organization_id))
+        try:
+            while True:
+                message = pubsub.get_message(timeout=timeout)
+                if message is None:
+                    yield None
+                else:
+                    yield message["data"].decode("utf-8")
+        finally:
+            pubsub.close()
+
+
+_broker = None
+_broker_lock = threading.Lock()
+
+
+def get_event_broker():
+    global _broker
+    if _broker is None:
+        with _broker_lock:
+            if _broker is None:
+                _broker = import_string(settings.ORGANIZATION_EVENTS_BROKER)()
+    return _broker
+
+
+def publish_event(organization_id, event):
+    get_event_broker().publish(organization_id, event)
@@ -0,0 +1,94 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Count
+from rest_framework import renderers, serializers
+
+from organizations.models import Organization, OrganizationUser
+
+from employee_management_backend.companies.api.serializers import (
+    SimpleOrganizationUserSerializer,
+)
+from employee_management_backend.formats.backends import get_backend
+from employee_management_backend.formats.renderers import JSONRenderer
+
+
+class StrftimeOrganizationUserSerializer(SimpleOrganizationUserSerializer):
+    serializer_field_mapping = (
+        serializers.ModelSerializer.serializer_field_mapping
+    )
+
+
+class Command(BaseCommand):
+    help = (
+        "Time serializing and rendering as JSON the organization users of an "
+        "organization, the largest by default, with REST framework's fields "
+        "and renderer and with the project's."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--organization-id", type=int)
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=5,
+            help="Times every step is run, the fastest run is reported.",
+        )
+
+    def handle(self, *args, **options):
+        organizations = Organization.objects.all()
+        if options["organization_id"]:
+            organizations = organizations.filter(id=options["organization_id"])
+        organization = (
+            organizations.annotate(members=Count("organization_users"))
+            .order_by("-members")
+            .first()
+        )
+        if organization is None:
+            raise CommandError("No organization to benchmark.")
+        organization_users = list(
+            OrganizationUser.objects.filter(organization=organization)
+        )
+        self.stdout.write(
+            "{} organization users of {}".format(
+                len(organization_users), organization
+            )
+        )
+
+        data = SimpleOrganizationUserSerializer(
+            organization_users, many=True
+        ).data
+        backend = get_backend()
+        steps = [
+            (
+                "serialize, strftime",
+                lambda: StrftimeOrganizationUserSerializer(
+                    organization_users, many=True
+                ).data,
+            ),
+            (
+                "serialize",
+                lambda: SimpleOrganizationUserSerializer(
+                    organization_users, many=True
+                ).data,
+            ),
+            (
+                "render, REST framework",
+                lambda: renderers.JSONRenderer().render(data),
+            ),
+            (
+                "render, {}".format(
+                    type(backend).__name__ if backend else "no backend"
+                ),
+                lambda: JSONRenderer().render(data),
+            ),
+        ]
+        for name, step in steps:
+            durations = []
+            for _ in range(options["repeat"]):
+                start = time.perf_counter()
+                step()
+                durations.append(time.perf_counter() - start)
+            self.stdout.write(
+                "{:<30} {:>10.2f}ms".format(name, min(durations) * 1000)
+            )
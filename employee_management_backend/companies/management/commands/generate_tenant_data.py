@@ -0,0 +1,317 @@
+import random
+import time
+import uuid
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+
+from organizations.models import (
+    Organization,
+    OrganizationOwner,
+    OrganizationUser,
+)
+
+from employee_management_backend.companies.models import Team, TeamMember
+from employee_management_backend.companies2.models import CompanyTeam
+from employee_management_backend.users.models import Address
+
+CITIES = ["Nairobi", "Mombasa", "Kisumu", "Nakuru", "Eldoret", "Thika"]
+COUNTRIES = ["Kenya", "Uganda", "Tanzania", "Rwanda"]
+
+
+class Command(BaseCommand):
+    help = (
+        "Generate synthetic organizations, members, teams, addresses and "
+        "company teams with bulk inserts. Organization sizes follow a "
+        "Zipf-like distribution: the largest has --max-members members and "
+        "the k-th largest about max-members / k ** skew."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--organizations", type=int, default=10)
+        parser.add_argument("--max-members", type=int, default=500)
+        parser.add_argument("--min-members", type=int, default=2)
+        parser.add_argument(
+            "--skew",
+            type=float,
+            default=1.0,
+            help="Exponent of the size distribution, 0 for equal sizes.",
+        )
+        parser.add_argument(
+            "--team-size",
+            type=int,
+            default=8,
+            help="Average number of members per team.",
+        )
+        parser.add_argument(
+            "--max-addresses",
+            type=int,
+            default=2,
+            help="Maximum number of addresses per user.",
+        )
+        parser.add_argument(
+            "--max-company-teams",
+            type=int,
+            default=3,
+            help="Maximum number of companies2 teams per organization.",
+        )
+        parser.add_argument(
+            "--password",
+            default="password",
+            help="Password of every generated user.",
+        )
+        parser.add_argument(
+            "--prefix",
+            help="Prefix of generated names, random by default so that the "
+            "command can be run repeatedly.",
+        )
+        parser.add_argument("--seed", type=int, help="Random seed.")
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        if options["organizations"] < 1:
+            raise CommandError("--organizations must be at least 1.")
+        if options["min_members"] < 1:
+            raise CommandError("--min-members must be at least 1.")
+
+        self.random = random.Random(options["seed"])
+        self.batch_size = options["batch_size"]
+        self.prefix = options["prefix"] or "synthetic-{}".format(
+            uuid.uuid4().hex[:6]
+        )
+        started = time.monotonic()
+
+        sizes = self.get_sizes(
+            options["organizations"],
+            options["min_members"],
+            options["max_members"],
+            options["skew"],
+        )
+        with transaction.atomic():
+            users = self.create_users(sum(sizes), options["password"])
+            organizations = self.create_organizations(len(sizes))
+            members = self.create_members(organizations, users, sizes)
+            self.create_owners(members)
+            teams = self.create_teams(members, options["team_size"])
+            team_members = self.create_team_members(
+                teams, members, options["team_size"]
+            )
+            addresses = self.create_addresses(users, options["max_addresses"])
+            company_teams = self.create_company_teams(
+                organizations, options["max_company_teams"]
+            )
+
+        largest = organizations[0]
+        self.stdout.write(
+            self.style.SUCCESS(
+                "Generated {} organizations, {} users, {} teams, {} team "
+                "members, {} addresses and {} company teams in {:.1f}s with "
+                "prefix {}.".format(
+                    len(organizations),
+                    len(users),
+                    len(teams),
+                    team_members,
+                    addresses,
+                    company_teams,
+                    time.monotonic() - started,
+                    self.prefix,
+                )
+            )
+        )
+        self.stdout.write(
+            "Largest organization: id {} with {} members, administered by "
+            "{}.".format(largest.id, sizes[0], members[largest.id][0][1])
+        )
+
+    def get_sizes(self, count, min_members, max_members, skew):
+        return [
+            max(min_members, int(round(max_members / rank ** skew)))
+            for rank in range(1, count + 1)
+        ]
+
+    def bulk_create(self, model, objects):
+        # Django 2.0 lets an explicit batch size exceed the backend's limit
+        # on query parameters, so cap it the way bulk_create() would.
+        batch_size = min(
+            self.batch_size,
+            max(
+                connection.ops.bulk_batch_size(
+                    model._meta.concrete_fields, objects
+                ),
+                1,
+            ),
+        )
+        model.objects.bulk_create(objects, batch_size=batch_size)
+
+    def create_users(self, count, password):
+        User = get_user_model()
+        # Hashing is slow by design, so every user shares the same hash.
+        password = make_password(password)
+        usernames = [
+            "{}-user-{}".format(self.prefix, number) for number in range(count)
+        ]
+        self.bulk_create(
+            User,
+            [
+                User(
+                    username=username,
+                    email="{}@example.com".format(username),
+                    name="User {}".format(number),
+                    password=password,
+                )
+                for number, username in enumerate(usernames)
+            ],
+        )
+        # Primary keys are not set by bulk_create() on every backend.
+        ids = dict(
+            User.objects.filter(
+                username__startswith="{}-user-".format(self.prefix)
+            ).values_list("username", "id")
+        )
+        return [(ids[username], username) for username in usernames]
+
+    def create_organizations(self, count):
+        slugs = [
+            "{}-organization-{}".format(self.prefix, number)
+            for number in range(count)
+        ]
+        self.bulk_create(
+            Organization,
+            [
+                Organization(
+                    name="{} Organization {}".format(self.prefix, number),
+                    slug=slug,
+                )
+                for number, slug in enumerate(slugs)
+            ],
+        )
+        organizations = {
+            organization.slug: organization
+            for organization in Organization.objects.filter(slug__in=slugs)
+        }
+        return [organizations[slug] for slug in slugs]
+
+    def create_members(self, organizations, users, sizes):
+        """Return the (organization user id, username) of each organization."""
+        memberships = []
+        offset = 0
+        for organization, size in zip(organizations, sizes):
+            for position, (user_id, username) in enumerate(
+                users[offset : offset + size]
+            ):
+                memberships.append((organization.id, user_id, position == 0))
+            offset += size
+        self.bulk_create(
+            OrganizationUser,
+            [
+                OrganizationUser(
+                    organization_id=organization_id,
+                    user_id=user_id,
+                    is_admin=is_admin,
+                )
+                for organization_id, user_id, is_admin in memberships
+            ],
+        )
+
+        ids = {
+            (organization_id, user_id): member_id
+            for member_id, organization_id, user_id in (
+                OrganizationUser.objects.filter(
+                    organization__in=organizations
+                ).values_list("id", "organization_id", "user_id")
+            )
+        }
+        usernames = dict(users)
+        members = {}
+        for organization_id, user_id, is_admin in memberships:
+            members.setdefault(organization_id, []).append(
+                (ids[organization_id, user_id], usernames[user_id])
+            )
+        return members
+
+    def create_owners(self, members):
+        self.bulk_create(
+            OrganizationOwner,
+            [
+                OrganizationOwner(
+                    organization_id=organization_id,
+                    organization_user_id=organization_members[0][0],
+                )
+                for organization_id, organization_members in members.items()
+            ],
+        )
+
+    def create_teams(self, members, team_size):
+        self.bulk_create(
+            Team,
+            [
+                Team(
+                    organization_id=organization_id,
+                    name="Team {}".format(number),
+                )
+                for organization_id, organization_members in members.items()
+                for number in range(
+                    max(1, len(organization_members) // team_size)
+                )
+            ],
+        )
+        return list(
+            Team.objects.filter(organization_id__in=members).values_list(
+                "id", "organization_id"
+            )
+        )
+
+    def create_team_members(self, teams, members, team_size):
+        team_members = []
+        for team_id, organization_id in teams:
+            organization_members = members[organization_id]
+            size = min(
+                len(organization_members),
+                self.random.randint(1, 2 * team_size),
+            )
+            for position, (member_id, _) in enumerate(
+                self.random.sample(organization_members, size)
+            ):
+                team_members.append(
+                    TeamMember(
+                        team_id=team_id,
+                        organization_user_id=member_id,
+                        is_admin=position == 0,
+                    )
+                )
+        self.bulk_create(TeamMember, team_members)
+        return len(team_members)
+
+    def create_addresses(self, users, max_addresses):
+        addresses = [
+            Address(
+                user_id=user_id,
+                address1="{} Main Street".format(self.random.randint(1, 999)),
+                city=self.random.choice(CITIES),
+                country=self.random.choice(COUNTRIES),
+                postcode=str(self.random.randint(10000, 99999)),
+            )
+            for user_id, _ in users
+            for _ in range(self.random.randint(0, max_addresses))
+        ]
+        self.bulk_create(Address, addresses)
+        return len(addresses)
+
+    def create_company_teams(self, organizations, max_company_teams):
+        company_teams = [
+            CompanyTeam(
+                company_id=organization.id,
+                name="{} Company Team {}-{}".format(
+                    self.prefix, organization.id, number
+                ),
+                slug="{}-company-team-{}-{}".format(
+                    self.prefix, organization.id, number
+                ),
+            )
+            for organization in organizations
+            for number in range(self.random.randint(0, max_company_teams))
+        ]
+        self.bulk_create(CompanyTeam, company_teams)
+        return len(company_teams)
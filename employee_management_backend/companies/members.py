@@ -0,0 +1,139 @@
+"""
+Bounded member listings for organization representations.
+
+Organizations are represented with their member count and a preview of their
+first ORGANIZATION_MEMBER_PREVIEW_SIZE members, in the order they joined,
+rather than with every member, so that payloads and queries stay bounded
+whatever the size of the organizations. The full list is paginated
+separately.
+
+The previews of any number of organizations are fetched together: in one
+query ranking members with a window function where the database supports
+them, otherwise with one query per organization.
+"""
+from django.conf import settings
+from django.db import connection
+from django.db.models import Count, F, IntegerField, OuterRef, Subquery, Window
+from django.db.models.functions import Coalesce, RowNumber
+
+from organizations.models import OrganizationUser
+
+from employee_management_backend.users.models import User
+
+
+def get_preview_size():
+    return settings.ORGANIZATION_MEMBER_PREVIEW_SIZE
+
+
+def member_count_subquery(organization_ref="pk"):
+    """Return an expression counting the members of an outer organization."""
+    return Coalesce(
+        Subquery(
+            OrganizationUser.objects.filter(
+                organization=OuterRef(organization_ref)
+            )
+            .order_by()
+            .values("organization")
+            .annotate(count=Count("pk"))
+            .values("count"),
+            output_field=IntegerField(),
+        ),
+        0,
+    )
+
+
+def get_members(organization):
+    """Return the users of an organization in the order they joined."""
+    return User.objects.filter(
+        organizations_organizationuser__organization=organization
+    ).order_by("organizations_organizationuser__id")
+
+
+def get_member_counts(organization_ids):
+    return dict(
+        OrganizationUser.objects.filter(organization__in=organization_ids)
+        .order_by()
+        .values_list("organization")
+        .annotate(Count("pk"))
+    )
+
+
+def get_member_previews(organization_ids, size):
+    """Return the first size members of each organization, by id."""
+    if not connection.features.supports_over_clause:
+        return {
+            organization_id: list(get_members(organization_id)[:size])
+            for organization_id in organization_ids
+        }
+
+    ranked = (
+        OrganizationUser.objects.filter(organization__in=organization_ids)
+        .annotate(
+            position=Window(
+                RowNumber(),
+                partition_by=[F("organization_id")],
+                order_by=F("id").asc(),
+            )
+        )
+        .order_by()
+        .values("id", "position")
+    )
+    # Window functions cannot be filtered on directly, so the ranking is
+    # wrapped in a subquery. A RawSQL expression would be parenthesized
+    # twice as the right hand side of an "in" lookup, which makes it a
+    # scalar subquery, hence the extra() clause.
+    sql, params = ranked.query.sql_with_params()
+    quote_name = connection.ops.quote_name
+    first_members = (
+        "{table}.{id} IN (SELECT {id} FROM ({ranked}) {alias} "
+        "WHERE {position} <= %s)".format(
+            table=quote_name(OrganizationUser._meta.db_table),
+            id=quote_name("id"),
+            ranked=sql,
+            alias=quote_name("ranked"),
+            position=quote_name("position"),
+        )
+    )
+    previews = {organization_id: [] for organization_id in organization_ids}
+    for organization_user in (
+        OrganizationUser.objects.extra(
+            where=[first_members], params=params + (size,)
+        )
+        .select_related("user")
+        .order_by("id")
+    ):
+        previews[organization_user.organization_id].append(
+            organization_user.user
+        )
+    return previews
+
+
+def attach_member_previews(organizations):
+    """
+    Set member_count and member_preview on each organization.
+
+    Organizations may be repeated, as different instances, and counts already
+    annotated on an organization are kept.
+    """
+    organizations = [
+        organization
+        for organization in organizations
+        if organization is not None
+    ]
+    organization_ids = {organization.id for organization in organizations}
+    missing_counts = {
+        organization.id
+        for organization in organizations
+        if getattr(organization, "member_count", None) is None
+    }
+    counts = get_member_counts(missing_counts) if missing_counts else {}
+    previews = (
+        get_member_previews(organization_ids, get_preview_size())
+        if organization_ids
+        else {}
+    )
+    for organization in organizations:
+        if organization.id in missing_counts:
+            organization.member_count = counts.get(organization.id, 0)
+        organization.member_preview = previews[organization.id]
+    return organizations
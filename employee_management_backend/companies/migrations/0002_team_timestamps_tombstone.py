@@ -0,0 +1,97 @@
+# Generated by Django 2.0.13 on 2026-10-19 02:12
+
+from django.db import migrations, models
+import django.utils.timezone
+import organizations.fields
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [("companies", "0001_initial")]
+
+    operations = [
+        migrations.CreateModel(
+            name="Tombstone",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "organization_id",
+                    models.PositiveIntegerField(
+                        help_text="Organization that the deleted object belonged to.",
+                        verbose_name="organization id",
+                    ),
+                ),
+                (
+                    "object_type",
+                    models.CharField(
+                        choices=[
+                            ("organization_user", "organization user"),
+                            ("team", "team"),
+                            ("team_member", "team member"),
+                        ],
+                        help_text="Type of the deleted object.",
+                        max_length=20,
+                        verbose_name="object type",
+                    ),
+                ),
+                (
+                    "object_id",
+                    models.PositiveIntegerField(
+                        help_text="ID of the deleted object.",
+                        verbose_name="object id",
+                    ),
+                ),
+                (
+                    "deleted",
+                    organizations.fields.AutoCreatedField(
+                        default=django.utils.timezone.now,
+                        editable=False,
+                        verbose_name="deleted",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "tombstone",
+                "verbose_name_plural": "tombstones",
+            },
+        ),
+        migrations.AddField(
+            model_name="team",
+            name="created",
+            field=organizations.fields.AutoCreatedField(
+                default=django.utils.timezone.now, editable=False
+            ),
+        ),
+        migrations.AddField(
+            model_name="team",
+            name="modified",
+            field=organizations.fields.AutoLastModifiedField(
+                default=django.utils.timezone.now, editable=False
+            ),
+        ),
+        migrations.AddField(
+            model_name="teammember",
+            name="created",
+            field=organizations.fields.AutoCreatedField(
+                default=django.utils.timezone.now, editable=False
+            ),
+        ),
+        migrations.AddField(
+            model_name="teammember",
+            name="modified",
+            field=organizations.fields.AutoLastModifiedField(
+                default=django.utils.timezone.now, editable=False
+            ),
+        ),
+        migrations.AlterIndexTogether(
+            name="tombstone", index_together={("organization_id", "deleted")}
+        ),
+    ]
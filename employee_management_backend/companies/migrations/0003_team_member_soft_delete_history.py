@@ -0,0 +1,166 @@
+# Generated by Django 2.0.13 on 2026-10-19 02:47
+
+from django.db import migrations, models
+import django.db.models.manager
+
+# Indexes of the team members that have not been removed, which are the ones
+# queried, on the databases supporting partial indexes.
+PARTIAL_INDEXES = [
+    (
+        "companies_teammember_active_unique",
+        "CREATE UNIQUE INDEX {name} ON companies_teammember "
+        "(team_id, organization_user_id) WHERE deleted IS NULL",
+    ),
+    (
+        "companies_teammember_active_organization_user",
+        "CREATE INDEX {name} ON companies_teammember "
+        "(organization_user_id) WHERE deleted IS NULL",
+    ),
+]
+# History is appended in departure order, which a BRIN index summarizes in a
+# few pages on PostgreSQL.
+BRIN_INDEX = (
+    "companies_membershiphistory_departed_brin",
+    "CREATE INDEX {name} ON companies_membershiphistory USING brin (departed)",
+)
+
+
+def get_indexes(vendor):
+    indexes = []
+    if vendor in ("postgresql", "sqlite"):
+        indexes += PARTIAL_INDEXES
+    if vendor == "postgresql":
+        indexes.append(BRIN_INDEX)
+    return indexes
+
+
+def create_indexes(apps, schema_editor):
+    for name, sql in get_indexes(schema_editor.connection.vendor):
+        schema_editor.execute(sql.format(name=name))
+
+
+def drop_indexes(apps, schema_editor):
+    for name, sql in get_indexes(schema_editor.connection.vendor):
+        schema_editor.execute("DROP INDEX {}".format(name))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [("companies", "0002_team_timestamps_tombstone")]
+
+    operations = [
+        migrations.CreateModel(
+            name="MembershipHistory",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "organization_id",
+                    models.PositiveIntegerField(
+                        help_text="Organization that the member belonged to.",
+                        verbose_name="organization id",
+                    ),
+                ),
+                (
+                    "object_type",
+                    models.CharField(
+                        choices=[
+                            ("organization_user", "organization user"),
+                            ("team_member", "team member"),
+                        ],
+                        help_text="Type of the membership.",
+                        max_length=20,
+                        verbose_name="object type",
+                    ),
+                ),
+                (
+                    "object_id",
+                    models.PositiveIntegerField(
+                        help_text="ID of the membership.",
+                        verbose_name="object id",
+                    ),
+                ),
+                (
+                    "user_id",
+                    models.PositiveIntegerField(
+                        help_text="ID of the member's user.",
+                        verbose_name="user id",
+                    ),
+                ),
+                (
+                    "team_id",
+                    models.PositiveIntegerField(
+                        blank=True,
+                        help_text="Team of a team member.",
+                        null=True,
+                        verbose_name="team id",
+                    ),
+                ),
+                (
+                    "is_admin",
+                    models.BooleanField(
+                        help_text="Was the member an administrator.",
+                        verbose_name="is administrator",
+                    ),
+                ),
+                (
+                    "joined",
+                    models.DateTimeField(
+                        help_text="When the member joined.",
+                        verbose_name="joined",
+                    ),
+                ),
+                (
+                    "departed",
+                    models.DateTimeField(
+                        help_text="When the member left.",
+                        verbose_name="departed",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "membership history",
+                "verbose_name_plural": "membership history",
+            },
+        ),
+        migrations.AlterModelOptions(
+            name="teammember",
+            options={
+                "base_manager_name": "all_objects",
+                "verbose_name": "team member",
+                "verbose_name_plural": "team members",
+            },
+        ),
+        migrations.AlterModelManagers(
+            name="teammember",
+            managers=[
+                ("objects", django.db.models.manager.Manager()),
+                ("all_objects", django.db.models.manager.Manager()),
+            ],
+        ),
+        migrations.AddField(
+            model_name="teammember",
+            name="deleted",
+            field=models.DateTimeField(
+                blank=True,
+                help_text="When the team member was removed from the team, if it was.",
+                null=True,
+                verbose_name="deleted",
+            ),
+        ),
+        migrations.AlterUniqueTogether(
+            name="teammember", unique_together=set()
+        ),
+        migrations.AlterIndexTogether(
+            name="membershiphistory",
+            index_together={("organization_id", "departed")},
+        ),
+        migrations.RunPython(create_indexes, drop_indexes),
+    ]
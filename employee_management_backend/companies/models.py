@@ -2,6 +2,7 @@ from django.db import models
 from django.utils.translation import ugettext_lazy as _
 
 
+from organizations.fields import AutoCreatedField, AutoLastModifiedField
 from organizations.models import (
     Organization,
     OrganizationUser,
@@ -22,6 +23,8 @@ class Team(models.Model):
         help_text=_("The name of the team."),
         verbose_name=_("name"),
     )
+    created = AutoCreatedField()
+    modified = AutoLastModifiedField()
 
     class Meta:
         verbose_name = _("team")
@@ -31,6 +34,13 @@ class Team(models.Model):
         return f"Organization: {self.organization.name} Team: {self.name}"
 
 
+class TeamMemberManager(models.Manager):
+    """Manager of the team members that have not been removed."""
+
+    def get_queryset(self):
+        return super().get_queryset().filter(deleted__isnull=True)
+
+
 class TeamMember(models.Model):
     team = models.ForeignKey(
         Team,
@@ -52,9 +62,26 @@ class TeamMember(models.Model):
             "Is the employee/organization user an administrator of this team."
         ),
     )
+    created = AutoCreatedField()
+    modified = AutoLastModifiedField()
+    deleted = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name=_("deleted"),
+        help_text=_(
+            "When the team member was removed from the team, if it was."
+        ),
+    )
+
+    objects = TeamMemberManager()
+    all_objects = models.Manager()
 
     class Meta:
-        unique_together = (("team", "organization_user"),)
+        # Removed team members are kept until archived, so a member may be
+        # removed from a team then added again. The members of a team are
+        # unique among the ones that have not been removed, through a partial
+        # unique index created by migration 0003.
+        base_manager_name = "all_objects"
         verbose_name = _("team member")
         verbose_name_plural = _("team members")
 
@@ -64,3 +91,104 @@ class TeamMember(models.Model):
             self.team.name,
             self.organization_user.user.username,
         )
+
+
+class Tombstone(models.Model):
+    """Record of a deleted organization object, used by the sync endpoint.
+
+    The organization is stored as a plain id rather than a foreign key so that
+    tombstones written while an organization is being cascade deleted do not
+    reference a row that is about to disappear.
+    """
+
+    ORGANIZATION_USER = "organization_user"
+    TEAM = "team"
+    TEAM_MEMBER = "team_member"
+    OBJECT_TYPE_CHOICES = (
+        (ORGANIZATION_USER, _("organization user")),
+        (TEAM, _("team")),
+        (TEAM_MEMBER, _("team member")),
+    )
+
+    organization_id = models.PositiveIntegerField(
+        verbose_name=_("organization id"),
+        help_text=_("Organization that the deleted object belonged to."),
+    )
+    object_type = models.CharField(
+        choices=OBJECT_TYPE_CHOICES,
+        max_length=20,
+        verbose_name=_("object type"),
+        help_text=_("Type of the deleted object."),
+    )
+    object_id = models.PositiveIntegerField(
+        verbose_name=_("object id"), help_text=_("ID of the deleted object.")
+    )
+    deleted = AutoCreatedField(verbose_name=_("deleted"))
+
+    class Meta:
+        index_together = (("organization_id", "deleted"),)
+        verbose_name = _("tombstone")
+        verbose_name_plural = _("tombstones")
+
+    def __str__(self):
+        return "Organization: {} Deleted {}: {}".format(
+            self.organization_id, self.object_type, self.object_id
+        )
+
+
+class MembershipHistory(models.Model):
+    """Record of an organization user or team member that has left.
+
+    Rows are only ever added, in the order members left, and reference the
+    objects they describe by plain ids so that they outlive them.
+    """
+
+    ORGANIZATION_USER = "organization_user"
+    TEAM_MEMBER = "team_member"
+    OBJECT_TYPE_CHOICES = (
+        (ORGANIZATION_USER, _("organization user")),
+        (TEAM_MEMBER, _("team member")),
+    )
+
+    organization_id = models.PositiveIntegerField(
+        verbose_name=_("organization id"),
+        help_text=_("Organization that the member belonged to."),
+    )
+    object_type = models.CharField(
+        choices=OBJECT_TYPE_CHOICES,
+        max_length=20,
+        verbose_name=_("object type"),
+        help_text=_("Type of the membership."),
+    )
+    object_id = models.PositiveIntegerField(
+        verbose_name=_("object id"), help_text=_("ID of the membership.")
+    )
+    user_id = models.PositiveIntegerField(
+        verbose_name=_("user id"), help_text=_("ID of the member's user.")
+    )
+    team_id = models.PositiveIntegerField(
+        null=True,
+        blank=True,
+        verbose_name=_("team id"),
+        help_text=_("Team of a team member."),
+    )
+    is_admin = models.BooleanField(
+        verbose_name=_("is administrator"),
+        help_text=_("Was the member an administrator."),
+    )
+    joined = models.DateTimeField(
+        verbose_name=_("joined"), help_text=_("When the member joined.")
+    )
+    departed = models.DateTimeField(
+        verbose_name=_("departed"), help_text=_("When the member left.")
+    )
+
+    class Meta:
+        index_together = (("organization_id", "departed"),)
+        verbose_name = _("membership history")
+        verbose_name_plural = _("membership history")
+
+    def __str__(self):
+        return "Organization: {} Former {}: {}".format(
+            self.organization_id, self.object_type, self.object_id
+        )
@@ -0,0 +1,122 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from organizations.models import OrganizationOwner, OrganizationUser
+
+from employee_management_backend.companies.api import serializers
+from employee_management_backend.companies.events import publish_event
+from employee_management_backend.companies.models import (
+    MembershipHistory,
+    Team,
+    TeamMember,
+    Tombstone,
+)
+
+EVENT_SOURCES = {
+    OrganizationUser: (
+        "organization_user",
+        serializers.SimpleOrganizationUserSerializer,
+    ),
+    OrganizationOwner: (
+        "organization_owner",
+        serializers.SimpleOrganizationOwnerSerializer,
+    ),
+    Team: ("team", serializers.SimpleTeamSerializer),
+    TeamMember: ("team_member", serializers.SimpleTeamMemberSerializer),
+}
+TOMBSTONE_TYPES = {
+    OrganizationUser: Tombstone.ORGANIZATION_USER,
+    Team: Tombstone.TEAM,
+    TeamMember: Tombstone.TEAM_MEMBER,
+}
+
+
+def get_organization_id(instance):
+    if isinstance(instance, TeamMember):
+        # The team may already have been removed from the database as part of
+        # a cascade, so the organization is looked up without touching
+        # instance.team.
+        return (
+            Team.objects.filter(id=instance.team_id)
+            .values_list("organization_id", flat=True)
+            .first()
+        )
+    return instance.organization_id
+
+
+def publish_on_commit(organization_id, event):
+    transaction.on_commit(lambda: publish_event(organization_id, event))
+
+
+@receiver(post_save, sender=OrganizationUser)
+@receiver(post_save, sender=OrganizationOwner)
+@receiver(post_save, sender=Team)
+@receiver(post_save, sender=TeamMember)
+def publish_save_event(sender, instance, created, **kwargs):
+    organization_id = get_organization_id(instance)
+    if organization_id is None:
+        return
+    object_type, serializer_class = EVENT_SOURCES[sender]
+    publish_on_commit(
+        organization_id,
+        {
+            "event": "{}.{}".format(
+                object_type, "created" if created else "updated"
+            ),
+            "organization_id": organization_id,
+            "data": serializer_class(instance).data,
+        },
+    )
+
+
+@receiver(post_delete, sender=OrganizationUser)
+@receiver(post_delete, sender=OrganizationOwner)
+@receiver(post_delete, sender=Team)
+@receiver(post_delete, sender=TeamMember)
+def handle_deletion(sender, instance, **kwargs):
+    if sender is TeamMember and instance.deleted is not None:
+        # Removed team members were reported as deleted when removed, they
+        # are only deleted from the table now, by a cascade.
+        return
+    report_deletion(sender, instance)
+
+
+@receiver(pre_delete, sender=Team)
+def keep_removed_team_members(sender, instance, **kwargs):
+    """Move the removed members of a team to the history before it goes."""
+    # The archival module imports this one.
+    from employee_management_backend.companies.archival import (
+        get_team_member_history,
+    )
+
+    MembershipHistory.objects.bulk_create(
+        [
+            get_team_member_history(member)
+            for member in TeamMember.all_objects.filter(
+                team=instance, deleted__isnull=False
+            ).select_related("team", "organization_user")
+        ]
+    )
+
+
+def report_deletion(sender, instance):
+    """Record the tombstone of a deleted object and publish its event."""
+    organization_id = get_organization_id(instance)
+    if organization_id is None:
+        return
+    if sender in TOMBSTONE_TYPES:
+        Tombstone.objects.create(
+            organization_id=organization_id,
+            object_type=TOMBSTONE_TYPES[sender],
+            object_id=instance.id,
+        )
+    object_type, serializer_class = EVENT_SOURCES[sender]
+    publish_on_commit(
+        organization_id,
+        {
+            "event": "{}.deleted".format(object_type),
+            "organization_id": organization_id,
+            "data": {"id": instance.id},
+        },
+    )
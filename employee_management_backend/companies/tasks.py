@@ -0,0 +1,52 @@
+from celery.exceptions import SoftTimeLimitExceeded
+
+from employee_management_backend.companies.archival import (
+    archive_team_members as archive_removed_team_members,
+)
+from employee_management_backend.companies.deletion import purge_organization
+from employee_management_backend.taskapp.celery import app
+
+PROGRESS = "PROGRESS"
+
+
+@app.task(bind=True, max_retries=100)
+def delete_organization(self, organization_id, deleted=None):
+    """
+    Purge an organization and everything cascading from it, in chunks.
+
+    Progress is reported as the PROGRESS state of the task, with the number
+    of rows deleted per model. Purging can be resumed at any point, so when
+    the task runs out of time it is retried and picks up where it stopped.
+    """
+    deleted = deleted or {}
+    try:
+        for label, count in purge_organization(organization_id):
+            deleted[label] = deleted.get(label, 0) + count
+            if not self.request.called_directly and not self.request.is_eager:
+                self.update_state(
+                    state=PROGRESS,
+                    meta={
+                        "organization_id": organization_id,
+                        "deleted": deleted,
+                    },
+                )
+    except SoftTimeLimitExceeded:
+        # Without args the retry would reuse the request's, passing
+        # organization_id twice.
+        raise self.retry(
+            args=[organization_id], kwargs={"deleted": deleted}, countdown=0
+        )
+    return {"organization_id": organization_id, "deleted": deleted}
+
+
+@app.task
+def archive_team_members():
+    """Move the team members removed long ago to the membership history."""
+    archived = 0
+    try:
+        for count in archive_removed_team_members():
+            archived += count
+    except SoftTimeLimitExceeded:
+        # Archived chunks are committed, the rest is left to the next run.
+        pass
+    return archived
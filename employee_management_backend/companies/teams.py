@@ -0,0 +1,79 @@
+"""
+Bulk changes to teams.
+
+Teams are created with a single bulk insert and renamed with a single UPDATE,
+neither of which sends the post_save signal, so the events that the signal
+handlers would have published are published here. Deletions go through
+QuerySet.delete(), which sends post_delete for every team and so records
+their tombstones.
+"""
+from django.db import connection
+from django.db.models import Case, CharField, Exists, OuterRef, Value, When
+from django.utils import timezone
+
+from organizations.models import OrganizationOwner, OrganizationUser
+
+from employee_management_backend.companies.models import Team
+from employee_management_backend.companies.signals import publish_save_event
+
+
+def get_management_rights(user, organization_ids):
+    """
+    Return whether the user may manage the teams of each organization.
+
+    Organizations that the user is not part of are left out. Owners and
+    administrators of an organization may manage its teams.
+    """
+    memberships = (
+        OrganizationUser.objects.filter(
+            user=user, organization_id__in=organization_ids
+        )
+        .annotate(
+            is_owner=Exists(
+                OrganizationOwner.objects.filter(
+                    organization_user=OuterRef("pk")
+                )
+            )
+        )
+        .values_list("organization_id", "is_admin", "is_owner")
+    )
+    return {
+        organization_id: is_admin or is_owner
+        for organization_id, is_admin, is_owner in memberships
+    }
+
+
+def create_teams(teams):
+    if connection.features.can_return_ids_from_bulk_insert:
+        Team.objects.bulk_create(teams)
+        for team in teams:
+            publish_save_event(Team, team, created=True)
+    else:
+        # Without the ids of the inserted rows the teams could not be
+        # returned, so they are saved one by one.
+        for team in teams:
+            team.save()
+    return teams
+
+
+def rename_teams(teams):
+    """Save the names of teams in a single query."""
+    if not teams:
+        return teams
+    modified = timezone.now()
+    Team.objects.filter(id__in=[team.id for team in teams]).update(
+        name=Case(
+            *[When(id=team.id, then=Value(team.name)) for team in teams],
+            output_field=CharField()
+        ),
+        modified=modified,
+    )
+    for team in teams:
+        team.modified = modified
+        publish_save_event(Team, team, created=False)
+    return teams
+
+
+def delete_teams(teams):
+    if teams:
+        Team.objects.filter(id__in=[team.id for team in teams]).delete()
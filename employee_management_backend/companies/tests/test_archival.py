@@ -0,0 +1,178 @@
+import datetime
+
+from django.db import IntegrityError, transaction
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.reverse import reverse
+from rest_framework.test import APIClient
+
+from model_mommy import mommy
+from organizations.models import Organization, OrganizationUser
+
+from employee_management_backend.companies import tasks
+from employee_management_backend.companies.archival import (
+    archive_team_members,
+    remove_team_members,
+)
+from employee_management_backend.companies.models import (
+    MembershipHistory,
+    Team,
+    TeamMember,
+    Tombstone,
+)
+
+
+class TestArchival(TestCase):
+    """
+    Test the removal and archival of organization users and team members
+    """
+
+    def setUp(self):
+        self.owner = mommy.make("users.User")
+        self.user = mommy.make("users.User")
+        self.organization = Organization.objects.create(name="Archival")
+        self.organization.get_or_add_user(self.owner)
+        self.organization.get_or_add_user(self.user)
+        self.organization_user = OrganizationUser.objects.get(
+            organization=self.organization, user=self.user
+        )
+        self.teams = [
+            Team.objects.create(
+                name="Archival {}".format(number),
+                organization=self.organization,
+            )
+            for number in range(2)
+        ]
+        self.members = [
+            TeamMember.objects.create(
+                team=team,
+                organization_user=self.organization_user,
+                is_admin=False,
+            )
+            for team in self.teams
+        ]
+
+    def test_remove_team_members(self):
+        removed = remove_team_members(
+            TeamMember.objects.filter(id=self.members[0].id)
+        )
+
+        self.assertEqual(removed, [self.members[0]])
+        self.assertEqual(list(TeamMember.objects.all()), [self.members[1]])
+        self.assertEqual(TeamMember.all_objects.count(), 2)
+        self.assertEqual(list(self.teams[0].team_team_members.all()), [])
+        self.assertTrue(
+            Tombstone.objects.filter(
+                object_type=Tombstone.TEAM_MEMBER, object_id=self.members[0].id
+            ).exists()
+        )
+
+        # A removed member can be added again, but only once.
+        TeamMember.objects.create(
+            team=self.teams[0],
+            organization_user=self.organization_user,
+            is_admin=True,
+        )
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            TeamMember.objects.create(
+                team=self.teams[0],
+                organization_user=self.organization_user,
+                is_admin=True,
+            )
+
+    def test_archive_team_members(self):
+        remove_team_members(TeamMember.objects.all())
+        TeamMember.all_objects.filter(id=self.members[0].id).update(
+            deleted=timezone.now() - datetime.timedelta(days=60)
+        )
+
+        self.assertEqual(tasks.archive_team_members(), 1)
+
+        self.assertEqual(
+            list(TeamMember.all_objects.values_list("id", flat=True)),
+            [self.members[1].id],
+        )
+        history = MembershipHistory.objects.get()
+        self.assertEqual(history.object_type, MembershipHistory.TEAM_MEMBER)
+        self.assertEqual(history.object_id, self.members[0].id)
+        self.assertEqual(history.organization_id, self.organization.id)
+        self.assertEqual(history.user_id, self.user.id)
+        self.assertEqual(history.team_id, self.teams[0].id)
+
+    def test_archive_team_members_chunks(self):
+        remove_team_members(TeamMember.objects.all())
+
+        counts = list(
+            archive_team_members(before=timezone.now(), chunk_size=1)
+        )
+
+        self.assertEqual(counts, [1, 1])
+        self.assertFalse(TeamMember.all_objects.exists())
+        self.assertEqual(MembershipHistory.objects.count(), 2)
+
+    def test_delete_team(self):
+        [removed] = remove_team_members(
+            TeamMember.objects.filter(id=self.members[0].id)
+        )
+        tombstones = Tombstone.objects.count()
+        team_id = self.teams[0].id
+
+        self.teams[0].delete()
+
+        self.assertFalse(TeamMember.all_objects.filter(id=removed.id).exists())
+        history = MembershipHistory.objects.get()
+        self.assertEqual(history.object_type, MembershipHistory.TEAM_MEMBER)
+        self.assertEqual(history.object_id, removed.id)
+        self.assertEqual(history.team_id, team_id)
+        self.assertEqual(history.departed, removed.deleted)
+        # Only the team is reported as deleted, its removed member was
+        # reported, once, when it was removed.
+        self.assertEqual(Tombstone.objects.count(), tombstones + 1)
+        self.assertEqual(
+            Tombstone.objects.filter(
+                object_type=Tombstone.TEAM_MEMBER, object_id=removed.id
+            ).count(),
+            1,
+        )
+
+    def test_remove_organization_user(self):
+        remove_team_members(TeamMember.objects.filter(id=self.members[0].id))
+        tombstones = Tombstone.objects.count()
+        client = APIClient()
+        client.force_authenticate(user=self.owner)
+
+        response = client.delete(
+            "{}?organization_id={}".format(
+                reverse(
+                    "companies:organization-users-detail",
+                    args=["v2", self.organization_user.id],
+                ),
+                self.organization.id,
+            )
+        )
+
+        self.assertEqual(response.status_code, 204)
+        self.assertFalse(
+            OrganizationUser.objects.filter(
+                id=self.organization_user.id
+            ).exists()
+        )
+        self.assertFalse(TeamMember.all_objects.exists())
+        self.assertEqual(
+            sorted(
+                MembershipHistory.objects.values_list(
+                    "object_type", "object_id"
+                )
+            ),
+            [
+                (
+                    MembershipHistory.ORGANIZATION_USER,
+                    self.organization_user.id,
+                ),
+                (MembershipHistory.TEAM_MEMBER, self.members[0].id),
+                (MembershipHistory.TEAM_MEMBER, self.members[1].id),
+            ],
+        )
+        # The organization user and the team member that had not been
+        # removed yet are reported as deleted, once.
+        self.assertEqual(Tombstone.objects.count(), tombstones + 2)
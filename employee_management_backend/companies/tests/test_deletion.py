@@ -0,0 +1,238 @@
+from unittest import mock
+
+from celery.exceptions import SoftTimeLimitExceeded
+from django.test import TestCase, override_settings
+from rest_framework.reverse import reverse
+from rest_framework.test import APIClient, APITransactionTestCase
+from rest_framework import status
+
+from model_mommy import mommy
+from organizations.models import (
+    Organization,
+    OrganizationOwner,
+    OrganizationUser,
+)
+
+from employee_management_backend.companies import tasks
+from employee_management_backend.companies.deletion import (
+    get_cascade_paths,
+    purge_organization,
+)
+from employee_management_backend.companies.models import (
+    Team,
+    TeamMember,
+    Tombstone,
+)
+from employee_management_backend.companies2.models import CompanyTeam
+
+
+def make_organization(name, members):
+    organization = Organization.objects.create(name=name)
+    users = mommy.make("users.User", _quantity=members)
+    for user in users:
+        organization.get_or_add_user(user)
+    team = Team.objects.create(name=name, organization=organization)
+    for organization_user in OrganizationUser.objects.filter(
+        organization=organization
+    ):
+        TeamMember.objects.create(
+            team=team, organization_user=organization_user, is_admin=False
+        )
+    CompanyTeam.objects.create(
+        company_id=organization.id, name=name, slug=name.lower()
+    )
+    return organization, users
+
+
+class TestPurgeOrganization(TestCase):
+    """
+    Test the chunked deletion of organizations
+    """
+
+    def test_cascade_paths(self):
+        paths = get_cascade_paths(Organization)
+        models = [model for model, lookup in paths]
+
+        self.assertIn((Team, "organization"), paths)
+        self.assertIn((TeamMember, "team__organization"), paths)
+        self.assertIn(CompanyTeam, models)
+        # Dependents come before the objects they depend on.
+        self.assertLess(models.index(TeamMember), models.index(Team))
+        self.assertLess(
+            models.index(TeamMember), models.index(OrganizationUser)
+        )
+        self.assertLess(
+            models.index(OrganizationOwner), models.index(OrganizationUser)
+        )
+
+    def test_purge_organization(self):
+        organization, _ = make_organization("Purged", 5)
+        other, _ = make_organization("Kept", 2)
+        Tombstone.objects.all().delete()
+        Tombstone.objects.create(
+            organization_id=organization.id,
+            object_type=Tombstone.TEAM,
+            object_id=0,
+        )
+
+        deleted = {}
+        for label, count in purge_organization(organization.id, chunk_size=2):
+            self.assertLessEqual(count, 2)
+            deleted[label] = deleted.get(label, 0) + count
+
+        self.assertEqual(
+            deleted,
+            {
+                "organizations.OrganizationOwner": 1,
+                "organizations.OrganizationUser": 5,
+                "companies.TeamMember": 5,
+                "companies.Team": 1,
+                "companies2.CompanyTeam": 1,
+                "organizations.Organization": 1,
+            },
+        )
+        self.assertFalse(
+            Organization.objects.filter(id=organization.id).exists()
+        )
+        self.assertFalse(Tombstone.objects.exists())
+        self.assertEqual(
+            OrganizationUser.objects.filter(organization=other).count(), 2
+        )
+        self.assertEqual(
+            TeamMember.objects.filter(team__organization=other).count(), 2
+        )
+        self.assertTrue(CompanyTeam.objects.filter(company=other).exists())
+
+    def test_delete_organization_task(self):
+        organization, _ = make_organization("Purged", 3)
+
+        result = tasks.delete_organization(organization.id)
+
+        self.assertEqual(result["organization_id"], organization.id)
+        self.assertEqual(
+            result["deleted"]["organizations.OrganizationUser"], 3
+        )
+        self.assertFalse(
+            Organization.objects.filter(id=organization.id).exists()
+        )
+
+    def test_delete_organization_task_retried(self):
+        organization, _ = make_organization("Purged", 3)
+        calls = []
+
+        def purge_once(organization_id):
+            calls.append(organization_id)
+            purged = purge_organization(organization_id, chunk_size=2)
+            if len(calls) == 1:
+                yield next(purged)
+                raise SoftTimeLimitExceeded()
+            yield from purged
+
+        with mock.patch.object(tasks, "purge_organization", purge_once):
+            result = tasks.delete_organization.apply(args=[organization.id])
+
+        self.assertEqual(result.state, "RETRY")
+        self.assertEqual(calls, [organization.id, organization.id])
+        self.assertFalse(
+            Organization.objects.filter(id=organization.id).exists()
+        )
+        self.assertFalse(
+            OrganizationUser.objects.filter(organization=organization).exists()
+        )
+
+
+@override_settings(ORGANIZATION_DELETION_CHUNK_SIZE=2)
+class OrganizationDeletionTestCase(APITransactionTestCase):
+    """
+    Test suite for the asynchronous deletion of organizations.
+    """
+
+    def setUp(self):
+        """
+        Define the test client and other test variables.
+        """
+
+        self.organization, users = make_organization("Deleted", 3)
+        self.user = users[0]
+        self.user.is_staff = True
+        self.user.save()
+
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+        self.url = reverse(
+            "companies:organizations-detail", args=["v2", self.organization.id]
+        )
+
+    def test_destroy(self):
+        """
+        Test that the organization is purged once the request is committed.
+        """
+
+        with mock.patch.object(
+            tasks.delete_organization,
+            "apply_async",
+            side_effect=lambda args, task_id: (
+                self.assertFalse(
+                    Organization.objects.get(id=args[0]).is_active
+                ),
+                tasks.delete_organization(*args),
+            ),
+        ) as apply_async:
+            response = self.client.delete(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        apply_async.assert_called_once_with(
+            args=[self.organization.id], task_id=response.json()["task_id"]
+        )
+        self.assertFalse(
+            Organization.objects.filter(id=self.organization.id).exists()
+        )
+        self.assertFalse(
+            OrganizationUser.objects.filter(
+                organization_id=self.organization.id
+            ).exists()
+        )
+
+    def test_destroy_not_staff(self):
+        """
+        Test that only staff members can delete an organization.
+        """
+
+        self.user.is_staff = False
+        self.user.save()
+
+        with mock.patch.object(
+            tasks.delete_organization, "apply_async"
+        ) as apply_async:
+            response = self.client.delete(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertFalse(apply_async.called)
+        self.organization.refresh_from_db()
+        self.assertTrue(self.organization.is_active)
+
+    def test_deletion_progress(self):
+        """
+        Test that the progress of the deletion task is reported.
+        """
+
+        progress = {
+            "organization_id": self.organization.id,
+            "deleted": {"organizations.OrganizationUser": 2},
+        }
+        with mock.patch(
+            "employee_management_backend.companies.api.views.AsyncResult"
+        ) as AsyncResult:
+            AsyncResult.return_value.state = tasks.PROGRESS
+            AsyncResult.return_value.info = progress
+            response = self.client.get(
+                reverse(
+                    "companies:organization-deletion", args=["v2", "task-id"]
+                )
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.json(),
+            dict(progress, task_id="task-id", state=tasks.PROGRESS),
+        )
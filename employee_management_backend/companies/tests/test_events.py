@@ -0,0 +1,79 @@
+import json
+from unittest import mock
+
+from django.test import TransactionTestCase, override_settings
+
+from organizations.models import Organization
+
+from employee_management_backend.companies.events import (
+    LocalEventBroker,
+    RedisEventBroker,
+    get_event_broker,
+)
+from employee_management_backend.companies.models import Team
+
+
+class TestLocalEventBroker(TransactionTestCase):
+    """
+    Test organization events published through the local broker.
+    """
+
+    def setUp(self):
+        self.new_organization = Organization.objects.create(
+            name="Test Organization(Events)"
+        )
+
+    def test_publish_subscribe(self):
+        broker = LocalEventBroker()
+        messages = broker.subscribe(self.new_organization.id, timeout=0.01)
+        self.assertIsNone(next(messages))
+        broker.publish(self.new_organization.id, {"event": "test"})
+        broker.publish(self.new_organization.id + 1, {"event": "other"})
+        self.assertEqual(json.loads(next(messages)), {"event": "test"})
+        self.assertIsNone(next(messages))
+        messages.close()
+        self.assertEqual(broker.subscribers, {})
+
+    def test_team_events(self):
+        messages = get_event_broker().subscribe(
+            self.new_organization.id, timeout=0.01
+        )
+        next(messages)
+        new_team = Team.objects.create(
+            organization=self.new_organization, name="Test Team"
+        )
+        new_team_id = new_team.id
+        new_team.delete()
+
+        created = json.loads(next(messages))
+        deleted = json.loads(next(messages))
+        messages.close()
+
+        self.assertEqual(created["event"], "team.created")
+        self.assertEqual(created["data"]["name"], "Test Team")
+        self.assertEqual(deleted["event"], "team.deleted")
+        self.assertEqual(deleted["data"], {"id": new_team_id})
+
+
+class TestRedisEventBroker(TransactionTestCase):
+    """
+    Test organization events published through an unavailable Redis.
+    """
+
+    @override_settings(ORGANIZATION_EVENTS_REDIS_URL="redis://localhost:1/0")
+    def test_publish_failure(self):
+        new_organization = Organization.objects.create(
+            name="Test Organization(Events)"
+        )
+        broker = RedisEventBroker()
+
+        with mock.patch(
+            "employee_management_backend.companies.events._broker", broker
+        ), self.assertLogs(
+            "employee_management_backend.companies.events", "ERROR"
+        ):
+            Team.objects.create(organization=new_organization, name="Test")
+
+        self.assertTrue(
+            Team.objects.filter(organization=new_organization).exists()
+        )
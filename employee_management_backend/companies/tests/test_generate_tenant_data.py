@@ -0,0 +1,76 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.db.models import F
+from django.test import TestCase
+
+from organizations.models import (
+    Organization,
+    OrganizationOwner,
+    OrganizationUser,
+)
+
+from employee_management_backend.companies.models import Team, TeamMember
+from employee_management_backend.companies2.models import CompanyTeam
+from employee_management_backend.users.models import User
+
+
+class TestGenerateTenantData(TestCase):
+    """
+    Test the generate_tenant_data management command
+    """
+
+    def generate(self, **options):
+        out = StringIO()
+        call_command(
+            "generate_tenant_data",
+            prefix="test",
+            seed=1,
+            stdout=out,
+            **options
+        )
+        return out.getvalue()
+
+    def test_generate_tenant_data(self):
+        output = self.generate(
+            organizations=4, max_members=40, min_members=3, team_size=5
+        )
+
+        organizations = Organization.objects.order_by("id")
+        self.assertEqual(
+            [
+                organization.organization_users.count()
+                for organization in organizations
+            ],
+            [40, 20, 13, 10],
+        )
+        self.assertEqual(User.objects.count(), 83)
+        self.assertEqual(OrganizationOwner.objects.count(), 4)
+        self.assertEqual(
+            OrganizationUser.objects.filter(is_admin=True).count(), 4
+        )
+        self.assertEqual(Team.objects.count(), 8 + 4 + 2 + 2)
+        self.assertTrue(TeamMember.objects.exists())
+        self.assertFalse(
+            TeamMember.objects.exclude(
+                organization_user__organization=F("team__organization")
+            ).exists()
+        )
+        self.assertFalse(
+            CompanyTeam.objects.exclude(company__in=organizations).exists()
+        )
+        self.assertTrue(
+            User.objects.get(username="test-user-0").check_password("password")
+        )
+        self.assertIn("administered by test-user-0", output)
+
+    def test_skew(self):
+        self.generate(organizations=3, max_members=10, skew=0)
+
+        self.assertEqual(
+            [
+                organization.organization_users.count()
+                for organization in Organization.objects.all()
+            ],
+            [10, 10, 10],
+        )
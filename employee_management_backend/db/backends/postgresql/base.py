@@ -0,0 +1,11 @@
+"""
+PostgreSQL backend with connection health checks and a host wide cap on
+open connections, see employee_management_backend.db.pool.
+"""
+from django.db.backends.postgresql import base
+
+from employee_management_backend.db.pool import PooledDatabaseWrapperMixin
+
+
+class DatabaseWrapper(PooledDatabaseWrapperMixin, base.DatabaseWrapper):
+    pass
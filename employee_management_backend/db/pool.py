@@ -0,0 +1,224 @@
+"""
+Database connection management shared by the project's database backends.
+
+Two things are added on top of Django's persistent connections:
+
+* Health checks: when CONN_HEALTH_CHECKS is set on a database, a connection
+  kept from a previous request is pinged before it is reused and replaced if
+  it no longer works, so a database failover does not leave workers erroring
+  until they are recycled.
+* A cap on the connections opened by every process on the host. Each
+  connection holds a slot, an exclusive flock on one of MAX_CONNECTIONS files
+  in SLOTS_DIR. Slots are released when the connection is closed, or by the
+  kernel if the process dies. Connections wait up to ACQUIRE_TIMEOUT seconds
+  for a free slot.
+
+A persistent connection, kept for CONN_MAX_AGE seconds, holds its slot
+between the requests of its thread, so MAX_CONNECTIONS should be at least the
+number of request threads on the host, workers * threads with
+config/gunicorn.py, which is its default in production. Threads past it,
+such as those of parallel batch requests, wait for the slot of a connection
+being closed.
+
+The cap is configured with the CONNECTION_POOL key of a database::
+
+    DATABASES["default"]["CONNECTION_POOL"] = {
+        "MAX_CONNECTIONS": 20,
+        "ACQUIRE_TIMEOUT": 5,
+        "SLOTS_DIR": "/tmp/db-connection-slots",
+    }
+
+"""
+import fcntl
+import logging
+import os
+import random
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class ConnectionSlots:
+    """Fixed number of connection slots shared by the processes of a host."""
+
+    poll_interval = 0.01
+
+    def __init__(self, directory, size):
+        self.directory = directory
+        self.size = size
+        self.lock = threading.Lock()
+        self.acquired = 0
+        self.waits = 0
+        self.wait_seconds = 0.0
+        self.timeouts = 0
+        self.health_check_failures = 0
+        os.makedirs(directory, exist_ok=True)
+
+    def get_path(self, index):
+        return os.path.join(self.directory, "slot-{}".format(index))
+
+    def lock_slot(self, index):
+        fd = os.open(self.get_path(index), os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except (IOError, OSError):
+            os.close(fd)
+            return None
+        return fd
+
+    def try_acquire(self):
+        # Start from a random slot so processes do not all contend for the
+        # first ones.
+        offset = random.randrange(self.size)
+        for step in range(self.size):
+            fd = self.lock_slot((offset + step) % self.size)
+            if fd is not None:
+                return fd
+        return None
+
+    def acquire(self, timeout):
+        """Return a held slot, or None if none became free within timeout."""
+        start = time.monotonic()
+        slot = self.try_acquire()
+        while slot is None and time.monotonic() - start < timeout:
+            time.sleep(self.poll_interval)
+            slot = self.try_acquire()
+        waited = time.monotonic() - start
+        with self.lock:
+            if slot is None:
+                self.timeouts += 1
+            else:
+                self.acquired += 1
+            if waited >= self.poll_interval:
+                self.waits += 1
+                self.wait_seconds += waited
+        if slot is None:
+            logger.error(
+                "No database connection slot became free within %ss.",
+                timeout,
+                extra={"max_connections": self.size},
+            )
+        elif waited >= self.poll_interval:
+            logger.warning(
+                "Waited %.3fs for a database connection slot.",
+                waited,
+                extra={"max_connections": self.size},
+            )
+        return slot
+
+    def release(self, slot):
+        try:
+            fcntl.flock(slot, fcntl.LOCK_UN)
+        finally:
+            os.close(slot)
+
+    def in_use(self):
+        """Count the slots held by any process on the host."""
+        count = 0
+        for index in range(self.size):
+            fd = self.lock_slot(index)
+            if fd is None:
+                count += 1
+            else:
+                self.release(fd)
+        return count
+
+    def record_health_check_failure(self):
+        with self.lock:
+            self.health_check_failures += 1
+
+    def stats(self):
+        in_use = self.in_use()
+        with self.lock:
+            return {
+                "max_connections": self.size,
+                "in_use": in_use,
+                "saturation": round(in_use / self.size, 3),
+                "acquired": self.acquired,
+                "waits": self.waits,
+                "wait_seconds": round(self.wait_seconds, 3),
+                "timeouts": self.timeouts,
+                "health_check_failures": self.health_check_failures,
+            }
+
+
+_slots = {}
+_slots_lock = threading.Lock()
+
+
+def get_connection_slots(directory, size):
+    """Return the process wide ConnectionSlots for directory."""
+    with _slots_lock:
+        if directory not in _slots:
+            _slots[directory] = ConnectionSlots(directory, size)
+        return _slots[directory]
+
+
+def get_pool_stats():
+    """Return saturation statistics of every configured connection pool."""
+    with _slots_lock:
+        slots = dict(_slots)
+    return {directory: pool.stats() for directory, pool in slots.items()}
+
+
+class PooledDatabaseWrapperMixin:
+    """Add health checks and a host wide connection cap to a backend."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.health_checks = self.settings_dict.get(
+            "CONN_HEALTH_CHECKS", False
+        )
+        self.health_check_pending = False
+        self.connection_slot = None
+        pool = self.settings_dict.get("CONNECTION_POOL")
+        if pool:
+            self.acquire_timeout = pool.get("ACQUIRE_TIMEOUT", 5)
+            self.connection_slots = get_connection_slots(
+                pool["SLOTS_DIR"], pool["MAX_CONNECTIONS"]
+            )
+        else:
+            self.connection_slots = None
+
+    def get_new_connection(self, conn_params):
+        if self.connection_slots is None:
+            return super().get_new_connection(conn_params)
+        slot = self.connection_slots.acquire(self.acquire_timeout)
+        if slot is None:
+            raise self.Database.OperationalError(
+                "Too many database connections are open on this host."
+            )
+        try:
+            connection = super().get_new_connection(conn_params)
+        except Exception:
+            self.connection_slots.release(slot)
+            raise
+        self.connection_slot = slot
+        return connection
+
+    def _close(self):
+        try:
+            return super()._close()
+        finally:
+            if self.connection_slot is not None:
+                self.connection_slots.release(self.connection_slot)
+                self.connection_slot = None
+
+    def close_if_unusable_or_obsolete(self):
+        super().close_if_unusable_or_obsolete()
+        # A connection kept for the next request is pinged before it is used.
+        if self.health_checks and self.connection is not None:
+            self.health_check_pending = True
+
+    def ensure_connection(self):
+        if self.health_check_pending:
+            self.health_check_pending = False
+            if self.connection is not None and not self.is_usable():
+                if self.connection_slots is not None:
+                    self.connection_slots.record_health_check_failure()
+                logger.warning(
+                    "Replacing unusable connection to database %s.", self.alias
+                )
+                self.close()
+        super().ensure_connection()
@@ -0,0 +1,40 @@
+import asyncio
+
+from django.core.signals import request_finished
+
+from config.asgi import application
+
+
+def test_request_finished():
+    finished, messages = [], []
+
+    def receiver(**kwargs):
+        finished.append(kwargs)
+
+    async def receive():
+        return {"type": "http.request", "body": b""}
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/metrics/",
+        "query_string": b"",
+        "http_version": "1.1",
+        "headers": [],
+    }
+    request_finished.connect(receiver)
+    try:
+        asyncio.get_event_loop().run_until_complete(
+            application(scope, receive, send)
+        )
+    finally:
+        request_finished.disconnect(receiver)
+
+    assert messages[0]["type"] == "http.response.start"
+    assert messages[-1] == {"type": "http.response.body"}
+    # Sent when the response is closed, which closes the connections of
+    # the thread that handled it.
+    assert len(finished) == 1
@@ -0,0 +1,108 @@
+from unittest import mock
+
+import pytest
+from django.db import connection
+from django.db.backends.sqlite3 import base
+from django.db.utils import OperationalError
+
+from employee_management_backend.db.pool import (
+    ConnectionSlots,
+    PooledDatabaseWrapperMixin,
+)
+
+
+class DatabaseWrapper(PooledDatabaseWrapperMixin, base.DatabaseWrapper):
+    pass
+
+
+@pytest.fixture
+def slots_dir(tmpdir) -> str:
+    return tmpdir.join("slots").strpath
+
+
+@pytest.fixture
+def make_wrapper(slots_dir, tmpdir):
+    wrappers = []
+
+    def make_wrapper(max_connections=1):
+        settings_dict = dict(
+            connection.settings_dict,
+            NAME=tmpdir.join("pooled.sqlite3").strpath,
+            CONN_MAX_AGE=60,
+            CONN_HEALTH_CHECKS=True,
+            CONNECTION_POOL={
+                "MAX_CONNECTIONS": max_connections,
+                "ACQUIRE_TIMEOUT": 0,
+                "SLOTS_DIR": slots_dir,
+            },
+        )
+        wrapper = DatabaseWrapper(settings_dict, alias="pooled")
+        wrappers.append(wrapper)
+        return wrapper
+
+    yield make_wrapper
+    for wrapper in wrappers:
+        wrapper.close()
+
+
+class TestConnectionSlots:
+    def test_acquire_release(self, slots_dir: str):
+        slots = ConnectionSlots(slots_dir, 2)
+        first = slots.acquire(timeout=0)
+        second = slots.acquire(timeout=0)
+
+        assert first is not None and second is not None
+        assert slots.acquire(timeout=0) is None
+        assert slots.in_use() == 2
+
+        slots.release(first)
+
+        assert slots.in_use() == 1
+        stats = slots.stats()
+        assert stats["acquired"] == 2
+        assert stats["timeouts"] == 1
+        assert stats["saturation"] == 0.5
+
+    def test_slots_shared_between_instances(self, slots_dir: str):
+        held = ConnectionSlots(slots_dir, 1).acquire(timeout=0)
+
+        assert held is not None
+        assert ConnectionSlots(slots_dir, 1).acquire(timeout=0) is None
+
+
+@pytest.mark.django_db
+class TestPooledDatabaseWrapper:
+    def test_connection_holds_slot(self, make_wrapper):
+        wrapper = make_wrapper()
+        wrapper.ensure_connection()
+
+        assert wrapper.connection_slots.in_use() == 1
+        with pytest.raises(OperationalError):
+            make_wrapper().ensure_connection()
+
+        wrapper.close()
+
+        assert wrapper.connection_slots.in_use() == 0
+
+    def test_health_check_replaces_unusable_connection(self, make_wrapper):
+        wrapper = make_wrapper()
+        wrapper.ensure_connection()
+        old_connection = wrapper.connection
+
+        wrapper.close_if_unusable_or_obsolete()
+        with mock.patch.object(wrapper, "is_usable", return_value=False):
+            wrapper.ensure_connection()
+
+        assert wrapper.connection is not old_connection
+        assert wrapper.connection_slots.in_use() == 1
+        assert wrapper.connection_slots.stats()["health_check_failures"] == 1
+
+    def test_health_check_keeps_usable_connection(self, make_wrapper):
+        wrapper = make_wrapper()
+        wrapper.ensure_connection()
+        old_connection = wrapper.connection
+
+        wrapper.close_if_unusable_or_obsolete()
+        wrapper.ensure_connection()
+
+        assert wrapper.connection is old_connection
@@ -0,0 +1,17 @@
+"""
+Encoding of API requests and responses.
+
+The API's renderers and parsers:
+
+* JSONRenderer and JSONParser use the first JSON backend of the JSON_BACKENDS
+  setting that can be imported, see backends, and fall back to REST
+  framework's, which use the standard library, when none can.
+* MessagePackRenderer and MessagePackParser, selected with the
+  application/msgpack media type, exchange datetimes as MessagePack
+  timestamps.
+* ModelSerializer formats model datetimes in the API's DATETIME_FORMAT without
+  strftime, see fields.
+
+Responses are compressed with br or gzip by CompressionMiddleware, see
+middleware.
+"""
@@ -0,0 +1,48 @@
+"""
+JSON backends of the renderers and parsers.
+
+A backend is a class, named by its dotted path in the JSON_BACKENDS setting,
+with two methods:
+
+* dumps(data, default), returning data as UTF-8 encoded, compact JSON, with
+  non-ASCII characters left unescaped. default(value) returns a
+  serializable version of the values the backend cannot serialize,
+  including dates and times.
+* loads(data), returning the data of a UTF-8 encoded JSON document, raising
+  ValueError if it is not valid, NaN and infinities included.
+
+Instantiating a backend raises ImportError if the library it uses is not
+installed; the next one is then tried.
+"""
+import functools
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+
+class OrjsonBackend:
+    def __init__(self):
+        import orjson
+
+        self.orjson = orjson
+
+    def dumps(self, data, default):
+        # orjson formats dates and times itself, differently from REST
+        # framework's encoder.
+        return self.orjson.dumps(
+            data, default=default, option=self.orjson.OPT_PASSTHROUGH_DATETIME
+        )
+
+    def loads(self, data):
+        return self.orjson.loads(data)
+
+
+@functools.lru_cache()
+def get_backend():
+    """Return the first JSON backend that can be used, or None."""
+    for path in getattr(settings, "JSON_BACKENDS", []):
+        try:
+            return import_string(path)()
+        except ImportError:
+            continue
+    return None
@@ -0,0 +1,223 @@
+"""
+Compression of responses.
+
+CompressionMiddleware encodes responses with the content coding the client
+prefers among those of the ENCODINGS of the COMPRESSION setting: br, when the
+brotli library is installed, and gzip. Only text, JSON, MessagePack and
+other compressible media types are compressed.
+
+* Responses are compressed when they are at least MIN_SIZE bytes, below
+  which compression saves less than it costs, and sent as they are when
+  compression does not make them smaller.
+* LEVELS are (size, levels) pairs: a response is compressed with the levels,
+  by encoding, of the first size it is no larger than, larger responses
+  being compressed faster and less.
+* Streamed responses are compressed chunk by chunk, with STREAMING_LEVELS,
+  and every chunk is flushed so that streams such as server-sent events are
+  not held back by the compressor.
+
+The time spent compressing a response is added to its "compress" timer when
+the middleware runs inside RequestInstrumentationMiddleware, and, for every
+response, streamed ones included, to the compression metrics.
+"""
+import re
+import time
+import zlib
+
+from django.conf import settings
+from django.utils.cache import patch_vary_headers
+
+from employee_management_backend.monitoring.instrumentation import timer
+from employee_management_backend.monitoring.metrics import observe_compression
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+COMPRESSIBLE_TYPES = {
+    "application/javascript",
+    "application/json",
+    "application/msgpack",
+    "application/xml",
+    "image/svg+xml",
+}
+
+
+def get_config():
+    config = {
+        "ENCODINGS": ["br", "gzip"],
+        "MIN_SIZE": 1024,
+        "LEVELS": [
+            (64 * 1024, {"br": 5, "gzip": 6}),
+            (1024 * 1024, {"br": 4, "gzip": 5}),
+            (None, {"br": 2, "gzip": 3}),
+        ],
+        "STREAMING_LEVELS": {"br": 4, "gzip": 5},
+    }
+    config.update(getattr(settings, "COMPRESSION", {}))
+    return config
+
+
+class GzipCodec:
+    name = "gzip"
+
+    def __init__(self, level):
+        # A gzip header and trailer around the deflate stream.
+        self.compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + 15)
+
+    def compress(self, data):
+        return self.compressor.compress(data)
+
+    def flush(self):
+        return self.compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self):
+        return self.compressor.flush()
+
+
+class BrotliCodec:
+    name = "br"
+
+    def __init__(self, quality):
+        self.compressor = brotli.Compressor(
+            mode=brotli.MODE_TEXT, quality=quality
+        )
+
+    def compress(self, data):
+        return self.compressor.process(data)
+
+    def flush(self):
+        return self.compressor.flush()
+
+    def finish(self):
+        return self.compressor.finish()
+
+
+CODECS = {"gzip": GzipCodec}
+if brotli is not None:
+    CODECS["br"] = BrotliCodec
+
+
+def get_encoding(accept_encoding, encodings):
+    """
+    Return the first of encodings with the highest quality in an
+    Accept-Encoding header, or None if the client accepts none of them.
+    """
+    qualities = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.partition(";")
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[coding.strip().lower()] = quality
+
+    best, best_quality = None, 0.0
+    for encoding in encodings:
+        quality = qualities.get(encoding, qualities.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+def compress(codec, data):
+    started = time.perf_counter()
+    compressed = codec.compress(data) + codec.finish()
+    observe_compression(
+        codec.name, time.perf_counter() - started, len(data), len(compressed)
+    )
+    return compressed
+
+
+def compress_stream(codec, chunks):
+    seconds, size, compressed_size = 0.0, 0, 0
+    try:
+        for chunk in chunks:
+            if not chunk:
+                continue
+            started = time.perf_counter()
+            data = codec.compress(chunk) + codec.flush()
+            seconds += time.perf_counter() - started
+            size += len(chunk)
+            compressed_size += len(data)
+            yield data
+        data = codec.finish()
+        compressed_size += len(data)
+        yield data
+    finally:
+        observe_compression(codec.name, seconds, size, compressed_size)
+
+
+class CompressionMiddleware:
+    """Compress responses with br or gzip, see the module's docstring."""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        config = get_config()
+        self.encodings = [
+            encoding for encoding in config["ENCODINGS"] if encoding in CODECS
+        ]
+        self.min_size = config["MIN_SIZE"]
+        self.levels = config["LEVELS"]
+        self.streaming_levels = config["STREAMING_LEVELS"]
+
+    def __call__(self, request):
+        response = self.get_response(request)
+        if not self.is_compressible(response):
+            return response
+        if not response.streaming and len(response.content) < self.min_size:
+            return response
+
+        patch_vary_headers(response, ("Accept-Encoding",))
+        encoding = get_encoding(
+            request.META.get("HTTP_ACCEPT_ENCODING", ""), self.encodings
+        )
+        if encoding is None:
+            return response
+
+        if response.streaming:
+            codec = CODECS[encoding](self.streaming_levels[encoding])
+            response.streaming_content = compress_stream(
+                codec, response.streaming_content
+            )
+            del response["Content-Length"]
+        else:
+            level = self.get_levels(len(response.content))[encoding]
+            with timer("compress"):
+                content = compress(CODECS[encoding](level), response.content)
+            if len(content) >= len(response.content):
+                return response
+            response.content = content
+            response["Content-Length"] = str(len(content))
+
+        if response.has_header("ETag"):
+            # The compressed and identity representations differ.
+            response["ETag"] = re.sub(r'^"', 'W/"', response["ETag"])
+        response["Content-Encoding"] = encoding
+        return response
+
+    def is_compressible(self, response):
+        if response.has_header("Content-Encoding") or response.has_header(
+            "Content-Range"
+        ):
+            return False
+        if "no-transform" in response.get("Cache-Control", ""):
+            return False
+        media_type = response.get("Content-Type", "").partition(";")[0]
+        media_type = media_type.strip().lower()
+        return (
+            media_type.startswith("text/")
+            or media_type in COMPRESSIBLE_TYPES
+            or media_type.endswith("+json")
+        )
+
+    def get_levels(self, size):
+        for max_size, levels in self.levels:
+            if max_size is None or size <= max_size:
+                return levels
+        return self.levels[-1][1]
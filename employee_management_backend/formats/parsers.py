@@ -0,0 +1,47 @@
+import codecs
+
+import msgpack
+from django.conf import settings
+from rest_framework import parsers
+from rest_framework.exceptions import ParseError
+
+from employee_management_backend.formats.backends import get_backend
+from employee_management_backend.formats.renderers import (
+    JSONRenderer,
+    MessagePackRenderer,
+)
+
+
+class JSONParser(parsers.JSONParser):
+    """Parse UTF-8 encoded JSON with the JSON backend."""
+
+    renderer_class = JSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        encoding = (parser_context or {}).get(
+            "encoding", settings.DEFAULT_CHARSET
+        )
+        backend = get_backend()
+        if (
+            backend is None
+            or not self.strict
+            or codecs.lookup(encoding).name != "utf-8"
+        ):
+            return super().parse(stream, media_type, parser_context)
+        try:
+            return backend.loads(stream.read())
+        except ValueError as exc:
+            raise ParseError("JSON parse error - {}".format(exc))
+
+
+class MessagePackParser(parsers.BaseParser):
+    """Parse MessagePack, timestamp extension types as datetimes."""
+
+    media_type = "application/msgpack"
+    renderer_class = MessagePackRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        try:
+            return msgpack.unpackb(stream.read(), raw=False, timestamp=3)
+        except (msgpack.UnpackException, TypeError, ValueError) as exc:
+            raise ParseError("MessagePack parse error - {}".format(exc))
@@ -0,0 +1,71 @@
+import datetime
+
+import msgpack
+from rest_framework import renderers
+
+from employee_management_backend.formats.backends import get_backend
+
+EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+LINE_SEPARATOR = "\u2028".encode()
+PARAGRAPH_SEPARATOR = "\u2029".encode()
+
+
+class JSONRenderer(renderers.JSONRenderer):
+    """
+    Render JSON with the JSON backend, to the same bytes as REST framework.
+
+    Indented documents, for the browsable API, and ASCII-only ones are left
+    to REST framework.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        backend = get_backend()
+        if (
+            data is None
+            or backend is None
+            or self.ensure_ascii
+            or not self.compact
+            or self.get_indent(accepted_media_type, renderer_context or {})
+            is not None
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+        return (
+            backend.dumps(data, default=self.encoder_class().default)
+            # Escaped by REST framework, so that JSON is valid JavaScript.
+            .replace(LINE_SEPARATOR, b"\\u2028").replace(
+                PARAGRAPH_SEPARATOR, b"\\u2029"
+            )
+        )
+
+
+class MessagePackRenderer(renderers.BaseRenderer):
+    """
+    Render MessagePack, with datetimes as timestamp extension types.
+
+    Serializer fields give datetimes rather than strings to renderers with
+    native_datetimes, see fields.DateTimeField. Other values MessagePack has
+    no type for are rendered as with JSON.
+    """
+
+    media_type = "application/msgpack"
+    format = "msgpack"
+    charset = None
+    render_style = "binary"
+    native_datetimes = True
+    encoder_class = renderers.JSONRenderer.encoder_class
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return bytes()
+        return msgpack.packb(data, default=self.default, use_bin_type=True)
+
+    def default(self, value):
+        if isinstance(value, datetime.datetime):
+            # Timestamp.from_datetime() goes through a float, which loses
+            # microseconds.
+            delta = value - EPOCH
+            return msgpack.Timestamp(
+                delta.days * 24 * 60 * 60 + delta.seconds,
+                delta.microseconds * 1000,
+            )
+        return self.encoder_class().default(value)
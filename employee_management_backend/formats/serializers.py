@@ -0,0 +1,11 @@
+from django.db import models
+from rest_framework import serializers
+
+from employee_management_backend.formats import fields
+
+
+class ModelSerializer(serializers.ModelSerializer):
+    serializer_field_mapping = (
+        serializers.ModelSerializer.serializer_field_mapping.copy()
+    )
+    serializer_field_mapping[models.DateTimeField] = fields.DateTimeField
@@ -0,0 +1,155 @@
+import gzip
+import zlib
+
+import pytest
+from django.http import HttpResponse, StreamingHttpResponse
+from django.test import RequestFactory
+from django.urls import reverse
+from organizations.models import Organization
+from rest_framework.test import APIClient
+
+from employee_management_backend.companies.models import Team
+from employee_management_backend.formats.middleware import (
+    CompressionMiddleware,
+    get_encoding,
+)
+from employee_management_backend.monitoring.metrics import (
+    get_labels_key,
+    registry,
+)
+
+CONTENT = b'{"name": "Test Organization", "users_nested": []}' * 100
+
+
+def get_compressed_bytes(encoding):
+    samples = registry.samples.get("http_response_compression_bytes_total")
+    key = get_labels_key({"encoding": encoding, "stage": "uncompressed"})
+    return (samples or {}).get(key, 0)
+
+
+def compress_response(response, accept_encoding="gzip"):
+    middleware = CompressionMiddleware(lambda request: response)
+    return middleware(
+        RequestFactory().get("/", HTTP_ACCEPT_ENCODING=accept_encoding)
+    )
+
+
+@pytest.mark.parametrize(
+    "accept_encoding, encoding",
+    [
+        ("gzip, deflate, br", "br"),
+        ("gzip", "gzip"),
+        ("br;q=0.5, gzip", "gzip"),
+        ("br;q=0, *", "gzip"),
+        ("GZIP;Q=0.8", "gzip"),
+        ("identity", None),
+        ("gzip;q=0", None),
+        ("", None),
+    ],
+)
+def test_get_encoding(accept_encoding, encoding):
+    assert get_encoding(accept_encoding, ["br", "gzip"]) == encoding
+
+
+class TestCompressionMiddleware:
+    def test_gzip(self):
+        response = HttpResponse(CONTENT, content_type="application/json")
+        response["ETag"] = '"abc"'
+        size = get_compressed_bytes("gzip")
+
+        response = compress_response(response)
+
+        assert response["Content-Encoding"] == "gzip"
+        assert response["Vary"] == "Accept-Encoding"
+        assert response["ETag"] == 'W/"abc"'
+        assert int(response["Content-Length"]) == len(response.content)
+        assert gzip.decompress(response.content) == CONTENT
+        assert get_compressed_bytes("gzip") == size + len(CONTENT)
+
+    def test_brotli(self):
+        brotli = pytest.importorskip("brotli")
+        response = HttpResponse(CONTENT, content_type="application/msgpack")
+
+        response = compress_response(response, "gzip, br")
+
+        assert response["Content-Encoding"] == "br"
+        assert brotli.decompress(response.content) == CONTENT
+
+    @pytest.mark.parametrize(
+        "content, content_type, cache_control",
+        [
+            (b"{}", "application/json", ""),
+            (CONTENT, "image/png", ""),
+            (CONTENT, "application/json", "no-transform"),
+        ],
+    )
+    def test_not_compressed(self, content, content_type, cache_control):
+        response = HttpResponse(content, content_type=content_type)
+        if cache_control:
+            response["Cache-Control"] = cache_control
+
+        response = compress_response(response)
+
+        assert not response.has_header("Content-Encoding")
+        assert not response.has_header("Vary")
+        assert response.content == content
+
+    def test_not_accepted(self):
+        response = HttpResponse(CONTENT, content_type="application/json")
+
+        response = compress_response(response, "identity")
+
+        assert not response.has_header("Content-Encoding")
+        assert response["Vary"] == "Accept-Encoding"
+        assert response.content == CONTENT
+
+    def test_levels_by_size(self, settings):
+        settings.COMPRESSION = {
+            "LEVELS": [(10, {"gzip": 9}), (None, {"gzip": 1})]
+        }
+        middleware = CompressionMiddleware(None)
+
+        assert middleware.get_levels(10) == {"gzip": 9}
+        assert middleware.get_levels(11) == {"gzip": 1}
+
+    def test_streaming(self):
+        chunks = [b"data: " + CONTENT[:200] + b"\n\n", b"", b"data: {}\n\n"]
+        response = StreamingHttpResponse(
+            iter(chunks), content_type="text/event-stream"
+        )
+        size = get_compressed_bytes("gzip")
+
+        response = compress_response(response)
+
+        assert response["Content-Encoding"] == "gzip"
+        assert not response.has_header("Content-Length")
+        decompressor = zlib.decompressobj(16 + 15)
+        # Every chunk can be decompressed as soon as it is received.
+        received = [
+            decompressor.decompress(data)
+            for data in response.streaming_content
+        ]
+        assert received == [chunks[0], chunks[2], b""]
+        assert decompressor.eof
+        assert get_compressed_bytes("gzip") == size + len(b"".join(chunks))
+
+
+@pytest.mark.django_db
+def test_compression_timed(settings, user):
+    settings.REQUEST_INSTRUMENTATION = {"SAMPLE_RATE": 1.0}
+    settings.COMPRESSION = {"MIN_SIZE": 0}
+    organization = Organization.objects.create(name="Test Organization")
+    organization.get_or_add_user(user)
+    Team.objects.create(name="Test Team", organization=organization)
+    client = APIClient()
+    client.force_authenticate(user=user)
+
+    response = client.get(
+        reverse("companies:teams-list", args=["v2"]),
+        {"organization_id": organization.id},
+        HTTP_ACCEPT_ENCODING="gzip",
+    )
+
+    assert response["Content-Encoding"] == "gzip"
+    assert "compress;dur=" in response["Server-Timing"]
+    assert b"Test Team" in gzip.decompress(response.content)
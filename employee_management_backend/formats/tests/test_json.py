@@ -0,0 +1,126 @@
+import datetime
+import decimal
+import io
+import uuid
+from collections import OrderedDict
+
+import pytest
+import pytz
+from django.utils import timezone
+from django.utils.translation import gettext_lazy
+from rest_framework import renderers
+from rest_framework.exceptions import ParseError
+
+from employee_management_backend.formats.backends import get_backend
+from employee_management_backend.formats.fields import (
+    DateTimeField,
+    compile_format,
+)
+from employee_management_backend.formats.parsers import JSONParser
+from employee_management_backend.formats.renderers import JSONRenderer
+
+DATETIME_FORMAT = "%Y-%m-%dT%H:%M:%S.%fZ"
+
+
+@pytest.fixture(params=["orjson", None])
+def backend(request, settings):
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+        settings.JSON_BACKENDS = [
+            "employee_management_backend.formats.backends.OrjsonBackend"
+        ]
+    else:
+        settings.JSON_BACKENDS = []
+    get_backend.cache_clear()
+    yield get_backend()
+    get_backend.cache_clear()
+
+
+def test_missing_backend(settings):
+    settings.JSON_BACKENDS = ["employee_management_backend.missing.Backend"]
+    get_backend.cache_clear()
+
+    assert get_backend() is None
+    get_backend.cache_clear()
+
+
+class TestJSONRenderer:
+    def test_same_output_as_rest_framework(self, backend):
+        data = [
+            OrderedDict(
+                [
+                    ("id", 1),
+                    ("name", "Kampuni ya J\u00fcma \u2028\u2029 \U0001f600"),
+                    ("ratio", 0.1),
+                    ("amount", decimal.Decimal("1.50")),
+                    ("uuid", uuid.UUID(int=1)),
+                    ("created", datetime.datetime(2019, 1, 2, 3, 4, 5, 6000)),
+                    ("date", datetime.date(2019, 1, 2)),
+                    ("label", gettext_lazy("Users")),
+                    ("tags", ("a", "b")),
+                    ("nested", {"empty": None, "flag": True}),
+                ]
+            )
+        ]
+
+        assert JSONRenderer().render(data) == (
+            renderers.JSONRenderer().render(data)
+        )
+
+    def test_indent(self, backend):
+        data = {"id": 1}
+
+        assert JSONRenderer().render(
+            data, "application/json; indent=2"
+        ) == renderers.JSONRenderer().render(
+            data, "application/json; indent=2"
+        )
+
+
+class TestJSONParser:
+    def test_parse(self, backend):
+        assert JSONParser().parse(
+            io.BytesIO('{"name": "J\\u00fcma", "ids": [1, 2.5]}'.encode())
+        ) == {"name": "Jüma", "ids": [1, 2.5]}
+
+    @pytest.mark.parametrize("document", [b"{", b'{"ratio": NaN}'])
+    def test_invalid(self, backend, document):
+        with pytest.raises(ParseError):
+            JSONParser().parse(io.BytesIO(document))
+
+
+class TestDateTimeField:
+    @pytest.mark.parametrize(
+        "value",
+        [
+            datetime.datetime(2019, 1, 2, 3, 4, 5, tzinfo=pytz.utc),
+            datetime.datetime(2019, 12, 31, 23, 59, 59, 999999, pytz.utc),
+            datetime.datetime(1999, 6, 1, 12, 0, 0, 1),
+            datetime.datetime(5, 6, 1, 12, 0, 0, 1, pytz.utc),
+        ],
+    )
+    def test_same_output_as_strftime(self, value):
+        field = DateTimeField(format=DATETIME_FORMAT)
+
+        assert field.to_representation(value) == (
+            field.enforce_timezone(value).strftime(DATETIME_FORMAT)
+        )
+
+    def test_formats(self):
+        value = timezone.now()
+
+        assert DateTimeField(format="iso-8601").to_representation(value) == (
+            DateTimeField().enforce_timezone(value).isoformat()
+        )
+        assert DateTimeField(format="%d %B %Y").to_representation(value) == (
+            DateTimeField().enforce_timezone(value).strftime("%d %B %Y")
+        )
+        assert DateTimeField(format=None).to_representation(value) is value
+
+    def test_compile_format(self):
+        value = datetime.datetime(2019, 1, 2)
+        template, get_values = compile_format("%Y%%%m")
+
+        assert template % get_values(value) == value.strftime("%Y%%%m")
+        assert compile_format("%Y %B") is None
+        assert compile_format("no directives") is None
@@ -0,0 +1,84 @@
+import datetime
+import decimal
+import io
+from collections import OrderedDict
+
+import msgpack
+import pytest
+import pytz
+from django.urls import reverse
+from rest_framework.exceptions import ParseError
+from rest_framework.test import APIClient
+
+from employee_management_backend.formats.parsers import MessagePackParser
+from employee_management_backend.formats.renderers import MessagePackRenderer
+
+MSGPACK = "application/msgpack"
+
+
+class TestMessagePack:
+    def test_round_trip(self):
+        created = datetime.datetime(2019, 1, 2, 3, 4, 5, 6, tzinfo=pytz.utc)
+        data = OrderedDict(
+            [
+                ("id", 1),
+                ("name", "Jüma"),
+                ("amount", decimal.Decimal("1.50")),
+                ("created", created),
+                ("date", datetime.date(2019, 1, 2)),
+            ]
+        )
+
+        document = MessagePackRenderer().render(data)
+
+        assert msgpack.unpackb(document, raw=False) == {
+            "id": 1,
+            "name": "Jüma",
+            "amount": 1.5,
+            "created": msgpack.Timestamp(1546398245, 6000),
+            "date": "2019-01-02",
+        }
+        assert MessagePackParser().parse(io.BytesIO(document)) == dict(
+            data, amount=1.5, date="2019-01-02"
+        )
+
+    @pytest.mark.parametrize("document", [b"\x81", b"\xc1"])
+    def test_invalid(self, document):
+        with pytest.raises(ParseError):
+            MessagePackParser().parse(io.BytesIO(document))
+
+
+@pytest.mark.django_db
+class TestMessagePackNegotiation:
+    def test_list(self, user):
+        client = APIClient()
+        client.force_authenticate(user=user)
+        url = reverse("api_users:profiles-list", args=["v2"])
+
+        response = client.get(url, HTTP_ACCEPT=MSGPACK)
+        json_response = client.get(url)
+
+        assert response["Content-Type"] == MSGPACK
+        [profile] = msgpack.unpackb(response.content, raw=False, timestamp=3)[
+            "results"
+        ]
+        [json_profile] = json_response.json()["results"]
+        assert profile["username"] == json_profile["username"]
+        assert profile["date_joined"] == user.date_joined
+        assert isinstance(json_profile["date_joined"], str)
+
+    def test_parse_request(self, user):
+        client = APIClient()
+        client.force_authenticate(user=user)
+
+        response = client.patch(
+            reverse("api_users:user-detail", args=["v2", user.id]),
+            msgpack.packb({"bio": "Packed"}),
+            content_type=MSGPACK,
+            HTTP_ACCEPT=MSGPACK,
+        )
+
+        assert response.status_code == 200, response.content
+        assert msgpack.unpackb(response.content, raw=False)["bio"] == "Packed"
+        user.refresh_from_db()
+        assert user.bio == "Packed"
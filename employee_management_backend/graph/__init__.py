@@ -0,0 +1,10 @@
+"""
+Read-only GraphQL API.
+
+Clients query organizations, their users, teams and team members, users and
+their addresses in whatever shape they need at api/<version>/graphql/, as the
+authenticated user. Related objects are fetched through per-request data
+loaders, a query costing one SQL query per level of nesting rather than one
+per object, and queries are rejected before they run when they are deeper or
+may return more objects than the GRAPHQL setting allows.
+"""
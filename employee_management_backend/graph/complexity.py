@@ -0,0 +1,167 @@
+from django.conf import settings
+from graphql import GraphQLError
+from graphql.language import ast
+from graphql.type.definition import GraphQLList, GraphQLNonNull
+
+
+def get_config():
+    config = {
+        "MAX_DEPTH": 8,
+        "MAX_COMPLEXITY": 10000,
+        "PAGE_SIZE": 10,
+        "MAX_PAGE_SIZE": 100,
+    }
+    config.update(getattr(settings, "GRAPHQL", {}))
+    return config
+
+
+class Complexity:
+    """
+    The depth of a query and the number of objects it may return.
+
+    A field returning objects costs the number of objects it may return,
+    first, or PAGE_SIZE, for a list and 1 otherwise, times 1 plus the cost of
+    its selections. A variable first that is not given takes the default of
+    the operation. Scalar and introspection fields are free. Fields and
+    fragments that do not exist are left to validation.
+    """
+
+    def __init__(self, schema, document, variables=None):
+        self.schema = schema
+        self.variables = dict(variables or {})
+        self.fragments = {
+            definition.name.value: definition
+            for definition in document.definitions
+            if isinstance(definition, ast.FragmentDefinition)
+        }
+        self.operations = [
+            definition
+            for definition in document.definitions
+            if isinstance(definition, ast.OperationDefinition)
+        ]
+
+    def get_operation(self, operation_name=None):
+        for operation in self.operations:
+            if operation_name is None and len(self.operations) == 1:
+                return operation
+            if operation.name and operation.name.value == operation_name:
+                return operation
+        return None
+
+    def use_defaults(self, operation):
+        """Add the defaults of the operation's variables not given."""
+        for definition in operation.variable_definitions or []:
+            name = definition.variable.name.value
+            if name not in self.variables and isinstance(
+                definition.default_value, ast.IntValue
+            ):
+                self.variables[name] = int(definition.default_value.value)
+
+    def get_size(self, field):
+        config = get_config()
+        size = config["PAGE_SIZE"]
+        for argument in field.arguments:
+            if argument.name.value != "first":
+                continue
+            if isinstance(argument.value, ast.IntValue):
+                size = int(argument.value.value)
+            elif isinstance(argument.value, ast.Variable):
+                value = self.variables.get(argument.value.name.value)
+                if isinstance(value, int):
+                    size = value
+        if not 0 <= size <= config["MAX_PAGE_SIZE"]:
+            raise GraphQLError(
+                "first must be between 0 and {}.".format(
+                    config["MAX_PAGE_SIZE"]
+                ),
+                [field],
+            )
+        return size
+
+    def measure(self, parent_type, selection_set, depth=1, spreads=()):
+        """Return the cost and depth of the selections of parent_type."""
+        cost, max_depth = 0, depth - 1
+        for selection in selection_set.selections:
+            if isinstance(selection, ast.FragmentSpread):
+                name = selection.name.value
+                if name in spreads or name not in self.fragments:
+                    continue
+                fragment = self.fragments[name]
+                fragment_cost, fragment_depth = self.measure(
+                    self.get_condition_type(fragment, parent_type),
+                    fragment.selection_set,
+                    depth,
+                    spreads + (name,),
+                )
+            elif isinstance(selection, ast.InlineFragment):
+                fragment_cost, fragment_depth = self.measure(
+                    self.get_condition_type(selection, parent_type),
+                    selection.selection_set,
+                    depth,
+                    spreads,
+                )
+            else:
+                fragment_cost, fragment_depth = self.measure_field(
+                    parent_type, selection, depth, spreads
+                )
+            cost += fragment_cost
+            max_depth = max(max_depth, fragment_depth)
+        return cost, max_depth
+
+    def measure_field(self, parent_type, field, depth, spreads):
+        name = field.name.value
+        definition = getattr(parent_type, "fields", {}).get(name)
+        if name.startswith("__") or definition is None:
+            return 0, depth
+        if field.selection_set is None:
+            return 0, depth
+
+        field_type, is_list = definition.type, False
+        while isinstance(field_type, (GraphQLList, GraphQLNonNull)):
+            is_list = is_list or isinstance(field_type, GraphQLList)
+            field_type = field_type.of_type
+        cost, max_depth = self.measure(
+            field_type, field.selection_set, depth + 1, spreads
+        )
+        return (self.get_size(field) if is_list else 1) * (1 + cost), max_depth
+
+    def get_condition_type(self, fragment, parent_type):
+        if fragment.type_condition is None:
+            return parent_type
+        return self.schema.get_type(fragment.type_condition.name.value)
+
+
+def get_errors(schema, document, variables=None, operation_name=None):
+    """Return the errors of a query too deep or costly to run."""
+    complexity = Complexity(schema, document, variables)
+    operation = complexity.get_operation(operation_name)
+    if operation is None:
+        return []
+    complexity.use_defaults(operation)
+    try:
+        cost, depth = complexity.measure(
+            schema.get_query_type(), operation.selection_set
+        )
+    except GraphQLError as error:
+        return [error]
+
+    config = get_config()
+    if depth > config["MAX_DEPTH"]:
+        return [
+            GraphQLError(
+                "Query depth {} exceeds the maximum of {}.".format(
+                    depth, config["MAX_DEPTH"]
+                ),
+                [operation],
+            )
+        ]
+    if cost > config["MAX_COMPLEXITY"]:
+        return [
+            GraphQLError(
+                "Query complexity {} exceeds the maximum of {}.".format(
+                    cost, config["MAX_COMPLEXITY"]
+                ),
+                [operation],
+            )
+        ]
+    return []
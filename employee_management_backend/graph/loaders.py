@@ -0,0 +1,143 @@
+from collections import defaultdict
+
+from django.db import connections, router
+from django.db.models import F, Window
+from django.db.models.functions import RowNumber
+from django.utils.functional import cached_property
+from organizations.models import Organization, OrganizationUser
+from promise import Promise
+from promise.dataloader import DataLoader
+
+from employee_management_backend.companies.models import Team, TeamMember
+from employee_management_backend.users.models import Address, User
+
+
+class ModelLoader(DataLoader):
+    """Objects of a queryset by primary key, None for the missing ones."""
+
+    def __init__(self, queryset):
+        super().__init__()
+        self.queryset = queryset
+
+    def batch_load_fn(self, keys):
+        objects = self.queryset.in_bulk(keys)
+        return Promise.resolve([objects.get(key) for key in keys])
+
+
+class RelatedLoader(DataLoader):
+    """
+    The first objects of a queryset, in primary key order, by the value of a
+    field. Keys are (value, number of objects) pairs.
+
+    The objects of any number of values are fetched together, with a query
+    per number of objects, ranking them with a window function where the
+    database supports them, otherwise with one query per value.
+    """
+
+    def __init__(self, queryset, field):
+        super().__init__()
+        self.queryset = queryset.order_by("pk")
+        self.field = field
+
+    def batch_load_fn(self, keys):
+        values_by_size = defaultdict(list)
+        for value, size in keys:
+            values_by_size[size].append(value)
+        related = {}
+        for size, values in values_by_size.items():
+            for value, objects in self.get_first(values, size).items():
+                related[value, size] = objects
+        return Promise.resolve([related[key] for key in keys])
+
+    def get_first(self, values, size):
+        """Return the first size objects of each value."""
+        if size == 0:
+            return {value: [] for value in values}
+        connection = connections[router.db_for_read(self.queryset.model)]
+        if not connection.features.supports_over_clause:
+            return {
+                value: list(self.queryset.filter(**{self.field: value})[:size])
+                for value in values
+            }
+
+        ranked = (
+            self.queryset.filter(**{self.field + "__in": values})
+            .annotate(
+                position=Window(
+                    RowNumber(),
+                    partition_by=[F(self.field)],
+                    order_by=F("pk").asc(),
+                )
+            )
+            .order_by()
+            .values("pk", "position")
+        )
+        # Window functions cannot be filtered on directly, so the ranking is
+        # wrapped in a subquery, as in companies.members.
+        sql, params = ranked.query.sql_with_params()
+        quote_name = connection.ops.quote_name
+        meta = self.queryset.model._meta
+        first_objects = (
+            "{table}.{pk} IN (SELECT {pk} FROM ({ranked}) {alias} "
+            "WHERE {position} <= %s)".format(
+                table=quote_name(meta.db_table),
+                pk=quote_name(meta.pk.column),
+                ranked=sql,
+                alias=quote_name("ranked"),
+                position=quote_name("position"),
+            )
+        )
+        related = {value: [] for value in values}
+        for obj in self.queryset.extra(
+            where=[first_objects], params=params + (size,)
+        ):
+            related[getattr(obj, self.field)].append(obj)
+        return related
+
+
+class Loaders:
+    """The data loaders of a request, created when first used."""
+
+    @cached_property
+    def organizations(self):
+        return ModelLoader(Organization.objects.all())
+
+    @cached_property
+    def organization_users(self):
+        return ModelLoader(OrganizationUser.objects.all())
+
+    @cached_property
+    def organization_users_by_organization(self):
+        return RelatedLoader(OrganizationUser.objects.all(), "organization_id")
+
+    @cached_property
+    def teams(self):
+        return ModelLoader(Team.objects.all())
+
+    @cached_property
+    def teams_by_organization(self):
+        return RelatedLoader(Team.objects.all(), "organization_id")
+
+    @cached_property
+    def team_members_by_team(self):
+        return RelatedLoader(TeamMember.objects.all(), "team_id")
+
+    @cached_property
+    def team_members_by_organization_user(self):
+        return RelatedLoader(TeamMember.objects.all(), "organization_user_id")
+
+    @cached_property
+    def users(self):
+        return ModelLoader(User.objects.all())
+
+    @cached_property
+    def addresses_by_user(self):
+        return RelatedLoader(Address.objects.all(), "user_id")
+
+
+def get_loaders(info):
+    """Return the data loaders of the request being resolved."""
+    request = info.context
+    if not hasattr(request, "loaders"):
+        request.loaders = Loaders()
+    return request.loaders
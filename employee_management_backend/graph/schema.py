@@ -0,0 +1,191 @@
+import graphene
+from graphene_django import DjangoObjectType
+from graphql import GraphQLError
+from organizations.models import Organization, OrganizationUser
+
+from employee_management_backend.companies.models import Team, TeamMember
+from employee_management_backend.graph.complexity import get_config
+from employee_management_backend.graph.loaders import get_loaders
+from employee_management_backend.users.models import Address, User
+
+
+def List(of_type, **kwargs):
+    """A list field of at most first objects, PAGE_SIZE by default."""
+    return graphene.List(
+        graphene.NonNull(of_type),
+        required=True,
+        first=graphene.Int(),
+        **kwargs
+    )
+
+
+def get_page_size(first):
+    """Return the number of objects of a list, checked as it is resolved."""
+    config = get_config()
+    size = config["PAGE_SIZE"] if first is None else first
+    if not 0 <= size <= config["MAX_PAGE_SIZE"]:
+        raise GraphQLError(
+            "first must be between 0 and {}.".format(config["MAX_PAGE_SIZE"])
+        )
+    return size
+
+
+class AddressType(DjangoObjectType):
+    class Meta:
+        model = Address
+        name = "Address"
+        only_fields = (
+            "id",
+            "address1",
+            "address2",
+            "area",
+            "city",
+            "county",
+            "postcode",
+            "country",
+        )
+
+
+class UserType(DjangoObjectType):
+    avatar = graphene.String()
+    salutation = graphene.String(required=True)
+    gender = graphene.String(required=True)
+    addresses = List(AddressType, description="Only the requesting user's.")
+
+    class Meta:
+        model = User
+        name = "User"
+        only_fields = (
+            "id",
+            "username",
+            "first_name",
+            "last_name",
+            "name",
+            "bio",
+            "date_joined",
+        )
+
+    def resolve_avatar(self, info):
+        return self.avatar.url if self.avatar else None
+
+    def resolve_addresses(self, info, first=None):
+        if self.id != info.context.user.id:
+            return []
+        return get_loaders(info).addresses_by_user.load(
+            (self.id, get_page_size(first))
+        )
+
+
+class OrganizationType(DjangoObjectType):
+    organization_users = List(lambda: OrganizationUserType)
+    teams = List(lambda: TeamType)
+
+    class Meta:
+        model = Organization
+        name = "Organization"
+        only_fields = (
+            "id",
+            "name",
+            "slug",
+            "is_active",
+            "created",
+            "modified",
+        )
+
+    def resolve_organization_users(self, info, first=None):
+        return get_loaders(info).organization_users_by_organization.load(
+            (self.id, get_page_size(first))
+        )
+
+    def resolve_teams(self, info, first=None):
+        return get_loaders(info).teams_by_organization.load(
+            (self.id, get_page_size(first))
+        )
+
+
+class OrganizationUserType(DjangoObjectType):
+    organization = graphene.Field(OrganizationType, required=True)
+    user = graphene.Field(UserType, required=True)
+    team_members = List(lambda: TeamMemberType)
+
+    class Meta:
+        model = OrganizationUser
+        name = "OrganizationUser"
+        only_fields = ("id", "is_admin", "created", "modified")
+
+    def resolve_organization(self, info):
+        return get_loaders(info).organizations.load(self.organization_id)
+
+    def resolve_user(self, info):
+        return get_loaders(info).users.load(self.user_id)
+
+    def resolve_team_members(self, info, first=None):
+        return get_loaders(info).team_members_by_organization_user.load(
+            (self.id, get_page_size(first))
+        )
+
+
+class TeamType(DjangoObjectType):
+    organization = graphene.Field(OrganizationType, required=True)
+    team_members = List(lambda: TeamMemberType)
+
+    class Meta:
+        model = Team
+        name = "Team"
+        only_fields = ("id", "name", "created", "modified")
+
+    def resolve_organization(self, info):
+        return get_loaders(info).organizations.load(self.organization_id)
+
+    def resolve_team_members(self, info, first=None):
+        return get_loaders(info).team_members_by_team.load(
+            (self.id, get_page_size(first))
+        )
+
+
+class TeamMemberType(DjangoObjectType):
+    team = graphene.Field(TeamType, required=True)
+    organization_user = graphene.Field(OrganizationUserType, required=True)
+
+    class Meta:
+        model = TeamMember
+        name = "TeamMember"
+        only_fields = ("id", "is_admin", "created", "modified")
+
+    def resolve_team(self, info):
+        return get_loaders(info).teams.load(self.team_id)
+
+    def resolve_organization_user(self, info):
+        return get_loaders(info).organization_users.load(
+            self.organization_user_id
+        )
+
+
+class Query(graphene.ObjectType):
+    me = graphene.Field(UserType, required=True)
+    organization = graphene.Field(
+        OrganizationType, id=graphene.Int(required=True)
+    )
+    organizations = List(
+        OrganizationType,
+        after=graphene.Int(description="Return organizations after this id."),
+    )
+
+    def resolve_me(self, info):
+        return info.context.user
+
+    def resolve_organization(self, info, id):
+        return Organization.objects.filter(
+            users=info.context.user, id=id
+        ).first()
+
+    def resolve_organizations(self, info, first=None, after=None):
+        queryset = Organization.objects.filter(
+            users=info.context.user
+        ).order_by("id")
+        if after is not None:
+            queryset = queryset.filter(id__gt=after)
+        return queryset[: get_page_size(first)]
+
+
+schema = graphene.Schema(query=Query)
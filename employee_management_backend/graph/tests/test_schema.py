@@ -0,0 +1,288 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from organizations.models import Organization
+from rest_framework.test import APIClient
+
+from employee_management_backend.companies.models import Team, TeamMember
+from employee_management_backend.graph import complexity
+from employee_management_backend.users.models import Address
+from employee_management_backend.users.tests.factories import UserFactory
+
+pytestmark = pytest.mark.django_db
+
+ORGANIZATIONS = """
+query {
+  organizations {
+    name
+    organizationUsers {
+      isAdmin
+      user { username }
+    }
+    teams {
+      name
+      teamMembers {
+        organizationUser { user { username } }
+      }
+    }
+  }
+}
+"""
+
+
+@pytest.fixture
+def client(user):
+    client = APIClient()
+    client.force_authenticate(user=user)
+    return client
+
+
+def make_organization(name, users, teams=2):
+    organization = Organization.objects.create(name=name)
+    organization_users = [
+        organization.get_or_add_user(user)[0] for user in users
+    ]
+    for index in range(teams):
+        team = Team.objects.create(
+            organization=organization, name="{} Team {}".format(name, index)
+        )
+        for organization_user in organization_users:
+            TeamMember.objects.create(
+                team=team, organization_user=organization_user, is_admin=False
+            )
+    return organization
+
+
+def query(client, document, **variables):
+    return client.post(
+        reverse("graph:graphql", args=["v2"]),
+        {"query": document, "variables": variables},
+        format="json",
+    )
+
+
+class TestSchema:
+    def test_organizations(
+        self, client, user, django_assert_num_queries, monkeypatch
+    ):
+        # SQLite supports window functions since 3.25, Django 2.0 does not
+        # know it.
+        monkeypatch.setattr(connection.features, "supports_over_clause", True)
+        other = UserFactory()
+        make_organization("Test Organization", [user, other])
+        make_organization("Test Organization(Other)", [other])
+
+        with django_assert_num_queries(8):
+            response = query(client, ORGANIZATIONS)
+
+        assert response.status_code == 200, response.content
+        [organization] = response.json()["data"]["organizations"]
+        assert organization["name"] == "Test Organization"
+        assert organization["organizationUsers"] == [
+            {"isAdmin": True, "user": {"username": user.username}},
+            {"isAdmin": False, "user": {"username": other.username}},
+        ]
+        assert [team["name"] for team in organization["teams"]] == [
+            "Test Organization Team 0",
+            "Test Organization Team 1",
+        ]
+        assert organization["teams"][0]["teamMembers"] == [
+            {"organizationUser": {"user": {"username": user.username}}},
+            {"organizationUser": {"user": {"username": other.username}}},
+        ]
+
+        # A query per level, however many objects each level has. Users
+        # already loaded for an organization user are not fetched again.
+        make_organization("Test Organization(Larger)", [user, other], teams=4)
+        with django_assert_num_queries(8):
+            response = query(client, ORGANIZATIONS)
+        assert len(response.json()["data"]["organizations"]) == 2
+
+    @pytest.mark.parametrize("supports_over_clause", [True, False])
+    def test_first_limited_in_database(
+        self, client, user, monkeypatch, supports_over_clause
+    ):
+        monkeypatch.setattr(
+            connection.features, "supports_over_clause", supports_over_clause
+        )
+        users = [user] + [UserFactory() for _ in range(3)]
+        make_organization("Test Organization", users, teams=0)
+        make_organization("Test Organization(Other)", users, teams=0)
+
+        with CaptureQueriesContext(connection) as context:
+            response = query(
+                client,
+                """
+                query {
+                  organizations { organizationUsers(first: 2) { id } }
+                }
+                """,
+            )
+
+        assert [
+            len(organization["organizationUsers"])
+            for organization in response.json()["data"]["organizations"]
+        ] == [2, 2]
+        [organization_users_query, *_] = [
+            executed["sql"]
+            for executed in context.captured_queries
+            if '"organizations_organizationuser"."is_admin"' in executed["sql"]
+        ]
+        if supports_over_clause:
+            assert "ROW_NUMBER()" in organization_users_query
+            assert '"position" <= 2' in organization_users_query
+        else:
+            assert "LIMIT 2" in organization_users_query
+
+    def test_organization(self, client, user):
+        organization = make_organization("Test Organization", [user])
+        other = make_organization("Test Organization(Other)", [UserFactory()])
+        document = """
+        query ($id: Int!) {
+          organization(id: $id) { name teams(first: 1) { name } }
+        }
+        """
+
+        response = query(client, document, id=organization.id)
+        other_response = query(client, document, id=other.id)
+
+        assert response.json()["data"]["organization"] == {
+            "name": "Test Organization",
+            "teams": [{"name": "Test Organization Team 0"}],
+        }
+        assert other_response.json()["data"]["organization"] is None
+
+    def test_addresses(self, client, user):
+        other = UserFactory()
+        make_organization("Test Organization", [user, other])
+        Address.objects.create(
+            user=user, address1="Moi Avenue", city="Nairobi"
+        )
+        Address.objects.create(user=other, address1="Kenyatta", city="Nakuru")
+
+        response = query(
+            client,
+            """
+            query {
+              me { addresses { city } }
+              organizations {
+                organizationUsers { user { username addresses { city } } }
+              }
+            }
+            """,
+        )
+
+        data = response.json()["data"]
+        assert data["me"]["addresses"] == [{"city": "Nairobi"}]
+        assert [
+            organization_user["user"]["addresses"]
+            for organization_user in data["organizations"][0][
+                "organizationUsers"
+            ]
+        ] == [[{"city": "Nairobi"}], []]
+
+    def test_anonymous(self):
+        response = query(APIClient(), "query { me { username } }")
+
+        assert response.status_code == 401
+
+
+class TestComplexity:
+    @pytest.fixture(autouse=True)
+    def limits(self, settings):
+        settings.GRAPHQL = {
+            "MAX_DEPTH": 4,
+            "MAX_COMPLEXITY": 1000,
+            "PAGE_SIZE": 10,
+            "MAX_PAGE_SIZE": 50,
+        }
+
+    def test_depth(self, client):
+        response = query(
+            client,
+            """
+            query {
+              organizations { teams { organization { teams { name } } } }
+            }
+            """,
+        )
+
+        assert response.status_code == 400
+        assert response.json()["errors"][0]["message"] == (
+            "Query depth 5 exceeds the maximum of 4."
+        )
+
+    def test_complexity(self, client):
+        # 10 * (1 + 10 * (1 + 10)) objects.
+        document = """
+        query ($first: Int) {
+          organizations {
+            ...Teams
+          }
+        }
+        fragment Teams on Organization {
+          teams(first: $first) { teamMembers { id } }
+        }
+        """
+
+        response = query(client, document)
+        small_response = query(client, document, first=5)
+
+        assert response.status_code == 400
+        assert response.json()["errors"][0]["message"] == (
+            "Query complexity 1110 exceeds the maximum of 1000."
+        )
+        assert small_response.status_code == 200, small_response.content
+
+    def test_page_size(self, client):
+        response = query(client, "query { organizations(first: 51) { id } }")
+
+        assert response.status_code == 400
+        assert response.json()["errors"][0]["message"] == (
+            "first must be between 0 and 50."
+        )
+
+    def test_page_size_default(self, client, user):
+        make_organization("Test Organization", [user], teams=0)
+        document = """
+        query ($first: Int = 51) {
+          organizations { organizationUsers(first: $first) { id } }
+        }
+        """
+
+        response = query(client, document)
+        small_response = query(client, document, first=5)
+
+        assert response.status_code == 400
+        assert response.json()["errors"][0]["message"] == (
+            "first must be between 0 and 50."
+        )
+        assert small_response.status_code == 200, small_response.content
+
+    def test_page_size_checked_when_resolved(self, client, user, monkeypatch):
+        make_organization("Test Organization", [user], teams=0)
+        monkeypatch.setattr(complexity, "get_errors", lambda *args: [])
+
+        response = query(
+            client,
+            "query { organizations { organizationUsers(first: 51) { id } } }",
+        )
+
+        [error] = response.json()["errors"]
+        assert error["message"] == "first must be between 0 and 50."
+        assert response.json()["data"] is None
+
+    def test_introspection(self, client):
+        response = query(
+            client,
+            """
+            query {
+              __schema {
+                types { fields { type { ofType { ofType { name } } } } }
+              }
+            }
+            """,
+        )
+
+        assert response.status_code == 200, response.content
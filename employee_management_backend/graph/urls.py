@@ -0,0 +1,5 @@
+from django.urls import path
+
+from employee_management_backend.graph import views
+
+urlpatterns = [path("graphql/", views.graphql_view, name="graphql")]
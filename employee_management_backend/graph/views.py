@@ -0,0 +1,68 @@
+from django.conf import settings
+from graphene_django.views import GraphQLView
+from graphql import GraphQLError, parse
+from graphql.execution import ExecutionResult
+from rest_framework import permissions
+from rest_framework.decorators import (
+    api_view,
+    authentication_classes,
+    permission_classes,
+)
+from rest_framework.settings import api_settings
+
+from employee_management_backend.graph import complexity
+from employee_management_backend.graph.schema import schema
+
+
+class GraphQLAPIView(GraphQLView):
+    """GraphQL Endpoint.
+
+    get:
+    # Run a GraphQL query given in the query parameter.
+    post:
+    # Run a GraphQL query given in the JSON body.
+    * The schema is read-only: organizations, organization users, teams,
+      team members, users and addresses, those of the organizations of the
+      authenticated user.
+    * Lists return the first argument's number of objects, 10 by default.
+    # Returns
+    * data and, if any, errors.
+    # Raises
+    * status.HTTP_400_BAD_REQUEST
+        * If the query is not valid, deeper than GRAPHQL["MAX_DEPTH"] or may
+          return more than GRAPHQL["MAX_COMPLEXITY"] objects.
+    * status.HTTP_401_UNAUTHORIZED
+        * If request is from anonymous user.
+    """
+
+    def execute_graphql_request(
+        self, request, data, query, variables, operation_name, *args, **kwargs
+    ):
+        if query:
+            try:
+                document = parse(query)
+            except GraphQLError:
+                # Reported when the query is run.
+                document = None
+            if document is not None:
+                errors = complexity.get_errors(
+                    self.schema, document, variables, operation_name
+                )
+                if errors:
+                    return ExecutionResult(errors=errors, invalid=True)
+        return super().execute_graphql_request(
+            request, data, query, variables, operation_name, *args, **kwargs
+        )
+
+    @classmethod
+    def as_view(cls, **initkwargs):
+        # Authenticated as the rest of the API is.
+        view = super().as_view(**initkwargs)
+        view = permission_classes([permissions.IsAuthenticated])(view)
+        view = authentication_classes(
+            api_settings.DEFAULT_AUTHENTICATION_CLASSES
+        )(view)
+        return api_view(["GET", "POST"])(view)
+
+
+graphql_view = GraphQLAPIView.as_view(schema=schema, graphiql=settings.DEBUG)
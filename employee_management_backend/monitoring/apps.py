@@ -0,0 +1,6 @@
+from django.apps import AppConfig
+
+
+class MonitoringConfig(AppConfig):
+    name = "employee_management_backend.monitoring"
+    verbose_name = "Monitoring"
@@ -0,0 +1,49 @@
+"""
+Cache backends counting hits and misses of the current request.
+
+They behave exactly like the backends they extend; only lookups done with
+get() and get_many() are counted.
+"""
+import threading
+
+from django.core.cache.backends.locmem import LocMemCache
+from django_redis.cache import RedisCache
+
+from employee_management_backend.monitoring.instrumentation import (
+    record_cache_access,
+)
+
+_missing = object()
+
+
+class CacheInstrumentationMixin:
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Some backends implement get_many() with get(); lookups are then
+        # only counted once, by get_many().
+        self._local = threading.local()
+
+    def get(self, key, default=None, version=None, **kwargs):
+        value = super().get(key, _missing, version=version, **kwargs)
+        hit = value is not _missing
+        if not getattr(self._local, "in_get_many", False):
+            record_cache_access(hits=int(hit), misses=int(not hit))
+        return value if hit else default
+
+    def get_many(self, keys, version=None, **kwargs):
+        keys = list(keys)
+        self._local.in_get_many = True
+        try:
+            values = super().get_many(keys, version=version, **kwargs)
+        finally:
+            self._local.in_get_many = False
+        record_cache_access(hits=len(values), misses=len(keys) - len(values))
+        return values
+
+
+class InstrumentedLocMemCache(CacheInstrumentationMixin, LocMemCache):
+    pass
+
+
+class InstrumentedRedisCache(CacheInstrumentationMixin, RedisCache):
+    pass
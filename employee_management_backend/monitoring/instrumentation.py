@@ -0,0 +1,128 @@
+"""
+Per-request performance counters.
+
+RequestInstrumentationMiddleware activates a RequestMetrics for the request
+being handled by the current thread. Database queries are counted through an
+execution wrapper installed by the middleware, cache lookups by the cache
+backends in monitoring.cache, serialization by InstrumentedModelSerializer
+and any other step can be timed with::
+
+    with timer("render"):
+        ...
+
+Outside of a request, or when the middleware is not installed, all of these
+are no-ops.
+"""
+import threading
+import time
+from contextlib import contextmanager
+
+from employee_management_backend.monitoring.metrics import (
+    count_cache_access,
+    observe_query,
+)
+from employee_management_backend.monitoring import slow_queries
+
+_local = threading.local()
+
+
+class RequestMetrics:
+    """Counters collected while handling a single request."""
+
+    def __init__(self, slow_query_threshold=None):
+        self.started = time.perf_counter()
+        self.slow_query_threshold = slow_query_threshold
+        self.view_name = None
+        self.duration = None
+        self.query_count = 0
+        self.db_time = 0.0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        # Seconds spent in named steps, e.g. "serializer".
+        self.timers = {}
+
+    def record_query(self, execute, sql, params, many, context):
+        """Database execution wrapper counting queries and their time."""
+        started = time.perf_counter()
+        try:
+            result = execute(sql, params, many, context)
+        finally:
+            duration = time.perf_counter() - started
+            self.query_count += 1
+            self.db_time += duration
+            observe_query(duration)
+        if (
+            self.slow_query_threshold is not None
+            and duration >= self.slow_query_threshold
+            and not many
+        ):
+            slow_queries.capture(
+                context["connection"], sql, params, duration, self.view_name
+            )
+        return result
+
+    def record_cache_access(self, hits, misses):
+        self.cache_hits += hits
+        self.cache_misses += misses
+
+    def add_time(self, name, seconds):
+        self.timers[name] = self.timers.get(name, 0.0) + seconds
+
+    def finish(self):
+        self.duration = time.perf_counter() - self.started
+
+    def as_dict(self):
+        """Return the counters as flat fields, durations in milliseconds."""
+        fields = {
+            "duration_ms": round((self.duration or 0) * 1000, 2),
+            "query_count": self.query_count,
+            "db_ms": round(self.db_time * 1000, 2),
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
+        }
+        for name, seconds in sorted(self.timers.items()):
+            fields["{}_ms".format(name)] = round(seconds * 1000, 2)
+        return fields
+
+
+def activate(metrics):
+    _local.metrics = metrics
+
+
+def deactivate():
+    _local.metrics = None
+
+
+def get_current_metrics():
+    return getattr(_local, "metrics", None)
+
+
+def record_cache_access(hits, misses):
+    count_cache_access(hits, misses)
+    metrics = get_current_metrics()
+    if metrics is not None:
+        metrics.record_cache_access(hits, misses)
+
+
+@contextmanager
+def timer(name):
+    """
+    Add the time spent in the block to the current request's named timer.
+
+    Nested blocks for the same name are only counted once, by the outermost
+    block.
+    """
+    metrics = get_current_metrics()
+    running = getattr(_local, "running_timers", None)
+    if running is None:
+        running = _local.running_timers = set()
+    if metrics is None or name in running:
+        yield
+        return
+    running.add(name)
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        running.discard(name)
+        metrics.add_time(name, time.perf_counter() - started)
@@ -0,0 +1,309 @@
+"""
+Non-blocking log handling.
+
+BackgroundHandler puts log records on a bounded in-process queue and returns
+at once. A single daemon thread per process takes them off the queue and
+passes them to the handlers that do the slow work: writing to files and
+streams, and collecting errors for the admins. Records are dropped, and the
+number of dropped records reported, rather than blocking the thread that
+logs when the queue is full.
+
+Errors are not mailed one by one. ErrorDigestHandler groups them by
+fingerprint, the logger, message template, exception type and location, and
+every INTERVAL seconds of the ERROR_DIGEST setting hands the groups to the
+send_error_digest Celery task, which mails the admins the groups they have
+not heard about for DEDUPLICATE_FOR seconds, at most MAX_PER_HOUR times an
+hour.
+
+JSONFormatter renders records as one JSON object per line.
+
+Handlers are configured in LOGGING before Django's apps are loaded, so this
+module must not import models or the Celery app at import time.
+"""
+import atexit
+import datetime
+import hashlib
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import threading
+import time
+
+QUEUE_SIZE = 10000
+# Seconds between two flushes of the handlers by the listener.
+FLUSH_INTERVAL = 1
+MAX_EXCEPTION_LENGTH = 5000
+
+_stop = object()
+
+
+def get_digest_config():
+    from django.conf import settings
+
+    config = {
+        "INTERVAL": 60,
+        "DEDUPLICATE_FOR": 60 * 60,
+        "MAX_PER_HOUR": 12,
+        "CACHE": "default",
+    }
+    config.update(getattr(settings, "ERROR_DIGEST", {}))
+    return config
+
+
+class LogPipeline:
+    """A queue of records and the thread passing them to their handlers."""
+
+    def __init__(self, maxsize=QUEUE_SIZE):
+        self.maxsize = maxsize
+        self.lock = threading.Lock()
+        self.handlers = set()
+        self.pid = None
+        self.queue = None
+        self.thread = None
+        self.dropped = 0
+
+    def start(self):
+        # A forked child has a copy of the queue but not the thread.
+        if self.pid == os.getpid():
+            return
+        with self.lock:
+            if self.pid == os.getpid():
+                return
+            self.queue = queue.Queue(self.maxsize)
+            self.dropped = 0
+            self.thread = threading.Thread(
+                target=self.run, name="log-pipeline", daemon=True
+            )
+            self.thread.start()
+            self.pid = os.getpid()
+        atexit.register(self.stop)
+
+    def put(self, handlers, record):
+        self.start()
+        try:
+            self.queue.put_nowait((handlers, record))
+        except queue.Full:
+            self.dropped += 1
+
+    def run(self):
+        flushed = time.monotonic()
+        while True:
+            try:
+                item = self.queue.get(timeout=FLUSH_INTERVAL)
+            except queue.Empty:
+                item = None
+            if item is _stop:
+                break
+            if item is not None:
+                handlers, record = item
+                for handler in handlers:
+                    if record.levelno >= handler.level:
+                        handler.handle(record)
+            if time.monotonic() - flushed >= FLUSH_INTERVAL:
+                self.report_dropped()
+                self.flush()
+                flushed = time.monotonic()
+        self.report_dropped()
+        self.flush()
+
+    def report_dropped(self):
+        dropped, self.dropped = self.dropped, 0
+        if not dropped:
+            return
+        record = logging.LogRecord(
+            __name__,
+            logging.WARNING,
+            __file__,
+            0,
+            "Dropped %d log records, the log queue was full.",
+            (dropped,),
+            None,
+        )
+        for handler in self.handlers:
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+    def flush(self):
+        for handler in self.handlers:
+            try:
+                handler.flush()
+            except Exception:
+                handler.handleError(None)
+
+    def stop(self, timeout=5):
+        """Process the records left in the queue and stop the thread."""
+        if self.pid != os.getpid() or not self.thread.is_alive():
+            return
+        try:
+            self.queue.put(_stop, timeout=timeout)
+        except queue.Full:
+            return
+        self.thread.join(timeout)
+
+
+pipeline = LogPipeline()
+
+
+def get_request_fields(request):
+    """Return the method and path of the request logged with a record."""
+    if isinstance(request, dict):
+        return request
+    return {
+        "method": getattr(request, "method", None),
+        "path": getattr(request, "path", None),
+    }
+
+
+class BackgroundHandler(logging.handlers.QueueHandler):
+    """
+    Pass records to handlers from the log pipeline's thread.
+
+    handlers are handler instances, referenced in LOGGING as
+    "cfg://handlers.<name>". dictConfig configures handlers in the order of
+    their names, so these must sort before the name of the BackgroundHandler.
+    """
+
+    def __init__(self, handlers, pipeline=pipeline):
+        super().__init__(None)
+        # Indexing, unlike iterating, resolves dictConfig's cfg:// references.
+        self.handlers = [handlers[index] for index in range(len(handlers))]
+        self.pipeline = pipeline
+        self.pipeline.handlers.update(self.handlers)
+
+    def prepare(self, record):
+        # Merge the arguments into the message and render the exception now,
+        # while they are what they were when the record was logged, without
+        # the traceback and request that would keep their objects alive.
+        record = logging.makeLogRecord(record.__dict__)
+        record.message_template = str(record.msg)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = logging.Formatter().formatException(
+                    record.exc_info
+                )
+            record.exc_type = record.exc_info[0].__name__
+            record.exc_info = None
+        request = getattr(record, "request", None)
+        if request is not None:
+            record.request = get_request_fields(request)
+        return record
+
+    def enqueue(self, record):
+        self.pipeline.put(self.handlers, record)
+
+
+class JSONFormatter(logging.Formatter):
+    """Render records as JSON objects."""
+
+    def format(self, record):
+        fields = {
+            "timestamp": datetime.datetime.utcfromtimestamp(
+                record.created
+            ).isoformat()
+            + "Z",
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "module": record.module,
+            "process": record.process,
+            "thread": record.thread,
+        }
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            fields["exception"] = record.exc_text
+        status_code = getattr(record, "status_code", None)
+        if status_code is not None:
+            fields["status_code"] = status_code
+        request = getattr(record, "request", None)
+        if request is not None:
+            fields["request"] = get_request_fields(request)
+        request_metrics = getattr(record, "request_metrics", None)
+        if request_metrics is not None:
+            fields["request_metrics"] = request_metrics
+        return json.dumps(fields, default=str)
+
+
+def get_fingerprint(record):
+    exc_type = getattr(record, "exc_type", None)
+    if exc_type is None and record.exc_info:
+        exc_type = record.exc_info[0].__name__
+    key = "|".join(
+        str(part)
+        for part in [
+            record.name,
+            getattr(record, "message_template", record.msg),
+            exc_type,
+            record.pathname,
+            record.lineno,
+        ]
+    )
+    return hashlib.sha1(key.encode()).hexdigest()
+
+
+class ErrorDigestHandler(logging.Handler):
+    """Collect errors and send them to the admins in digests."""
+
+    def __init__(self, level=logging.ERROR):
+        super().__init__(level)
+        self.entries = {}
+        self.sent = time.monotonic()
+
+    def emit(self, record):
+        fingerprint = get_fingerprint(record)
+        seen = datetime.datetime.utcfromtimestamp(record.created).isoformat()
+        entry = self.entries.get(fingerprint)
+        if entry is None:
+            if record.exc_info and not record.exc_text:
+                record.exc_text = logging.Formatter().formatException(
+                    record.exc_info
+                )
+            self.entries[fingerprint] = {
+                "fingerprint": fingerprint,
+                "logger": record.name,
+                "level": record.levelname,
+                "message": record.getMessage(),
+                "exception": (record.exc_text or "")[:MAX_EXCEPTION_LENGTH],
+                "count": 1,
+                "first_seen": seen,
+                "last_seen": seen,
+            }
+        else:
+            entry["count"] += 1
+            entry["last_seen"] = seen
+
+    def flush(self, force=False):
+        self.acquire()
+        try:
+            if not self.entries:
+                return
+            interval = get_digest_config()["INTERVAL"]
+            if not force and time.monotonic() - self.sent < interval:
+                return
+            entries = list(self.entries.values())
+            self.entries = {}
+            self.sent = time.monotonic()
+        finally:
+            self.release()
+        self.send(entries)
+
+    def send(self, entries):
+        from employee_management_backend.monitoring.tasks import (
+            send_error_digest,
+        )
+
+        try:
+            send_error_digest.apply_async(args=[entries], retry=False)
+        except Exception:
+            # The broker may be what is failing, the errors then only reach
+            # the other handlers.
+            self.handleError(None)
+
+    def close(self):
+        self.flush(force=True)
+        super().close()
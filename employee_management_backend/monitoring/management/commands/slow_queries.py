@@ -0,0 +1,47 @@
+from django.core.management.base import BaseCommand
+
+from employee_management_backend.monitoring.slow_queries import (
+    clear_slow_queries,
+    get_slow_queries,
+)
+
+
+class Command(BaseCommand):
+    help = "List the captured slow queries, the most recent first."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--limit", type=int, default=20, help="Number of queries shown."
+        )
+        parser.add_argument(
+            "--explain",
+            action="store_true",
+            help="Show the query plans, when one was sampled.",
+        )
+        parser.add_argument(
+            "--clear", action="store_true", help="Remove every captured query."
+        )
+
+    def handle(self, *args, **options):
+        if options["clear"]:
+            clear_slow_queries()
+            self.stdout.write("Slow queries cleared.")
+            return
+
+        slow_queries = get_slow_queries()[: options["limit"]]
+        if not slow_queries:
+            self.stdout.write("No slow queries captured.")
+        for slow_query in slow_queries:
+            self.stdout.write(
+                self.style.WARNING(
+                    "{captured} {duration_ms}ms {view}".format(**slow_query)
+                )
+            )
+            self.stdout.write(slow_query["sql"])
+            if slow_query["params"] is not None:
+                self.stdout.write(
+                    "Parameters: {}".format(slow_query["params"])
+                )
+            if options["explain"] and slow_query["explain"]:
+                self.stdout.write(slow_query["explain"])
+            self.stdout.write("")
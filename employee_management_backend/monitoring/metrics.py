@@ -0,0 +1,396 @@
+"""
+In-process metrics registry exposed in the Prometheus text format.
+
+Every process (gunicorn workers, Celery workers) records into its own
+registry. When the METRICS_DIR setting is set, each registry is written to
+``<METRICS_DIR>/<hostname>-<pid>.json`` every METRICS_FLUSH_INTERVAL seconds
+and when the process exits, and the scrape endpoint merges the files of all
+processes, so that a scrape answered by any worker reports the totals of all
+of them. The directory is shared between the containers running the
+application. Without METRICS_DIR the endpoint only reports the process
+answering the scrape.
+
+Only counters and histograms are recorded: both can be summed across
+processes, and counts recorded by processes that have exited stay in the
+totals, as Prometheus expects from counters. Values that cannot be summed,
+the cache hit ratio and the connection slots in use on the host, are
+computed when rendering.
+"""
+import atexit
+import bisect
+import json
+import os
+import socket
+import tempfile
+import threading
+import time
+from glob import glob
+
+from django.conf import settings
+
+from employee_management_backend.db.pool import (
+    get_connection_slots,
+    get_pool_stats,
+)
+
+COUNTER = "counter"
+HISTOGRAM = "histogram"
+
+REQUEST_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+QUERY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.5, 1)
+TASK_BUCKETS = (0.01, 0.05, 0.1, 0.5, 1, 5, 10, 30, 60, 300, 900)
+
+ARCHIVE_NAME = "archive"
+
+
+def get_labels_key(labels):
+    return json.dumps(sorted((labels or {}).items()))
+
+
+class MetricsRegistry:
+    """Thread-safe counters and histograms of the current process."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.definitions = {}
+        self.samples = {}
+        # Callables returning counter samples computed on demand.
+        self.collectors = []
+        self.pid = os.getpid()
+        self.flusher = None
+
+    def define(self, name, kind, description, buckets=None):
+        self.definitions[name] = {
+            "type": kind,
+            "help": description,
+            "buckets": list(buckets) if buckets else None,
+        }
+
+    def inc(self, name, labels=None, value=1):
+        key = get_labels_key(labels)
+        with self.lock:
+            self.check_process()
+            samples = self.samples.setdefault(name, {})
+            samples[key] = samples.get(key, 0) + value
+
+    def observe(self, name, value, labels=None):
+        buckets = self.definitions[name]["buckets"]
+        key = get_labels_key(labels)
+        with self.lock:
+            self.check_process()
+            samples = self.samples.setdefault(name, {})
+            if key not in samples:
+                # One count per bucket, then +Inf, the sum and the count.
+                samples[key] = [0] * (len(buckets) + 1) + [0.0, 0]
+            sample = samples[key]
+            sample[bisect.bisect_left(buckets, value)] += 1
+            sample[-2] += value
+            sample[-1] += 1
+
+    def check_process(self):
+        # A forked child starts with a copy of its parent's samples, which
+        # belong to the parent's file.
+        if self.pid != os.getpid():
+            self.pid = os.getpid()
+            self.samples = {}
+            self.flusher = None
+        if self.flusher is None and get_metrics_dir():
+            self.flusher = threading.Thread(
+                target=self.flush_periodically, daemon=True
+            )
+            self.flusher.start()
+
+    def snapshot(self):
+        with self.lock:
+            samples = json.loads(json.dumps(self.samples))
+        for collector in self.collectors:
+            samples.update(collector())
+        return samples
+
+    def flush(self):
+        directory = get_metrics_dir()
+        if directory:
+            write_snapshot(
+                get_process_file(directory, self.pid), self.snapshot()
+            )
+
+    def flush_periodically(self):
+        atexit.register(self.flush)
+        interval = getattr(settings, "METRICS_FLUSH_INTERVAL", 5)
+        while self.pid == os.getpid():
+            time.sleep(interval)
+            self.flush()
+
+    def collect(self):
+        """Return the samples of every process sharing the metrics dir."""
+        directory = get_metrics_dir()
+        if not directory:
+            return self.snapshot()
+        self.flush()
+        snapshots = []
+        for path in glob(os.path.join(directory, "*.json")):
+            snapshot = read_snapshot(path)
+            if snapshot:
+                snapshots.append(snapshot)
+        return merge_snapshots(snapshots)
+
+    def render(self, samples):
+        """Return samples in the Prometheus text exposition format."""
+        lines = []
+        for name, definition in sorted(self.definitions.items()):
+            lines.append("# HELP {} {}".format(name, definition["help"]))
+            lines.append("# TYPE {} {}".format(name, definition["type"]))
+            for key, value in sorted(samples.get(name, {}).items()):
+                labels = dict(json.loads(key))
+                if definition["type"] == COUNTER:
+                    lines.append(format_sample(name, labels, value))
+                    continue
+                bounds = definition["buckets"] + ["+Inf"]
+                cumulative = 0
+                for bound, count in zip(bounds, value):
+                    cumulative += count
+                    lines.append(
+                        format_sample(
+                            name + "_bucket",
+                            dict(labels, le=str(bound)),
+                            cumulative,
+                        )
+                    )
+                lines.append(format_sample(name + "_sum", labels, value[-2]))
+                lines.append(format_sample(name + "_count", labels, value[-1]))
+        return "\n".join(lines) + "\n"
+
+
+def format_gauge(name, description, values):
+    lines = [
+        "# HELP {} {}".format(name, description),
+        "# TYPE {} gauge".format(name),
+    ]
+    for labels, value in values:
+        lines.append(format_sample(name, labels, value))
+    return "\n".join(lines) + "\n"
+
+
+def format_sample(name, labels, value):
+    if labels:
+        name += "{%s}" % ",".join(
+            '{}="{}"'.format(
+                label,
+                str(label_value).replace("\\", r"\\").replace('"', r"\""),
+            )
+            for label, label_value in sorted(labels.items())
+        )
+    return "{} {}".format(name, value)
+
+
+def merge_snapshots(snapshots):
+    merged = {}
+    for snapshot in snapshots:
+        for name, samples in snapshot.items():
+            merged_samples = merged.setdefault(name, {})
+            for key, value in samples.items():
+                if key not in merged_samples:
+                    merged_samples[key] = value
+                elif isinstance(value, list):
+                    merged_samples[key] = [
+                        total + count
+                        for total, count in zip(merged_samples[key], value)
+                    ]
+                else:
+                    merged_samples[key] += value
+    return merged
+
+
+def get_metrics_dir():
+    return getattr(settings, "METRICS_DIR", None)
+
+
+def get_process_file(directory, pid, hostname=None):
+    return os.path.join(
+        directory, "{}-{}.json".format(hostname or socket.gethostname(), pid)
+    )
+
+
+def read_snapshot(path):
+    try:
+        with open(path) as snapshot_file:
+            return json.load(snapshot_file)
+    except (IOError, OSError, ValueError):
+        return None
+
+
+def write_snapshot(path, snapshot):
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    # Write then rename so that a scrape never reads a partial file.
+    fd, temporary_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    with os.fdopen(fd, "w") as snapshot_file:
+        json.dump(snapshot, snapshot_file)
+    os.replace(temporary_path, path)
+
+
+def archive_process_file(pid):
+    """
+    Fold the file of an exited process into this host's archive file.
+
+    Called by the gunicorn master when a worker exits, so that recycled
+    workers do not leave a file each behind.
+    """
+    directory = get_metrics_dir()
+    if not directory:
+        return
+    path = get_process_file(directory, pid)
+    snapshot = read_snapshot(path)
+    if snapshot is None:
+        return
+    archive_path = get_process_file(directory, ARCHIVE_NAME)
+    archive = read_snapshot(archive_path) or {}
+    write_snapshot(archive_path, merge_snapshots([archive, snapshot]))
+    os.remove(path)
+
+
+registry = MetricsRegistry()
+registry.define(
+    "http_request_duration_seconds",
+    HISTOGRAM,
+    "Time spent handling requests, by route.",
+    REQUEST_BUCKETS,
+)
+registry.define(
+    "db_query_duration_seconds",
+    HISTOGRAM,
+    "Time spent executing database queries during requests.",
+    QUERY_BUCKETS,
+)
+registry.define(
+    "cache_requests_total", COUNTER, "Cache lookups, by result (hit or miss)."
+)
+registry.define(
+    "celery_task_duration_seconds",
+    HISTOGRAM,
+    "Time spent running Celery tasks, by task and state.",
+    TASK_BUCKETS,
+)
+registry.define(
+    "http_response_compression_seconds",
+    HISTOGRAM,
+    "Time spent compressing responses, by encoding.",
+    QUERY_BUCKETS,
+)
+registry.define(
+    "http_response_compression_bytes_total",
+    COUNTER,
+    "Bytes of the compressed responses, by encoding, before and after "
+    "compression.",
+)
+
+
+POOL_COUNTERS = {
+    "acquired": "db_pool_acquired_total",
+    "waits": "db_pool_waits_total",
+    "timeouts": "db_pool_timeouts_total",
+    "health_check_failures": "db_pool_health_check_failures_total",
+}
+registry.define(
+    "db_pool_acquired_total", COUNTER, "Connection slots acquired, by pool."
+)
+registry.define(
+    "db_pool_waits_total",
+    COUNTER,
+    "Connections that waited for a free slot, by pool.",
+)
+registry.define(
+    "db_pool_timeouts_total",
+    COUNTER,
+    "Connections refused after waiting for a slot, by pool.",
+)
+registry.define(
+    "db_pool_health_check_failures_total",
+    COUNTER,
+    "Persistent connections replaced after failing a health check.",
+)
+
+
+def collect_pool_counters():
+    samples = {}
+    for directory, stats in get_pool_stats().items():
+        key = get_labels_key({"pool": directory})
+        for stat, name in POOL_COUNTERS.items():
+            samples.setdefault(name, {})[key] = stats[stat]
+    return samples
+
+
+registry.collectors.append(collect_pool_counters)
+
+
+def render_metrics():
+    """Return the metrics of every process, with the derived gauges."""
+    samples = registry.collect()
+    output = registry.render(samples)
+
+    cache = samples.get("cache_requests_total", {})
+    hits = cache.get(get_labels_key({"result": "hit"}), 0)
+    misses = cache.get(get_labels_key({"result": "miss"}), 0)
+    if hits or misses:
+        output += format_gauge(
+            "cache_hit_ratio",
+            "Share of cache lookups that were hits.",
+            [({}, round(hits / (hits + misses), 4))],
+        )
+
+    pools = []
+    for database in settings.DATABASES.values():
+        pool = database.get("CONNECTION_POOL")
+        if pool:
+            slots = get_connection_slots(
+                pool["SLOTS_DIR"], pool["MAX_CONNECTIONS"]
+            )
+            pools.append(({"pool": pool["SLOTS_DIR"]}, slots.in_use()))
+    if pools:
+        output += format_gauge(
+            "db_pool_slots_in_use",
+            "Database connection slots held by the processes of the host.",
+            pools,
+        )
+    return output
+
+
+def observe_request(route, method, status, seconds):
+    registry.observe(
+        "http_request_duration_seconds",
+        seconds,
+        {"route": route, "method": method, "status": status},
+    )
+
+
+def observe_query(seconds):
+    registry.observe("db_query_duration_seconds", seconds)
+
+
+def count_cache_access(hits, misses):
+    if hits:
+        registry.inc("cache_requests_total", {"result": "hit"}, hits)
+    if misses:
+        registry.inc("cache_requests_total", {"result": "miss"}, misses)
+
+
+def observe_compression(encoding, seconds, size, compressed_size):
+    registry.observe(
+        "http_response_compression_seconds", seconds, {"encoding": encoding}
+    )
+    registry.inc(
+        "http_response_compression_bytes_total",
+        {"encoding": encoding, "stage": "uncompressed"},
+        size,
+    )
+    registry.inc(
+        "http_response_compression_bytes_total",
+        {"encoding": encoding, "stage": "compressed"},
+        compressed_size,
+    )
+
+
+def observe_task(task, state, seconds):
+    registry.observe(
+        "celery_task_duration_seconds", seconds, {"task": task, "state": state}
+    )
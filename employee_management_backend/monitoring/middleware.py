@@ -0,0 +1,128 @@
+import logging
+import random
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.db import connections
+
+from employee_management_backend.monitoring.instrumentation import (
+    RequestMetrics,
+    activate,
+    deactivate,
+    get_current_metrics,
+)
+from employee_management_backend.monitoring.metrics import observe_request
+from employee_management_backend.monitoring.slow_queries import get_threshold
+
+logger = logging.getLogger(__name__)
+
+
+class RequestInstrumentationMiddleware:
+    """
+    Measure every request and report a sample of them.
+
+    Query count, database time, cache hits and misses and the time spent in
+    named steps such as serialization are always collected, which costs a few
+    counter updates per query. For the sampled requests they are logged as
+    structured fields, under the request_metrics key of the log record, and
+    returned to the client in a Server-Timing header.
+
+    Sampling is configured with the REQUEST_INSTRUMENTATION setting:
+
+    * SAMPLE_RATE: fraction of requests reported.
+    * VIEW_SAMPLE_RATES: rates overriding SAMPLE_RATE, keyed by view name
+      such as "companies:teams-list".
+    * SERVER_TIMING: whether sampled responses get a Server-Timing header.
+
+    Queries slower than the THRESHOLD of the SLOW_QUERIES setting are
+    captured, see monitoring.slow_queries.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        config = getattr(settings, "REQUEST_INSTRUMENTATION", {})
+        self.sample_rate = config.get("SAMPLE_RATE", 1.0)
+        self.view_sample_rates = config.get("VIEW_SAMPLE_RATES", {})
+        self.server_timing = config.get("SERVER_TIMING", True)
+        self.slow_query_threshold = get_threshold()
+
+    def __call__(self, request):
+        metrics = RequestMetrics(self.slow_query_threshold)
+        activate(metrics)
+        try:
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(
+                        connection.execute_wrapper(metrics.record_query)
+                    )
+                response = self.get_response(request)
+        finally:
+            deactivate()
+        metrics.finish()
+        observe_request(
+            self.get_route(request),
+            request.method,
+            response.status_code,
+            metrics.duration,
+        )
+
+        view_name = self.get_view_name(request)
+        if self.is_sampled(view_name):
+            self.report(request, response, view_name, metrics)
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        # Lets slow queries be attributed to the view running them.
+        metrics = get_current_metrics()
+        if metrics is not None:
+            metrics.view_name = self.get_view_name(request)
+
+    def get_view_name(self, request):
+        resolver_match = getattr(request, "resolver_match", None)
+        return resolver_match.view_name if resolver_match else None
+
+    def get_route(self, request):
+        resolver_match = getattr(request, "resolver_match", None)
+        if resolver_match is None or not resolver_match.url_name:
+            # Unmatched paths would each add a new label value.
+            return "unmatched"
+        return resolver_match.url_name
+
+    def is_sampled(self, view_name):
+        rate = self.view_sample_rates.get(view_name, self.sample_rate)
+        return rate >= 1 or random.random() < rate
+
+    def report(self, request, response, view_name, metrics):
+        fields = dict(
+            metrics.as_dict(),
+            method=request.method,
+            path=request.path,
+            view=view_name,
+            status=response.status_code,
+        )
+        logger.info(
+            "%s %s %s %sms %s queries %sms db",
+            request.method,
+            request.path,
+            response.status_code,
+            fields["duration_ms"],
+            fields["query_count"],
+            fields["db_ms"],
+            extra={"request_metrics": fields},
+        )
+        if self.server_timing:
+            response["Server-Timing"] = self.get_server_timing(metrics)
+
+    def get_server_timing(self, metrics):
+        entries = [
+            'db;dur={:.2f};desc="{} queries"'.format(
+                metrics.db_time * 1000, metrics.query_count
+            ),
+            'cache;desc="{} hits, {} misses"'.format(
+                metrics.cache_hits, metrics.cache_misses
+            ),
+        ]
+        for name, seconds in sorted(metrics.timers.items()):
+            entries.append("{};dur={:.2f}".format(name, seconds * 1000))
+        entries.append("total;dur={:.2f}".format(metrics.duration * 1000))
+        return ", ".join(entries)
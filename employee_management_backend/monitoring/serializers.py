@@ -0,0 +1,16 @@
+from employee_management_backend.formats.serializers import ModelSerializer
+from employee_management_backend.monitoring.instrumentation import timer
+
+
+class TimedSerializerMixin:
+    """Count the time spent serializing into the "serializer" timer."""
+
+    def to_representation(self, instance):
+        # Nested serializers are covered by the timer of their parent, and
+        # the items of a list each by their own.
+        with timer("serializer"):
+            return super().to_representation(instance)
+
+
+class InstrumentedModelSerializer(TimedSerializerMixin, ModelSerializer):
+    pass
@@ -0,0 +1,141 @@
+"""
+Capture of slow database queries.
+
+Queries run while handling a request that take longer than the THRESHOLD of
+the SLOW_QUERIES setting are stored with their SQL and the view they came
+from in a ring buffer of BUFFER_SIZE entries kept in the cache, so that every
+process of the deployment writes to and reads from the same buffer. The
+oldest entries are overwritten first.
+
+The parameters of the queries, which may hold personal data, are only stored
+when CAPTURE_PARAMS is set. So are the query plans: on PostgreSQL a sample of
+the slow SELECT queries, EXPLAIN_SAMPLE_RATE of them, is then run again under
+EXPLAIN (ANALYZE, BUFFERS), whose output shows the parameters, and the plan
+is stored with the entry. Other statements are never explained since ANALYZE
+executes them.
+
+Entries are listed on the slow queries admin page and by the slow_queries
+management command.
+"""
+import logging
+import random
+
+from django.conf import settings
+from django.core.cache import caches
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+INDEX_KEY = "slow-queries:index"
+ENTRY_KEY = "slow-queries:{}"
+# Entries are kept for a week at most.
+ENTRY_TIMEOUT = 7 * 24 * 60 * 60
+MAX_PARAMS_LENGTH = 1000
+
+
+def get_config():
+    config = {
+        "THRESHOLD": 0.5,
+        "EXPLAIN_SAMPLE_RATE": 0.1,
+        "BUFFER_SIZE": 100,
+        "CACHE": "default",
+        "CAPTURE_PARAMS": False,
+    }
+    config.update(getattr(settings, "SLOW_QUERIES", {}))
+    return config
+
+
+def get_threshold():
+    return get_config()["THRESHOLD"]
+
+
+def get_cache():
+    return caches[get_config()["CACHE"]]
+
+
+def explain(connection, sql, params):
+    """Return the EXPLAIN (ANALYZE, BUFFERS) output of a query, or None."""
+    if connection.vendor != "postgresql":
+        return None
+    if not sql.lstrip()[:6].upper() == "SELECT":
+        return None
+    if connection.connection is None or connection.needs_rollback:
+        return None
+    # The raw DB-API cursor does not go through the execution wrappers, so
+    # the EXPLAIN is neither timed nor captured itself. It runs in a
+    # savepoint when in a transaction so that a failure does not abort it.
+    savepoint = connection.in_atomic_block
+    with connection.connection.cursor() as cursor:
+        try:
+            if savepoint:
+                cursor.execute("SAVEPOINT slow_query_explain")
+            cursor.execute("EXPLAIN (ANALYZE, BUFFERS) " + sql, params)
+            plan = "\n".join(row[0] for row in cursor.fetchall())
+        except connection.Database.Error:
+            logger.warning("Could not explain slow query", exc_info=True)
+            if savepoint:
+                cursor.execute("ROLLBACK TO SAVEPOINT slow_query_explain")
+            return None
+        if savepoint:
+            cursor.execute("RELEASE SAVEPOINT slow_query_explain")
+        return plan
+
+
+def capture(connection, sql, params, duration, view_name=None):
+    """Store a slow query in the ring buffer."""
+    config = get_config()
+    plan = None
+    if (
+        config["CAPTURE_PARAMS"]
+        and random.random() < config["EXPLAIN_SAMPLE_RATE"]
+    ):
+        plan = explain(connection, sql, params)
+
+    logger.warning(
+        "Slow query (%.2fms) in %s: %s", duration * 1000, view_name, sql
+    )
+
+    cache = get_cache()
+    cache.add(INDEX_KEY, 0, timeout=None)
+    try:
+        index = cache.incr(INDEX_KEY)
+    except ValueError:
+        # The index was evicted right after being added.
+        return
+    if index is None:
+        # The cache is unreachable and errors are ignored.
+        return
+    cache.set(
+        ENTRY_KEY.format(index % config["BUFFER_SIZE"]),
+        {
+            "index": index,
+            "captured": timezone.now().isoformat(),
+            "database": connection.alias,
+            "view": view_name,
+            "duration_ms": round(duration * 1000, 2),
+            "sql": sql,
+            "params": (
+                repr(params)[:MAX_PARAMS_LENGTH]
+                if config["CAPTURE_PARAMS"]
+                else None
+            ),
+            "explain": plan,
+        },
+        timeout=ENTRY_TIMEOUT,
+    )
+
+
+def get_entry_keys():
+    return [
+        ENTRY_KEY.format(slot) for slot in range(get_config()["BUFFER_SIZE"])
+    ]
+
+
+def get_slow_queries():
+    """Return the buffered slow queries, the most recent first."""
+    entries = get_cache().get_many(get_entry_keys()).values()
+    return sorted(entries, key=lambda entry: entry["index"], reverse=True)
+
+
+def clear_slow_queries():
+    get_cache().delete_many(get_entry_keys() + [INDEX_KEY])
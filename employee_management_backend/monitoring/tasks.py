@@ -0,0 +1,61 @@
+import time
+
+from django.core.cache import caches
+from django.core.mail import mail_admins
+
+from employee_management_backend.monitoring.logs import get_digest_config
+from employee_management_backend.taskapp.celery import app
+
+SENT_KEY = "error-digest:sent:{}"
+RATE_KEY = "error-digest:hour:{}"
+
+
+def format_digest(entries):
+    sections = []
+    for entry in sorted(entries, key=lambda entry: -entry["count"]):
+        section = (
+            "{count} x {level} in {logger}, first at {first_seen}, last at "
+            "{last_seen}:\n{message}".format(**entry)
+        )
+        if entry["exception"]:
+            section += "\n\n" + entry["exception"]
+        sections.append(section)
+    return "\n\n{}\n\n".format("-" * 70).join(sections)
+
+
+@app.task
+def send_error_digest(entries):
+    """
+    Mail the admins the errors of a digest they have not been told about.
+
+    Return the number of errors mailed.
+    """
+    config = get_digest_config()
+    cache = caches[config["CACHE"]]
+    entries = [
+        entry
+        for entry in entries
+        if cache.add(
+            SENT_KEY.format(entry["fingerprint"]),
+            True,
+            timeout=config["DEDUPLICATE_FOR"],
+        )
+    ]
+    if not entries:
+        return 0
+
+    rate_key = RATE_KEY.format(int(time.time()) // 3600)
+    cache.add(rate_key, 0, timeout=60 * 60)
+    try:
+        sent = cache.incr(rate_key)
+    except ValueError:
+        sent = 1
+    if sent > config["MAX_PER_HOUR"]:
+        return 0
+
+    mail_admins(
+        "{} new error{}".format(len(entries), "s" if len(entries) > 1 else ""),
+        format_digest(entries),
+        fail_silently=True,
+    )
+    return len(entries)
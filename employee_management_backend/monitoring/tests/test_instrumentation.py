@@ -0,0 +1,72 @@
+from employee_management_backend.monitoring.cache import (
+    InstrumentedLocMemCache,
+)
+from employee_management_backend.monitoring.instrumentation import (
+    RequestMetrics,
+    activate,
+    deactivate,
+    timer,
+)
+
+
+def make_cache():
+    return InstrumentedLocMemCache("instrumentation-test", {})
+
+
+class TestTimer:
+    def test_accumulates_time(self):
+        metrics = RequestMetrics()
+        activate(metrics)
+        try:
+            with timer("serializer"):
+                pass
+            with timer("serializer"):
+                pass
+        finally:
+            deactivate()
+
+        assert list(metrics.timers) == ["serializer"]
+        assert metrics.timers["serializer"] > 0
+
+    def test_nested_blocks_are_counted_once(self, monkeypatch):
+        metrics = RequestMetrics()
+        clock = iter([1.0, 10.0, 20.0])
+        monkeypatch.setattr(
+            "employee_management_backend.monitoring.instrumentation.time."
+            "perf_counter",
+            lambda: next(clock),
+        )
+        activate(metrics)
+        try:
+            with timer("serializer"):
+                with timer("serializer"):
+                    pass
+        finally:
+            deactivate()
+
+        assert metrics.timers == {"serializer": 9.0}
+
+    def test_without_active_request(self):
+        with timer("serializer"):
+            pass
+
+
+class TestInstrumentedCache:
+    def test_counts_hits_and_misses(self):
+        cache = make_cache()
+        cache.set("present", None)
+        metrics = RequestMetrics()
+        activate(metrics)
+        try:
+            assert cache.get("present", "default") is None
+            assert cache.get("absent", "default") == "default"
+            cache.set("other", 1)
+            assert cache.get_many(["present", "other", "absent"]) == {
+                "other": 1
+            }
+        finally:
+            deactivate()
+
+        # LocMemCache.get_many() skips keys holding None.
+        assert metrics.cache_hits == 2
+        assert metrics.cache_misses == 3
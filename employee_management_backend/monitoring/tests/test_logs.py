@@ -0,0 +1,181 @@
+import json
+import logging
+import sys
+import threading
+from unittest import mock
+
+import pytest
+from django.core import mail
+from django.core.cache import cache
+
+from employee_management_backend.monitoring import tasks
+from employee_management_backend.monitoring.logs import (
+    BackgroundHandler,
+    ErrorDigestHandler,
+    JSONFormatter,
+    LogPipeline,
+)
+
+
+class ListHandler(logging.Handler):
+    def __init__(self, level=logging.NOTSET):
+        super().__init__(level)
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+def make_record(message="Failed %s", args=("twice",), level=logging.ERROR):
+    try:
+        raise ValueError("broken")
+    except ValueError:
+        exc_info = sys.exc_info()
+    return logging.LogRecord(
+        "employee_management_backend.tests",
+        level,
+        __file__,
+        42,
+        message,
+        args,
+        exc_info,
+    )
+
+
+@pytest.fixture(autouse=True)
+def error_digest(settings):
+    settings.ERROR_DIGEST = {
+        "INTERVAL": 60,
+        "DEDUPLICATE_FOR": 60,
+        "MAX_PER_HOUR": 2,
+        "CACHE": "default",
+    }
+    settings.ADMINS = [("Admin", "admin@example.com")]
+    cache.clear()
+    yield
+    cache.clear()
+
+
+class TestBackgroundHandler:
+    def test_handles_records_in_the_background(self):
+        target = ListHandler(logging.WARNING)
+        pipeline = LogPipeline()
+        handler = BackgroundHandler([target], pipeline=pipeline)
+        request = mock.Mock(method="GET", path="/api/v2/")
+
+        for level in [logging.INFO, logging.ERROR]:
+            record = make_record(level=level)
+            record.request = request
+            handler.handle(record)
+        pipeline.stop()
+
+        assert pipeline.thread.name == "log-pipeline"
+        assert not pipeline.thread.is_alive()
+        [record] = target.records
+        assert record.getMessage() == "Failed twice"
+        assert record.message_template == "Failed %s"
+        assert record.exc_info is None
+        assert record.exc_type == "ValueError"
+        assert "ValueError: broken" in record.exc_text
+        assert record.request == {"method": "GET", "path": "/api/v2/"}
+
+    def test_drops_records_when_full(self):
+        started, release = threading.Event(), threading.Event()
+
+        class BlockingHandler(ListHandler):
+            def emit(self, record):
+                super().emit(record)
+                started.set()
+                release.wait(5)
+
+        target = BlockingHandler()
+        pipeline = LogPipeline(maxsize=2)
+        handler = BackgroundHandler([target], pipeline=pipeline)
+
+        handler.handle(make_record())
+        started.wait(5)
+        for _ in range(9):
+            handler.handle(make_record())
+        release.set()
+        pipeline.stop()
+
+        assert len(target.records) == 4
+        assert target.records[-1].getMessage() == (
+            "Dropped 7 log records, the log queue was full."
+        )
+
+
+class TestJSONFormatter:
+    def test_format(self):
+        record = make_record()
+        record.status_code = 500
+        record.request = mock.Mock(method="POST", path="/api/v2/teams/")
+
+        fields = json.loads(JSONFormatter().format(record))
+
+        assert fields["level"] == "ERROR"
+        assert fields["logger"] == "employee_management_backend.tests"
+        assert fields["message"] == "Failed twice"
+        assert fields["timestamp"].endswith("Z")
+        assert "ValueError: broken" in fields["exception"]
+        assert fields["status_code"] == 500
+        assert fields["request"] == {
+            "method": "POST",
+            "path": "/api/v2/teams/",
+        }
+        assert "request_metrics" not in fields
+
+
+class TestErrorDigest:
+    def test_groups_errors(self):
+        handler = ErrorDigestHandler()
+        for args in [("once",), ("twice",)]:
+            handler.handle(make_record(args=args))
+        handler.handle(make_record(message="Other", args=()))
+
+        with mock.patch.object(
+            tasks.send_error_digest, "apply_async"
+        ) as apply_async:
+            handler.flush()
+            assert not apply_async.called
+            handler.flush(force=True)
+
+        [entries] = apply_async.call_args[1]["args"]
+        assert [(entry["message"], entry["count"]) for entry in entries] == [
+            ("Failed once", 2),
+            ("Other", 1),
+        ]
+        assert entries[0]["first_seen"] <= entries[0]["last_seen"]
+        assert "ValueError: broken" in entries[0]["exception"]
+        assert handler.entries == {}
+
+    def test_send_error_digest(self):
+        handler = ErrorDigestHandler()
+        handler.handle(make_record())
+        handler.handle(make_record(message="Other", args=()))
+        entries = list(handler.entries.values())
+
+        assert tasks.send_error_digest(entries) == 2
+        # Errors the admins have been told about are not sent again.
+        assert tasks.send_error_digest(entries) == 0
+        assert len(mail.outbox) == 1
+        assert mail.outbox[0].subject.endswith("2 new errors")
+        assert "1 x ERROR in employee_management_backend.tests" in (
+            mail.outbox[0].body
+        )
+
+    def test_send_error_digest_rate_limit(self):
+        for number in range(3):
+            entry = {
+                "fingerprint": str(number),
+                "logger": "employee_management_backend.tests",
+                "level": "ERROR",
+                "message": "Failed",
+                "exception": "",
+                "count": 1,
+                "first_seen": "2019-01-01T00:00:00",
+                "last_seen": "2019-01-01T00:00:00",
+            }
+            tasks.send_error_digest([entry])
+
+        assert len(mail.outbox) == 2
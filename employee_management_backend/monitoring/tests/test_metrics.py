@@ -0,0 +1,116 @@
+import json
+import os
+
+import pytest
+from django.urls import reverse
+
+from employee_management_backend.monitoring.metrics import (
+    COUNTER,
+    HISTOGRAM,
+    MetricsRegistry,
+    archive_process_file,
+    get_process_file,
+    write_snapshot,
+)
+from employee_management_backend.taskapp.celery import (
+    debug_task,
+    record_task_duration,
+    start_task_timer,
+)
+
+
+@pytest.fixture
+def metrics_registry() -> MetricsRegistry:
+    metrics_registry = MetricsRegistry()
+    metrics_registry.define("jobs_total", COUNTER, "Jobs.")
+    metrics_registry.define(
+        "job_duration_seconds", HISTOGRAM, "Job durations.", (0.1, 1)
+    )
+    return metrics_registry
+
+
+class TestMetricsRegistry:
+    def test_render(self, metrics_registry: MetricsRegistry):
+        metrics_registry.inc("jobs_total", {"queue": "default"})
+        metrics_registry.inc("jobs_total", {"queue": "default"}, 2)
+        for value in (0.05, 0.5, 5):
+            metrics_registry.observe(
+                "job_duration_seconds", value, {"queue": "default"}
+            )
+
+        lines = metrics_registry.render(metrics_registry.snapshot())
+
+        assert lines.splitlines() == [
+            "# HELP job_duration_seconds Job durations.",
+            "# TYPE job_duration_seconds histogram",
+            'job_duration_seconds_bucket{le="0.1",queue="default"} 1',
+            'job_duration_seconds_bucket{le="1",queue="default"} 2',
+            'job_duration_seconds_bucket{le="+Inf",queue="default"} 3',
+            'job_duration_seconds_sum{queue="default"} 5.55',
+            'job_duration_seconds_count{queue="default"} 3',
+            "# HELP jobs_total Jobs.",
+            "# TYPE jobs_total counter",
+            'jobs_total{queue="default"} 3',
+        ]
+
+    def test_collect_merges_processes(
+        self, settings, tmpdir, metrics_registry: MetricsRegistry
+    ):
+        other_process = MetricsRegistry()
+        other_process.definitions = metrics_registry.definitions
+        other_process.inc("jobs_total")
+        other_process.observe("job_duration_seconds", 0.5)
+        write_snapshot(
+            get_process_file(tmpdir.strpath, 1), other_process.snapshot()
+        )
+        metrics_registry.inc("jobs_total", value=2)
+        metrics_registry.observe("job_duration_seconds", 2)
+        settings.METRICS_DIR = tmpdir.strpath
+
+        samples = metrics_registry.collect()
+
+        assert samples["jobs_total"] == {"[]": 3}
+        assert samples["job_duration_seconds"] == {"[]": [0, 1, 1, 2.5, 2]}
+
+    def test_archive_process_file(self, settings, tmpdir):
+        settings.METRICS_DIR = tmpdir.strpath
+        for pid in (1, 2):
+            write_snapshot(
+                get_process_file(tmpdir.strpath, pid),
+                {"jobs_total": {"[]": 1}},
+            )
+
+        archive_process_file(1)
+        archive_process_file(2)
+
+        (archive,) = os.listdir(tmpdir.strpath)
+        with open(tmpdir.join(archive).strpath) as archive_file:
+            assert json.load(archive_file) == {"jobs_total": {"[]": 2}}
+
+
+@pytest.mark.django_db
+class TestMetricsView:
+    def test_reports_requests_and_tasks(self, client):
+        start_task_timer(task_id="task")
+        record_task_duration(task_id="task", task=debug_task, state="SUCCESS")
+
+        client.get(reverse("monitoring:metrics"))
+        response = client.get(reverse("monitoring:metrics"))
+
+        assert response.status_code == 200
+        body = response.content.decode()
+        assert (
+            'http_request_duration_seconds_count{method="GET",route="metrics"'
+            ',status="200"}' in body
+        )
+        assert "celery_task_duration_seconds_count{" in body
+
+    def test_token(self, settings, client):
+        settings.METRICS_AUTH_TOKEN = "secret"
+        url = reverse("monitoring:metrics")
+
+        assert client.get(url).status_code == 403
+        assert (
+            client.get(url, HTTP_AUTHORIZATION="Bearer secret").status_code
+            == 200
+        )
@@ -0,0 +1,68 @@
+import logging
+
+import pytest
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from organizations.models import Organization
+
+from employee_management_backend.companies.models import Team
+
+
+@pytest.fixture
+def api_client(user) -> APIClient:
+    client = APIClient()
+    client.force_authenticate(user=user)
+    return client
+
+
+@pytest.fixture
+def teams_url(user) -> str:
+    organization = Organization.objects.create(name="Instrumented")
+    organization.get_or_add_user(user)
+    Team.objects.create(name="Instrumented Team", organization=organization)
+    return "{}?organization_id={}".format(
+        reverse("companies:teams-list", args=["v1"]), organization.id
+    )
+
+
+@pytest.mark.django_db
+class TestRequestInstrumentationMiddleware:
+    def test_reports_sampled_requests(
+        self, settings, api_client, teams_url, caplog
+    ):
+        settings.REQUEST_INSTRUMENTATION = {"SAMPLE_RATE": 1.0}
+        caplog.set_level(
+            logging.INFO, logger="employee_management_backend.monitoring"
+        )
+
+        response = api_client.get(teams_url)
+
+        assert response.status_code == 200
+        server_timing = response["Server-Timing"]
+        assert server_timing.startswith("db;dur=")
+        assert "serializer;dur=" in server_timing
+        assert "total;dur=" in server_timing
+        (record,) = caplog.records
+        metrics = record.request_metrics
+        assert metrics["view"] == "companies:teams-list"
+        assert metrics["status"] == 200
+        assert metrics["query_count"] >= 1
+        assert metrics["db_ms"] <= metrics["duration_ms"]
+
+    def test_per_view_sample_rate(
+        self, settings, api_client, teams_url, caplog
+    ):
+        settings.REQUEST_INSTRUMENTATION = {
+            "SAMPLE_RATE": 1.0,
+            "VIEW_SAMPLE_RATES": {"companies:teams-list": 0},
+        }
+        caplog.set_level(
+            logging.INFO, logger="employee_management_backend.monitoring"
+        )
+
+        response = api_client.get(teams_url)
+
+        assert response.status_code == 200
+        assert not response.has_header("Server-Timing")
+        assert not caplog.records
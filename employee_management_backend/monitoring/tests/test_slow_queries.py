@@ -0,0 +1,102 @@
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from organizations.models import Organization
+
+from employee_management_backend.monitoring.slow_queries import (
+    capture,
+    clear_slow_queries,
+    get_slow_queries,
+)
+
+
+@pytest.fixture(autouse=True)
+def slow_queries(settings):
+    settings.SLOW_QUERIES = {
+        "THRESHOLD": 0,
+        "EXPLAIN_SAMPLE_RATE": 1,
+        "BUFFER_SIZE": 3,
+        "CACHE": "default",
+    }
+    clear_slow_queries()
+    yield
+    clear_slow_queries()
+
+
+@pytest.mark.django_db
+class TestSlowQueries:
+    def test_ring_buffer(self):
+        for number in range(5):
+            capture(connection, "SELECT %s", (number,), number)
+
+        slow_queries = get_slow_queries()
+
+        assert [entry["duration_ms"] for entry in slow_queries] == [
+            4000,
+            3000,
+            2000,
+        ]
+        assert slow_queries[0]["sql"] == "SELECT %s"
+        assert slow_queries[0]["params"] is None
+
+    def test_capture_params(self, settings):
+        settings.SLOW_QUERIES = dict(
+            settings.SLOW_QUERIES, CAPTURE_PARAMS=True
+        )
+
+        capture(connection, "SELECT %s", (1,), 1)
+
+        [slow_query] = get_slow_queries()
+        assert slow_query["params"] == "(1,)"
+        # Only PostgreSQL queries are explained.
+        assert slow_query["explain"] is None
+
+    def test_captures_request_queries(self, user):
+        organization = Organization.objects.create(name="Slow Organization")
+        organization.get_or_add_user(user)
+        client = APIClient()
+        client.force_authenticate(user=user)
+
+        response = client.get(
+            reverse("companies:organization-users-list", args=["v1"]),
+            {"organization_id": organization.id},
+        )
+
+        assert response.status_code == 200
+        slow_queries = get_slow_queries()
+        assert slow_queries
+        assert {entry["view"] for entry in slow_queries} == {
+            "companies:organization-users-list"
+        }
+
+    def test_admin_page(self, settings, client, admin_user):
+        # Keep the queries of the page itself out of the buffer.
+        settings.SLOW_QUERIES = dict(settings.SLOW_QUERIES, THRESHOLD=None)
+        capture(connection, "SELECT 1", None, 1)
+        url = reverse("monitoring:slow-queries")
+
+        assert client.get(url).status_code == 302
+
+        client.force_login(admin_user)
+        response = client.get(url)
+
+        assert response.status_code == 200
+        assert "SELECT 1" in response.content.decode()
+
+    def test_command(self):
+        capture(connection, "SELECT 1", None, 1.5)
+        out = StringIO()
+
+        call_command("slow_queries", stdout=out)
+
+        assert "1500.0ms" in out.getvalue()
+        assert "SELECT 1" in out.getvalue()
+
+        call_command("slow_queries", "--clear", stdout=out)
+
+        assert get_slow_queries() == []
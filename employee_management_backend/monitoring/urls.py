@@ -0,0 +1,13 @@
+from django.urls import path
+
+from employee_management_backend.monitoring import views
+
+app_name = "monitoring"
+urlpatterns = [
+    path("metrics/", views.metrics_view, name="metrics"),
+    path(
+        "monitoring/slow-queries/",
+        views.slow_queries_view,
+        name="slow-queries",
+    ),
+]
@@ -0,0 +1,43 @@
+from django.conf import settings
+from django.contrib import admin
+from django.contrib.admin.views.decorators import staff_member_required
+from django.http import HttpResponse, HttpResponseForbidden
+from django.shortcuts import render
+from django.utils.crypto import constant_time_compare
+
+from employee_management_backend.monitoring.metrics import render_metrics
+from employee_management_backend.monitoring.slow_queries import (
+    get_config,
+    get_slow_queries,
+)
+
+
+def metrics_view(request):
+    """
+    Scrape endpoint returning the metrics of every application process.
+
+    When METRICS_AUTH_TOKEN is set, scrapers must send it as a bearer token.
+    """
+    token = getattr(settings, "METRICS_AUTH_TOKEN", None)
+    if token and not constant_time_compare(
+        request.META.get("HTTP_AUTHORIZATION", ""), "Bearer " + token
+    ):
+        return HttpResponseForbidden()
+    return HttpResponse(
+        render_metrics(), content_type="text/plain; version=0.0.4"
+    )
+
+
+@staff_member_required
+def slow_queries_view(request):
+    """Admin page listing the captured slow queries."""
+    return render(
+        request,
+        "monitoring/slow_queries.html",
+        {
+            **admin.site.each_context(request),
+            "title": "Slow queries",
+            "config": get_config(),
+            "slow_queries": get_slow_queries(),
+        },
+    )
@@ -1,5 +1,8 @@
 import os
+import time
+
 from celery import Celery
+from celery.signals import task_postrun, task_prerun
 from django.apps import apps, AppConfig
 from django.conf import settings
 
@@ -30,6 +33,24 @@ class CeleryAppConfig(AppConfig):
         app.autodiscover_tasks(lambda: installed_apps, force=True)
 
 
+_task_started = {}
+
+
+@task_prerun.connect
+def start_task_timer(task_id=None, **kwargs):
+    _task_started[task_id] = time.perf_counter()
+
+
+@task_postrun.connect
+def record_task_duration(task_id=None, task=None, state=None, **kwargs):
+    started = _task_started.pop(task_id, None)
+    if started is None:
+        return
+    from employee_management_backend.monitoring.metrics import observe_task
+
+    observe_task(task.name, state or "UNKNOWN", time.perf_counter() - started)
+
+
 @app.task(bind=True)
 def debug_task(self):
     print(f"Request: {self.request!r}")  # pragma: no cover
@@ -1,9 +1,10 @@
-from rest_framework import serializers
-
+from employee_management_backend.monitoring.serializers import (
+    InstrumentedModelSerializer,
+)
 from employee_management_backend.users import models
 
 
-class ProfileSerializer(serializers.ModelSerializer):
+class ProfileSerializer(InstrumentedModelSerializer):
     class Meta:
         model = models.User
         fields = [
@@ -31,7 +32,7 @@ class ProfileSerializer(serializers.ModelSerializer):
         }
 
 
-class AddressSerializer(serializers.ModelSerializer):
+class AddressSerializer(InstrumentedModelSerializer):
     user_nested = ProfileSerializer(source="user", read_only=True)
 
     class Meta:
@@ -51,7 +52,7 @@ class AddressSerializer(serializers.ModelSerializer):
         extra_kwargs = {"user": {"write_only": True}}
 
 
-class SimpleAddressSerializer(serializers.ModelSerializer):
+class SimpleAddressSerializer(InstrumentedModelSerializer):
     class Meta:
         model = models.Address
         fields = [
@@ -67,7 +68,7 @@ class SimpleAddressSerializer(serializers.ModelSerializer):
         ]
 
 
-class SimpleUserSerializer(serializers.ModelSerializer):
+class SimpleUserSerializer(InstrumentedModelSerializer):
     class Meta:
         model = models.User
         fields = [
@@ -90,7 +91,7 @@ class SimpleUserSerializer(serializers.ModelSerializer):
         extra_kwargs = {"date_joined": {"read_only": True}}
 
 
-class UserSerializer(serializers.ModelSerializer):
+class UserSerializer(InstrumentedModelSerializer):
     address_nested = AddressSerializer(
         source="user_addresses", many=True, read_only=True
     )
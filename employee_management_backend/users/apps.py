@@ -7,7 +7,4 @@ class UsersAppConfig(AppConfig):
     verbose_name = "Users"
 
     def ready(self):
-        try:
-            import users.signals  # noqa F401
-        except ImportError:
-            pass
+        from employee_management_backend.users import signals  # noqa F401
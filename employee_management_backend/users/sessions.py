@@ -0,0 +1,55 @@
+"""
+Session engine keeping sessions in the cache, the database and the process.
+
+Sessions are written through to the database, for durability, and to the
+SESSION_CACHE_ALIAS cache, like Django's cached_db engine, which they are
+read from. On top of that, sessions read or written by a process are kept in
+that process for SESSION_LOCAL_CACHE_TIMEOUT seconds, so that requests
+authenticated with a session do not query the cache either.
+
+A session deleted by another process, on logout for example, remains valid in
+this process until its local copy expires, so the timeout must stay short.
+"""
+import copy
+
+from django.conf import settings
+from django.contrib.sessions.backends import cached_db
+
+from employee_management_backend.caching.tiered import LocalCache
+
+KEY_PREFIX = "employee_management_backend.users.sessions"
+
+local_sessions = LocalCache(settings.SESSION_LOCAL_CACHE_SIZE)
+
+
+class SessionStore(cached_db.SessionStore):
+    cache_key_prefix = KEY_PREFIX
+
+    def load(self):
+        data = local_sessions.get(self.cache_key)
+        if data is not None:
+            return copy.deepcopy(data)
+        data = super().load()
+        # Missing sessions are not kept, they are created next.
+        if self.session_key is not None:
+            self.set_local(data)
+        return data
+
+    def save(self, must_create=False):
+        super().save(must_create)
+        self.set_local(self._session)
+
+    def set_local(self, data):
+        local_sessions.set(
+            self.cache_key,
+            copy.deepcopy(data),
+            settings.SESSION_LOCAL_CACHE_TIMEOUT,
+        )
+
+    def delete(self, session_key=None):
+        if session_key is None:
+            if self.session_key is None:
+                return
+            session_key = self.session_key
+        local_sessions.delete(self.cache_key_prefix + session_key)
+        super().delete(session_key)
@@ -0,0 +1,20 @@
+from django.contrib.auth import get_user_model
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from employee_management_backend.users.utils import reset_user_list_generation
+
+User = get_user_model()
+
+
+@receiver(post_save, sender=User)
+def handle_user_save(sender, instance, update_fields=None, **kwargs):
+    # Logging in only updates last_login, which the user list does not show.
+    if update_fields is not None and set(update_fields) == {"last_login"}:
+        return
+    reset_user_list_generation()
+
+
+@receiver(post_delete, sender=User)
+def handle_user_delete(sender, instance, **kwargs):
+    reset_user_list_generation()
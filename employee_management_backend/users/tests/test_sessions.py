@@ -0,0 +1,90 @@
+import pytest
+from django.contrib.sessions.models import Session
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from employee_management_backend.users.sessions import (
+    SessionStore,
+    local_sessions,
+)
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture(autouse=True)
+def clear_sessions():
+    local_sessions.clear()
+    cache.clear()
+    yield
+    local_sessions.clear()
+    cache.clear()
+
+
+def get_session_queries(queries):
+    return [
+        query for query in queries if Session._meta.db_table in query["sql"]
+    ]
+
+
+class TestSessionStore:
+    def test_load(self, django_assert_num_queries):
+        session = SessionStore()
+        session["answer"] = 42
+        session.save()
+        assert Session.objects.filter(session_key=session.session_key).exists()
+
+        with django_assert_num_queries(0):
+            assert SessionStore(session.session_key)["answer"] == 42
+        local_sessions.clear()
+        with django_assert_num_queries(0):
+            assert SessionStore(session.session_key)["answer"] == 42
+        local_sessions.clear()
+        cache.clear()
+        with django_assert_num_queries(1):
+            assert SessionStore(session.session_key)["answer"] == 42
+        # Loaded from the database, the session is kept in the process again.
+        with django_assert_num_queries(0):
+            assert SessionStore(session.session_key)["answer"] == 42
+
+    def test_local_copy_is_not_shared(self):
+        session = SessionStore()
+        session["teams"] = [1]
+        session.save()
+
+        SessionStore(session.session_key)["teams"].append(2)
+
+        assert SessionStore(session.session_key)["teams"] == [1]
+
+    def test_delete(self):
+        session = SessionStore()
+        session["answer"] = 42
+        session.save()
+        session_key = session.session_key
+
+        session.flush()
+
+        assert SessionStore(session_key).load() == {}
+        assert not Session.objects.filter(session_key=session_key).exists()
+
+    def test_disabled_local_cache(self, settings, django_assert_num_queries):
+        settings.SESSION_LOCAL_CACHE_TIMEOUT = 0
+        session = SessionStore()
+        session["answer"] = 42
+        session.save()
+        cache.clear()
+
+        with django_assert_num_queries(1):
+            assert SessionStore(session.session_key)["answer"] == 42
+
+    def test_session_authenticated_request(self, user):
+        client = APIClient()
+        client.force_login(user)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = client.get(reverse("api_users:user-list", args=["v2"]))
+
+        assert response.status_code == 200
+        assert get_session_queries(queries.captured_queries) == []
@@ -1,8 +1,13 @@
 import pytest
 from django.conf import settings
+from django.core.cache import cache
 from django.test import RequestFactory
+from django.urls import reverse
 
+from employee_management_backend.users.tests.factories import UserFactory
+from employee_management_backend.users.utils import get_user_list_generation
 from employee_management_backend.users.views import (
+    UserListView,
     UserRedirectView,
     UserUpdateView,
 )
@@ -53,3 +58,55 @@ class TestUserRedirectView:
         view.request = request
 
         assert view.get_redirect_url() == f"/users/{user.username}/"
+
+
+class TestUserListView:
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        cache.clear()
+        yield
+        cache.clear()
+
+    def get_usernames(self, response):
+        return [user.username for user in response.context["user_list"]]
+
+    def test_pages(self, client, user, monkeypatch):
+        monkeypatch.setattr(UserListView, "page_size", 2)
+        for username in ["c", "a", "b"]:
+            UserFactory(username=username)
+        client.force_login(user)
+
+        usernames = sorted(["a", "b", "c", user.username])
+        pages = []
+        after = ""
+        while after is not None:
+            response = client.get(reverse("users:list"), {"after": after})
+            assert response.status_code == 200
+            pages.append(self.get_usernames(response))
+            after = response.context["user_list"].next_after
+
+        assert pages == [usernames[:2], usernames[2:]]
+
+    def test_cached_page(self, client, user, django_assert_num_queries):
+        client.force_login(user)
+        client.get(reverse("users:list"))
+
+        # Only the session user is loaded once the page is cached, in the
+        # request's transaction.
+        with django_assert_num_queries(3):
+            response = client.get(reverse("users:list"))
+        assert user.username in response.content.decode()
+
+        UserFactory(username="zz-new")
+        response = client.get(reverse("users:list"))
+        assert "zz-new" in response.content.decode()
+
+    def test_login_keeps_cached_pages(self, client, user):
+        generation = get_user_list_generation()
+
+        client.force_login(user)
+
+        assert get_user_list_generation() == generation
+        user.name = "Renamed"
+        user.save()
+        assert get_user_list_generation() != generation
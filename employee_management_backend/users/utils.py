@@ -1,8 +1,11 @@
 from datetime import datetime
 import os
 import time
+import uuid
 import pytz
 
+from django.core.cache import cache
+
 
 def get_extension(filename):
     return os.path.splitext(filename)[1]
@@ -16,3 +19,22 @@ def user_avatar_path(instance, filename):
     new_filename = str(time.time()).replace(".", "_") + get_extension(filename)
 
     return "avatars/{0}/{1}".format(instance.username, new_filename)
+
+
+USER_LIST_GENERATION_KEY = "users:list:generation"
+
+
+def get_user_list_generation():
+    """
+    Return the generation of the user table, a token replaced whenever a user
+    is saved or deleted, that cached fragments of the user list are keyed by.
+    """
+    generation = cache.get(USER_LIST_GENERATION_KEY)
+    if generation is None:
+        cache.add(USER_LIST_GENERATION_KEY, uuid.uuid4().hex, timeout=None)
+        generation = cache.get(USER_LIST_GENERATION_KEY)
+    return generation
+
+
+def reset_user_list_generation():
+    cache.set(USER_LIST_GENERATION_KEY, uuid.uuid4().hex, timeout=None)
@@ -1,8 +1,11 @@
 from django.contrib.auth import get_user_model
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.urls import reverse
+from django.utils.functional import cached_property
 from django.views.generic import DetailView, ListView, RedirectView, UpdateView
 
+from employee_management_backend.users.utils import get_user_list_generation
+
 User = get_user_model()
 
 
@@ -16,11 +19,65 @@ class UserDetailView(LoginRequiredMixin, DetailView):
 user_detail_view = UserDetailView.as_view()
 
 
+class UserPage:
+    """
+    The users following a username, in username order.
+
+    Users are only queried when the page is rendered, which it is not when
+    the user list template has it cached.
+    """
+
+    def __init__(self, queryset, after, size):
+        self.queryset = queryset
+        self.after = after
+        self.size = size
+
+    @cached_property
+    def users(self):
+        queryset = self.queryset
+        if self.after:
+            queryset = queryset.filter(username__gt=self.after)
+        # One more user tells whether there is a next page.
+        return list(queryset[: self.size + 1])
+
+    def __iter__(self):
+        return iter(self.users[: self.size])
+
+    @property
+    def next_after(self):
+        if len(self.users) > self.size:
+            return self.users[self.size - 1].username
+        return None
+
+
 class UserListView(LoginRequiredMixin, ListView):
+    """
+    Users by username, page_size at a time.
+
+    Pages are keyed by the last username of the previous page, the after get
+    parameter, rather than numbered, so that a page costs the same whatever
+    its position. Rendered pages are cached until a user is saved or deleted.
+    """
 
     model = User
     slug_field = "username"
     slug_url_kwarg = "username"
+    context_object_name = "user_list"
+    page_size = 50
+    cache_timeout = 60 * 60
+
+    def get_queryset(self):
+        return User.objects.only("id", "username").order_by("username")
+
+    def get_context_data(self, **kwargs):
+        after = self.request.GET.get("after", "")
+        return super().get_context_data(
+            object_list=UserPage(self.object_list, after, self.page_size),
+            after=after,
+            generation=get_user_list_generation(),
+            cache_timeout=self.cache_timeout,
+            **kwargs
+        )
 
 
 user_list_view = UserListView.as_view()